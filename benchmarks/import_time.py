@@ -0,0 +1,68 @@
+"""
+Start-up cost of a short-lived hook script.
+
+    python benchmarks/import_time.py --runs 20
+
+Times fresh interpreters that import the client and send one set_dial_value
+against the local simulator, with the default requests path and with the
+stdlib-only StdlibTransport, and reports the import cost of each module.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from vudials_client.simulator import VU1Simulator
+
+SCRIPTS = {
+    'import only': 'from vudials_client import vudialsclient',
+    'requests call': (
+        'from vudials_client.vudialsclient import VUDial\n'
+        'VUDial({host!r}, {port}, {key!r}).set_dial_value("SIM0000", 1)'),
+    'stdlib call': (
+        'from vudials_client.vudialsclient import VUDial\n'
+        'from vudials_client.transport import StdlibTransport\n'
+        'VUDial({host!r}, {port}, {key!r}, transport=StdlibTransport()).set_dial_value("SIM0000", 1)'),
+}
+
+
+def wall_time(code: str, runs: int, env: dict) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], env=env, check=True)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def import_cost_us(module: str, env: dict) -> int:
+    """Cumulative microseconds reported by -X importtime for module."""
+    err = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                         env=env, capture_output=True, text=True, check=True).stderr
+    for line in err.splitlines():
+        fields = [f.strip() for f in line.split('|')]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1])
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+
+    for module in ('vudials_client.vudialsclient', 'vudials_client.transport', 'requests'):
+        print(f'{module:<32} import {import_cost_us(module, env) / 1000:7.1f} ms')
+    with VU1Simulator(dials=1) as sim:
+        baseline = wall_time('pass', args.runs, env)
+        print(f'{"bare interpreter":<32} {baseline * 1000:7.1f} ms')
+        for name, code in SCRIPTS.items():
+            t = wall_time(code.format(host=sim.address, port=sim.port, key=sim.api_key), args.runs, env)
+            print(f'{name:<32} {t * 1000:7.1f} ms (+{(t - baseline) * 1000:.1f} ms)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Throughput of ShardedDispatcher versus the number of worker processes.
+
+    python benchmarks/shard_scaling.py --servers 4 --dials 64 --requests 20000
+
+Starts the given number of simulator servers, each in its own process so the
+servers do not compete with the client for the GIL, then sends set_dial_value
+to every dial of every server through 1, 2, 4, ... worker processes and
+reports requests per second. Scaling stops at the machine's core count.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+from vudials_client.shard import ShardedDispatcher
+
+
+def start_server(dials: int, latency: float) -> tuple[subprocess.Popen, int]:
+    proc = subprocess.Popen([sys.executable, '-m', 'vudials_client.simulator', '--port', '0',
+                             '--dials', str(dials), '--latency', str(latency)],
+                            stdout=subprocess.PIPE, text=True)
+    # "VU1 simulator listening on http://127.0.0.1:PORT (...)"
+    url = proc.stdout.readline().split()[4]
+    return proc, int(url.rsplit(':', 1)[1])
+
+
+def run(servers: dict, uids: list[str], processes: int, threads: int, requests: int, batch: int) -> float:
+    with ShardedDispatcher(servers, processes=processes, threads=threads) as d:
+        d.submit('set_dial_value', uids[0], 0, server=next(iter(servers))).result()
+        names = list(servers)
+        start = time.perf_counter()
+        futures = []
+        for base in range(0, requests, batch):
+            for name in names:
+                calls = [('set_dial_value', uids[i % len(uids)], i % 101)
+                         for i in range(base, min(base + batch, requests), len(names))]
+                futures.extend(d.submit_many(calls, server=name))
+        for f in futures:
+            f.result()
+        elapsed = time.perf_counter() - start
+    return len(futures) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--servers', type=int, default=4)
+    parser.add_argument('--dials', type=int, default=64, help='dials per server')
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--batch', type=int, default=256)
+    parser.add_argument('--threads', type=int, default=4, help='sending threads per process')
+    parser.add_argument('--processes', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    procs = []
+    servers = {}
+    try:
+        for i in range(args.servers):
+            proc, port = start_server(args.dials, args.latency)
+            procs.append(proc)
+            servers[f'server{i}'] = {'server_address': '127.0.0.1', 'server_port': port,
+                                     'api_key': 'sim-api-key'}
+        uids = [f'SIM{i:04d}' for i in range(args.dials)]
+        print(f'{os.cpu_count()} CPUs, {args.servers} servers x {args.dials} dials')
+        print(f'{"processes":>10} {"req/s":>10}')
+        for n in args.processes:
+            print(f'{n:>10} {run(servers, uids, n, args.threads, args.requests, args.batch):>10.1f}')
+    finally:
+        for proc in procs:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Load/soak test: drive VUDial from several threads against the local simulator.
+
+    python benchmarks/soak.py --threads 8 --duration 30 --latency 0.005 --failure-rate 0.01
+
+Reports throughput, latency percentiles and error counts. Pass --server
+HOST:PORT --api-key KEY to target a real VU1 server instead.
+"""
+import argparse
+import random
+import statistics
+import threading
+import time
+
+from requests.exceptions import RequestException
+
+from vudials_client.simulator import VU1Simulator
+from vudials_client.vudialsclient import VUDial
+
+
+def worker(dial: VUDial, uids: list[str], deadline: float, latencies: list[float], errors: list[str]) -> None:
+    rng = random.Random()
+    while time.perf_counter() < deadline:
+        uid = rng.choice(uids)
+        start = time.perf_counter()
+        try:
+            if rng.random() < 0.8:
+                dial.set_dial_value(uid, rng.randint(0, 100))
+            else:
+                dial.get_dial_info(uid)
+            latencies.append(time.perf_counter() - start)
+        except RequestException as e:
+            errors.append(type(e).__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--dials', type=int, default=8)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--failure-rate', type=float, default=0.0)
+    parser.add_argument('--max-connections', type=int, default=None)
+    parser.add_argument('--server', help='HOST:PORT of a real server; skips the simulator')
+    parser.add_argument('--api-key')
+    args = parser.parse_args()
+
+    sim = None
+    if args.server:
+        host, port = args.server.rsplit(':', 1)
+        dial = VUDial(host, int(port), args.api_key)
+    else:
+        sim = VU1Simulator(dials=args.dials, latency=args.latency, jitter=args.jitter,
+                           failure_rate=args.failure_rate, max_connections=args.max_connections).start()
+        dial = VUDial(sim.address, sim.port, sim.api_key)
+    uids = [d['uid'] for d in dial.list_dials().json()['data']]
+
+    latencies: list[float] = []
+    errors: list[str] = []
+    deadline = time.perf_counter() + args.duration
+    threads = [threading.Thread(target=worker, args=(dial, uids, deadline, latencies, errors))
+               for _ in range(args.threads)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if sim is not None:
+        sim.stop()
+
+    ok = len(latencies)
+    print(f'threads={args.threads} duration={args.duration}s ok={ok} errors={len(errors)} '
+          f'throughput={ok / args.duration:.1f} req/s')
+    if ok:
+        q = statistics.quantiles(latencies, n=100) if ok > 1 else latencies * 99
+        print(f'latency ms: p50={q[49] * 1000:.2f} p95={q[94] * 1000:.2f} p99={q[98] * 1000:.2f}')
+    if errors:
+        print('errors:', {e: errors.count(e) for e in set(errors)})
+
+
+if __name__ == '__main__':
+    main()
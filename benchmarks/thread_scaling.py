@@ -0,0 +1,46 @@
+"""
+Throughput of one shared VUDial versus the number of worker threads.
+
+    python benchmarks/thread_scaling.py --latency 0.002 --requests 2000
+
+Runs against the local simulator, whose latency stands in for the server's
+per-request work, and compares the pooled thread-safe mode (pool_size equal
+to the worker count) with unpooled requests.
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from vudials_client.simulator import VU1Simulator
+from vudials_client.vudialsclient import VUDial
+
+
+def run(sim: VU1Simulator, threads: int, requests: int, pooled: bool) -> float:
+    dial = VUDial(sim.address, sim.port, sim.api_key, pool_size=threads if pooled else None)
+    uids = list(sim.dials)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as ex:
+        list(ex.map(lambda i: dial.set_dial_value(uids[i % len(uids)], i % 101), range(requests)))
+    elapsed = time.perf_counter() - start
+    dial.close()
+    return requests / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--latency', type=float, default=0.002)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--dials', type=int, default=16)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    with VU1Simulator(dials=args.dials, latency=args.latency) as sim:
+        print(f'{"threads":>8} {"pooled req/s":>14} {"unpooled req/s":>16}')
+        for n in args.threads:
+            pooled = run(sim, n, args.requests, pooled=True)
+            unpooled = run(sim, n, args.requests, pooled=False)
+            print(f'{n:>8} {pooled:>14.1f} {unpooled:>16.1f}')
+
+
+if __name__ == '__main__':
+    main()
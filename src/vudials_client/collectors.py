@@ -0,0 +1,342 @@
+import argparse
+import configparser
+import importlib
+import logging
+import os
+import threading
+import time
+
+from .vudialsclient import VUDial, response_data
+
+LOGGER = logging.getLogger(__name__)
+
+
+class _ProcFile:
+    """A /proc or /sys file kept open and re-read from offset 0 with one pread."""
+
+    def __init__(self, path: str, size: int = 4096):
+        self.path = path
+        self.size = size
+        self.fd = os.open(path, os.O_RDONLY)
+
+    def read(self) -> bytes:
+        return os.pread(self.fd, self.size, 0)
+
+    def read_int(self) -> int:
+        return int(self.read())
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class Collector:
+    """
+    A metric source. read() returns the current value as a percentage (0-100).
+
+    Subclasses open their files once in __init__ and keep whatever state they
+    need to compute deltas between calls.
+    """
+
+    def __init__(self):
+        self._files: list[_ProcFile] = []
+
+    def _open(self, path: str, size: int = 4096) -> _ProcFile:
+        f = _ProcFile(path, size)
+        self._files.append(f)
+        return f
+
+    def read(self) -> float:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        for f in self._files:
+            f.close()
+
+
+def _clamp(value: float) -> float:
+    return min(100.0, max(0.0, value))
+
+
+class CPUCollector(Collector):
+    def __init__(self, path: str = '/proc/stat'):
+        """
+        Overall CPU utilisation since the previous read.
+
+        :param path: str, the stat file.
+        """
+        super().__init__()
+        self._stat = self._open(path, 256)
+        self._last = self._sample()
+
+    def _sample(self) -> tuple[int, int]:
+        data = self._stat.read()
+        fields = data[:data.index(b'\n')].split()[1:9]
+        ticks = [int(x) for x in fields]
+        # idle + iowait; guest time is already counted in user.
+        return sum(ticks), ticks[3] + ticks[4]
+
+    def read(self) -> float:
+        total, idle = self._sample()
+        d_total = total - self._last[0]
+        d_idle = idle - self._last[1]
+        self._last = (total, idle)
+        if d_total <= 0:
+            return 0.0
+        return _clamp(100.0 * (d_total - d_idle) / d_total)
+
+
+class MemoryCollector(Collector):
+    def __init__(self, path: str = '/proc/meminfo'):
+        """
+        Memory in use, as MemTotal minus MemAvailable.
+
+        :param path: str, the meminfo file.
+        """
+        super().__init__()
+        # MemTotal, MemFree and MemAvailable are the first three lines.
+        self._meminfo = self._open(path, 256)
+
+    def read(self) -> float:
+        total = available = None
+        for line in self._meminfo.read().splitlines():
+            if line.startswith(b'MemTotal:'):
+                total = int(line.split()[1])
+            elif line.startswith(b'MemAvailable:'):
+                available = int(line.split()[1])
+                break
+        if not total or available is None:
+            return 0.0
+        return _clamp(100.0 * (total - available) / total)
+
+
+class DiskCollector(Collector):
+    def __init__(self, device: str = 'sda', path: str | None = None):
+        """
+        Share of wall time the block device was busy since the previous read.
+
+        :param device: str, the block device name, e.g. 'nvme0n1'.
+        :param path: str, the stat file; defaults to /sys/block/<device>/stat.
+        """
+        super().__init__()
+        self._stat = self._open(path or f'/sys/block/{device}/stat', 256)
+        self._last = self._sample()
+
+    def _sample(self) -> tuple[float, int]:
+        # Field 10 is io_ticks: milliseconds spent doing I/O.
+        return time.monotonic(), int(self._stat.read().split()[9])
+
+    def read(self) -> float:
+        now, ticks = self._sample()
+        elapsed = now - self._last[0]
+        d_ticks = ticks - self._last[1]
+        self._last = (now, ticks)
+        if elapsed <= 0:
+            return 0.0
+        return _clamp(d_ticks / (elapsed * 1000.0) * 100.0)
+
+
+class NetworkCollector(Collector):
+    def __init__(self, interface: str = 'eth0', max_rate: float | str = 125_000_000,
+                 direction: str = 'both', path: str | None = None):
+        """
+        Interface throughput as a percentage of max_rate.
+
+        :param interface: str, the network interface name.
+        :param max_rate: float, bytes per second shown as 100%.
+        :param direction: str, 'rx', 'tx' or 'both'.
+        :param path: str, the statistics directory; defaults to
+            /sys/class/net/<interface>/statistics.
+        """
+        super().__init__()
+        if direction not in ('rx', 'tx', 'both'):
+            raise ValueError(f"direction must be 'rx', 'tx' or 'both', got {direction!r}")
+        self.max_rate = float(max_rate)
+        if self.max_rate <= 0:
+            raise ValueError(f"max_rate must be positive, got {max_rate!r}")
+        base = path or f'/sys/class/net/{interface}/statistics'
+        names = ('rx', 'tx') if direction == 'both' else (direction,)
+        self._counters = [self._open(os.path.join(base, f'{n}_bytes'), 32) for n in names]
+        self._last = self._sample()
+
+    def _sample(self) -> tuple[float, int]:
+        return time.monotonic(), sum(f.read_int() for f in self._counters)
+
+    def read(self) -> float:
+        now, total = self._sample()
+        elapsed = now - self._last[0]
+        delta = total - self._last[1]
+        self._last = (now, total)
+        if elapsed <= 0:
+            return 0.0
+        return _clamp(delta / elapsed / self.max_rate * 100.0)
+
+
+SOURCES: dict[str, type[Collector]] = {
+    'cpu': CPUCollector,
+    'memory': MemoryCollector,
+    'disk': DiskCollector,
+    'network': NetworkCollector,
+}
+
+
+def register_source(name: str, cls: type[Collector]) -> None:
+    """
+    Make a collector class available to config files under a short name.
+
+    :param name: str, the name used as `source = <name>`.
+    :param cls: type[Collector], the collector class.
+    """
+    SOURCES[name] = cls
+
+
+def make_collector(source: str, **options: str) -> Collector:
+    """
+    Build a collector by registered name or by 'package.module:Class'.
+
+    :param source: str, the source name.
+    :param options: constructor arguments.
+    :return: Collector
+    """
+    cls = SOURCES.get(source)
+    if cls is None:
+        if ':' not in source:
+            raise ValueError(f"Unknown collector source: {source!r}")
+        module, _, attr = source.partition(':')
+        cls = getattr(importlib.import_module(module), attr)
+    return cls(**options)
+
+
+class CollectorRunner:
+    def __init__(self, client: VUDial, bindings: dict[str, Collector], interval: float = 1.0):
+        """
+        Periodically read collectors and push their values to dials.
+
+        A dial is only sent a new value when the rounded reading changed.
+
+        :param client: VUDial, the client used to set values.
+        :param bindings: dict[str, Collector], dial name (or uid) to collector.
+        :param interval: float, seconds between samples.
+        """
+        self.client = client
+        self.bindings = bindings
+        self.interval = interval
+        self._uids: dict[str, str] | None = None
+        self._last: dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def resolve(self) -> dict[str, str]:
+        """
+        Map each binding to a dial uid, matching dial names from list_dials.
+
+        Bindings that match no dial name are assumed to be uids.
+
+        :return: dict[str, str], binding to uid.
+        """
+        dials = response_data(self.client.list_dials()) or []
+        by_name = {d.get('dial_name'): d['uid'] for d in dials}
+        self._uids = {name: by_name.get(name, name) for name in self.bindings}
+        return self._uids
+
+    def run_once(self) -> dict[str, int]:
+        """
+        Sample every collector once and send the values that changed.
+
+        :return: dict[str, int], uid to value for each dial that was updated.
+        """
+        uids = self._uids if self._uids is not None else self.resolve()
+        sent = {}
+        for name, collector in self.bindings.items():
+            uid = uids[name]
+            try:
+                value = round(collector.read())
+                if self._last.get(uid) == value:
+                    continue
+                self.client.set_dial_value(uid, value)
+            except Exception as e:
+                LOGGER.warning('Updating dial %s from %s failed: %s', name, type(collector).__name__, e)
+                continue
+            self._last[uid] = value
+            sent[uid] = value
+        return sent
+
+    def run_forever(self) -> None:
+        """Sample on a fixed schedule until stop() is called."""
+        next_run = time.monotonic()
+        while not self._stop.is_set():
+            self.run_once()
+            next_run += self.interval
+            self._stop.wait(max(0.0, next_run - time.monotonic()))
+
+    def start(self) -> None:
+        """Run in a background thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name='vu1-collectors', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread and close the collectors."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for collector in self.bindings.values():
+            collector.close()
+
+
+def load_config(path: str) -> CollectorRunner:
+    """
+    Build a runner from an INI file.
+
+    The [vu1] section holds server (HOST:PORT), api_key and optionally
+    interval. Every other section is named after a dial and holds a `source`
+    plus the collector's constructor arguments::
+
+        [vu1]
+        server = localhost:5340
+        api_key = cTpAWYuRpA2zx75Yh961Cg
+        interval = 1
+
+        [CPU]
+        source = cpu
+
+        [Uplink]
+        source = network
+        interface = eth0
+        max_rate = 12500000
+
+    :param path: str, the config file.
+    :return: CollectorRunner
+    """
+    config = configparser.ConfigParser(default_section='')
+    with open(path) as f:
+        config.read_file(f)
+    server = config['vu1']
+    host, port = server['server'].rsplit(':', 1)
+    client = VUDial(host, int(port), server['api_key'])
+    bindings = {}
+    for name in config.sections():
+        if name == 'vu1':
+            continue
+        options = dict(config[name])
+        bindings[name] = make_collector(options.pop('source'), **options)
+    return CollectorRunner(client, bindings, server.getfloat('interval', 1.0))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description='Drive vu-dials from system metrics.')
+    parser.add_argument('config', help='INI file mapping dial names to sources')
+    args = parser.parse_args(argv)
+    runner = load_config(args.config)
+    try:
+        runner.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        runner.stop()
+
+
+if __name__ == '__main__':
+    main()
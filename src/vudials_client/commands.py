@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qsl, quote
+
+if TYPE_CHECKING:
+    from .recording import RecordedCommand
+
+# Accepted ranges, matching what the server validates.
+PERCENT = (0, 100)
+EASING_PERIOD = (0, 100000)
+EASING_STEP = (0, 100)
+
+_VALUE_PARAMS = tuple(f'&value={v}' for v in range(101))
+
+
+def value_params(value: int) -> str:
+    """
+    Query string for a dial value. Strings for 0-100 are prebuilt and shared.
+
+    :param value: int
+    :return: str
+    """
+    if 0 <= value <= 100:
+        return _VALUE_PARAMS[value]
+    return f'&value={value}'
+
+
+@lru_cache(maxsize=1024)
+def color_params(red: int, green: int, blue: int) -> str:
+    """
+    Query string for a backlight colour; repeated colours share one cached string.
+
+    :return: str
+    """
+    return f'&red={red}&green={green}&blue={blue}'
+
+
+@lru_cache(maxsize=256)
+def easing_params(period: int, step: int) -> str:
+    """
+    Query string for an easing setting; repeated presets share one cached string.
+
+    :return: str
+    """
+    return f'&period={period}&step={step}'
+
+
+def name_params(name: str) -> str:
+    """
+    Query string for a dial name, percent-encoded.
+
+    :param name: str
+    :return: str
+    """
+    return f'&name={quote(name, safe="")}'
+
+
+def _checked(field: str, value: Any, bounds: tuple[int, int]) -> int:
+    number = int(value)
+    low, high = bounds
+    if not low <= number <= high:
+        raise ValueError(f"{field} must be between {low} and {high}, got {value!r}")
+    return number
+
+
+class Command:
+    """
+    A validated dial command, serialized once at construction.
+
+    Send it with VUDial.send(command), queue it with
+    PriorityDispatcher.submit_command, or unpack as_call() anywhere a
+    (method, uid, *args) tuple is expected.
+    """
+
+    __slots__ = ('uid', 'args', 'params')
+    method = ''
+    action = ''
+
+    def __init__(self, uid: str, args: tuple, params: str):
+        self.uid = uid
+        self.args = args
+        self.params = params
+
+    def as_call(self) -> tuple:
+        return (self.method, self.uid, *self.args)
+
+    def __eq__(self, other: object) -> bool:
+        return type(other) is type(self) and other.uid == self.uid and other.args == self.args
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.uid, self.args))
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.uid!r}, {", ".join(map(repr, self.args))})'
+
+    def __reduce__(self):
+        return type(self), (self.uid, *self.args)
+
+
+class SetValue(Command):
+    __slots__ = ()
+    method = 'set_dial_value'
+    action = 'set'
+
+    def __init__(self, uid: str, value: int):
+        """
+        :param uid: str, the uid of the vu-dial.
+        :param value: int, the dial value (0-100).
+        """
+        value = _checked('value', value, PERCENT)
+        super().__init__(uid, (value,), _VALUE_PARAMS[value])
+
+
+class SetColor(Command):
+    __slots__ = ()
+    method = 'set_dial_color'
+    action = 'backlight'
+
+    def __init__(self, uid: str, red: int, green: int, blue: int):
+        """
+        :param uid: str, the uid of the vu-dial.
+        :param red: int, red channel (0-100).
+        :param green: int, green channel (0-100).
+        :param blue: int, blue channel (0-100).
+        """
+        rgb = (_checked('red', red, PERCENT), _checked('green', green, PERCENT), _checked('blue', blue, PERCENT))
+        super().__init__(uid, rgb, color_params(*rgb))
+
+
+class SetDialEasing(Command):
+    __slots__ = ()
+    method = 'set_dial_easing'
+    action = 'easing/dial'
+
+    def __init__(self, uid: str, period: int, step: int):
+        """
+        :param uid: str, the uid of the vu-dial.
+        :param period: int, easing period in ms (0-100000).
+        :param step: int, easing step (0-100).
+        """
+        args = (_checked('period', period, EASING_PERIOD), _checked('step', step, EASING_STEP))
+        super().__init__(uid, args, easing_params(*args))
+
+
+class SetBacklightEasing(SetDialEasing):
+    __slots__ = ()
+    method = 'set_backlight_easing'
+    action = 'easing/backlight'
+
+
+class SetName(Command):
+    __slots__ = ()
+    method = 'set_dial_name'
+    action = 'name'
+
+    def __init__(self, uid: str, name: str):
+        """
+        :param uid: str, the uid of the vu-dial.
+        :param name: str, the new dial name; must not be empty.
+        """
+        if not name:
+            raise ValueError("name must not be empty")
+        super().__init__(uid, (name,), name_params(name))
+
+
+_BY_ACTION: dict[str, type[Command]] = {
+    cls.action: cls for cls in (SetValue, SetColor, SetDialEasing, SetBacklightEasing, SetName)
+}
+_FIELDS: dict[type[Command], tuple[str, ...]] = {
+    SetValue: ('value',),
+    SetColor: ('red', 'green', 'blue'),
+    SetDialEasing: ('period', 'step'),
+    SetBacklightEasing: ('period', 'step'),
+    SetName: ('name',),
+}
+
+
+def from_record(record: RecordedCommand) -> Command | None:
+    """
+    Rebuild a command from a recorded request (see recording.read_log).
+
+    :param record: RecordedCommand
+    :return: Command, or None for endpoints without a command type.
+    :raises ValueError: if the recorded parameters are missing or out of range.
+    """
+    cls = _BY_ACTION.get(record.endpoint)
+    if cls is None:
+        return None
+    query = dict(parse_qsl(record.params))
+    try:
+        return cls(record.uid, *(query[field] for field in _FIELDS[cls]))
+    except KeyError as e:
+        raise ValueError(f"Recorded {record.endpoint} command is missing {e.args[0]!r}") from None
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, ContextManager
+
+if TYPE_CHECKING:
+    import requests
+
+
+class ConnectionPool:
+    def __init__(self, size: int):
+        """
+        A thread-safe pool of keep-alive connections with per-thread affinity.
+
+        Each thread gets its own requests.Session holding a single persistent
+        connection, so a worker keeps reusing the same socket and sessions are
+        never shared between threads. At most `size` requests are in flight at
+        once; size it to the number of worker threads.
+
+        Connections are per thread, not per slot: with more threads than
+        `size`, each thread still keeps its own idle connection until the
+        thread exits or close() is called.
+
+        :param size: int, maximum concurrent requests.
+        """
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size!r}")
+        self.size = size
+        self._slots = threading.BoundedSemaphore(size)
+        self._local = threading.local()
+        self._sessions: weakref.WeakSet[requests.Session] = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def session(self) -> requests.Session:
+        """
+        Return the calling thread's session, creating it on first use.
+
+        :return: requests.Session
+        """
+        s = getattr(self._local, 'session', None)
+        if s is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            s = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+            s.mount('http://', adapter)
+            s.mount('https://', adapter)
+            self._local.session = s
+            with self._lock:
+                self._sessions.add(s)
+        return s
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        with self._slots:
+            return self.session().request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def close(self) -> None:
+        """Close every session created by the pool."""
+        with self._lock:
+            sessions = list(self._sessions)
+            self._sessions = weakref.WeakSet()
+        for s in sessions:
+            s.close()
+        self._local = threading.local()
+
+
+class DialLocks:
+    def __init__(self):
+        """
+        One lock per dial uid.
+
+        Holding a dial's lock for the duration of a write keeps updates to that
+        dial in order; writes to different dials never contend.
+        """
+        self._locks: dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def __call__(self, uid: str) -> threading.Lock:
+        lock = self._locks.get(uid)
+        if lock is None:
+            with self._guard:
+                lock = self._locks.setdefault(uid, threading.Lock())
+        return lock
+
+
+_NO_LOCK = nullcontext()
+
+
+def no_lock(uid: str) -> ContextManager:
+    return _NO_LOCK
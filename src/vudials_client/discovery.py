@@ -0,0 +1,137 @@
+import logging
+import threading
+from collections.abc import Callable
+
+from .vudialsclient import VUAdmin, VUDial, response_data
+
+LOGGER = logging.getLogger(__name__)
+
+
+class DialWatcher:
+    def __init__(self, client: VUDial, admin: VUAdmin | None = None,
+                 min_interval: float = 1.0, max_interval: float = 30.0, backoff: float = 2.0,
+                 on_added: Callable[[str, dict], None] | None = None,
+                 on_removed: Callable[[str], None] | None = None,
+                 report_existing: bool = True):
+        """
+        Detect dials being plugged in or removed and provision new hardware.
+
+        Each poll diffs the uids returned by list_dials against the previous
+        poll. After a change the next poll comes after min_interval; while
+        nothing changes the interval grows by `backoff` up to max_interval.
+
+        Unprovisioned hardware does not show up in list_dials, so with an admin
+        client the watcher also calls provision_dials on the same schedule:
+        on every fast poll (the first one, after a change or after wake()) and
+        on every quiet poll once the interval has reached max_interval. Only
+        the polls in between skip it.
+
+        :param client: VUDial, used for list_dials.
+        :param admin: VUAdmin, optional; when given, newly connected hardware
+            is provisioned as described above.
+        :param min_interval: float, seconds between polls right after a change.
+        :param max_interval: float, seconds between polls when nothing changes.
+        :param backoff: float, interval growth factor per quiet poll.
+        :param on_added: Callable, called with (uid, dial summary) for each new dial.
+        :param on_removed: Callable, called with uid for each dial that disappeared.
+        :param report_existing: bool, treat dials present at the first poll as added.
+        """
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("Need 0 < min_interval <= max_interval")
+        self.client = client
+        self.admin = admin
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = min_interval
+        self.report_existing = report_existing
+        self._added: list[Callable[[str, dict], None]] = [on_added] if on_added else []
+        self._removed: list[Callable[[str], None]] = [on_removed] if on_removed else []
+        self.dials: dict[str, dict] | None = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def on_added(self, fn: Callable[[str, dict], None]) -> Callable[[str, dict], None]:
+        """Register a callback for new dials; usable as a decorator."""
+        self._added.append(fn)
+        return fn
+
+    def on_removed(self, fn: Callable[[str], None]) -> Callable[[str], None]:
+        """Register a callback for removed dials; usable as a decorator."""
+        self._removed.append(fn)
+        return fn
+
+    def _fire(self, callbacks: list[Callable], *args) -> None:
+        for fn in callbacks:
+            try:
+                fn(*args)
+            except Exception:
+                LOGGER.exception('Dial watcher callback %r failed for %s', fn, args[0])
+
+    def poll_once(self) -> tuple[list[str], list[str]]:
+        """
+        Provision (if an admin client was given and it is due), list dials and
+        fire callbacks.
+
+        :return: tuple[list[str], list[str]], the added and removed uids.
+        """
+        if self.admin is not None and self._should_provision():
+            provisioned = response_data(self.admin.provision_dials())
+            if provisioned and self.client.read_cache is not None:
+                self.client.read_cache.invalidate('list_dials')
+        current = {d['uid']: d for d in response_data(self.client.list_dials()) or []}
+
+        first = self.dials is None
+        previous = self.dials or {}
+        added = [uid for uid in current if uid not in previous]
+        removed = [uid for uid in previous if uid not in current]
+        self.dials = current
+
+        if first or added or removed:
+            # Dials are often plugged in several at a time, so the next poll
+            # comes soon and provisions again.
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.max_interval, self.interval * self.backoff)
+        if first and not self.report_existing:
+            added = []
+        for uid in added:
+            self._fire(self._added, uid, current[uid])
+        for uid in removed:
+            self._fire(self._removed, uid)
+        return added, removed
+
+    def _should_provision(self) -> bool:
+        return self.interval <= self.min_interval or self.interval >= self.max_interval
+
+    def wake(self) -> None:
+        """Poll and provision now and fall back to the fast interval, e.g. on a hot-plug hint."""
+        self.interval = self.min_interval
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                self.poll_once()
+            except Exception as e:
+                LOGGER.warning('Dial discovery poll failed: %s', e)
+                self.interval = min(self.max_interval, self.interval * self.backoff)
+            self._wake.wait(self.interval)
+
+    def start(self) -> None:
+        """Poll in a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='vu1-discovery', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,209 @@
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from typing import Any
+
+from .commands import Command
+from .ratelimit import RateLimiter
+from .vudialsclient import VUDial
+
+LOGGER = logging.getLogger(__name__)
+
+
+class _Entry:
+    __slots__ = ('method', 'uid', 'args', 'futures', 'enqueued')
+
+    def __init__(self, method: str, uid: str, args: tuple, future: Future):
+        self.method = method
+        self.uid = uid
+        self.args = args
+        self.futures = [future]
+        self.enqueued = time.monotonic()
+
+
+class _Lane:
+    def __init__(self, name: str, collapse: bool):
+        self.name = name
+        self.collapse = collapse
+        self.queue: deque[_Entry] = deque()
+        self.pending: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self.submitted = 0
+        self.collapsed = 0
+        self.completed = 0
+        self.failed = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def __len__(self) -> int:
+        return len(self.pending) if self.collapse else len(self.queue)
+
+    def push(self, entry: _Entry) -> None:
+        self.submitted += 1
+        if not self.collapse:
+            self.queue.append(entry)
+            return
+        key = (entry.method, entry.uid)
+        waiting = self.pending.get(key)
+        if waiting is None:
+            self.pending[key] = entry
+        else:
+            # Keep the queue position (so updates are not starved) but send
+            # only the newest arguments; every superseded caller gets its result.
+            waiting.args = entry.args
+            waiting.futures.extend(entry.futures)
+            self.collapsed += 1
+
+    def pop(self) -> _Entry:
+        entry = self.pending.popitem(last=False)[1] if self.collapse else self.queue.popleft()
+        wait = time.monotonic() - entry.enqueued
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+        return entry
+
+
+class PriorityDispatcher:
+    def __init__(self, client: VUDial, lanes: tuple[str, ...] = ('urgent', 'routine'),
+                 calls_per_second: float = 0.0, workers: int = 1, collapse: tuple[str, ...] | None = None):
+        """
+        Send dial commands from several producers through prioritized lanes.
+
+        Workers always take the oldest command of the highest-priority
+        non-empty lane, and every command shares one global rate limit, so
+        urgent commands skip ahead of routine traffic instead of queueing
+        behind it. In collapsing lanes, a command waiting for the same method
+        and uid is replaced by the newer one.
+
+        :param client: VUDial, the client commands are sent through.
+        :param lanes: tuple[str, ...], lane names, highest priority first.
+        :param calls_per_second: float, global request budget; 0 disables limiting.
+        :param workers: int, sending threads. With more than one, commands to
+            the same dial may complete out of order.
+        :param collapse: tuple[str, ...], lanes that collapse per (method, uid);
+            defaults to every lane except the first.
+        """
+        if not lanes:
+            raise ValueError("At least one lane is required")
+        if collapse is None:
+            collapse = lanes[1:]
+        self.client = client
+        self.limiter = RateLimiter(calls_per_second)
+        self._lanes = [_Lane(name, name in collapse) for name in lanes]
+        self._by_name = {lane.name: lane for lane in self._lanes}
+        self._cond = threading.Condition()
+        self._closed = False
+        self._workers = [threading.Thread(target=self._work, name=f'vu1-dispatch-{i}', daemon=True)
+                         for i in range(workers)]
+        for t in self._workers:
+            t.start()
+
+    def submit(self, lane: str, method: str, uid: str, *args: Any) -> Future:
+        """
+        Queue a VUDial call.
+
+        :param lane: str, the lane name.
+        :param method: str, a VUDial method taking uid first, e.g. 'set_dial_value'.
+        :param uid: str, the uid of the vu-dial.
+        :param args: remaining positional arguments of the method.
+        :return: Future resolving to the method's response.
+        """
+        target = self._by_name.get(lane)
+        if target is None:
+            raise ValueError(f"Unknown lane: {lane!r}")
+        if not callable(getattr(self.client, method, None)):
+            raise ValueError(f"Unknown client method: {method!r}")
+        future: Future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Dispatcher is closed")
+            target.push(_Entry(method, uid, args, future))
+            self._cond.notify()
+        return future
+
+    def submit_command(self, lane: str, command: Command) -> Future:
+        """
+        Queue a prebuilt command from vudials_client.commands.
+
+        :param lane: str, the lane name.
+        :param command: Command, e.g. SetValue(uid, 50).
+        :return: Future resolving to the response.
+        """
+        return self.submit(lane, *command.as_call())
+
+    def _next(self) -> tuple[_Lane, _Entry] | tuple[None, None]:
+        for lane in self._lanes:
+            if len(lane):
+                return lane, lane.pop()
+        return None, None
+
+    def _has_work(self) -> bool:
+        return any(len(lane) for lane in self._lanes)
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                while not self._has_work() and not self._closed:
+                    self._cond.wait()
+                if self._closed and not self._has_work():
+                    return
+            # Wait until a token is due before choosing, so an urgent command
+            # arriving meanwhile takes this slot. The token itself is taken
+            # only once an entry has been claimed.
+            delay = self.limiter.delay()
+            while delay > 0:
+                time.sleep(delay)
+                delay = self.limiter.delay()
+            with self._cond:
+                lane, entry = self._next()
+            if entry is None:
+                continue
+            # Callers may have cancelled while the entry was queued.
+            futures = [f for f in entry.futures if f.set_running_or_notify_cancel()]
+            if not futures:
+                continue
+            self.limiter.acquire()
+            try:
+                result = getattr(self.client, entry.method)(entry.uid, *entry.args)
+            except Exception as e:
+                LOGGER.debug('Dispatched %s(%s) failed: %s', entry.method, entry.uid, e)
+                with self._cond:
+                    lane.failed += 1
+                for f in futures:
+                    f.set_exception(e)
+                continue
+            with self._cond:
+                lane.completed += 1
+            for f in futures:
+                f.set_result(result)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """
+        Per-lane queue depth, counters and wait times (seconds).
+
+        :return: dict[str, dict[str, float]]
+        """
+        with self._cond:
+            out = {}
+            for lane in self._lanes:
+                dequeued = lane.submitted - lane.collapsed - len(lane)
+                out[lane.name] = {
+                    'depth': len(lane), 'submitted': lane.submitted, 'collapsed': lane.collapsed,
+                    'completed': lane.completed, 'failed': lane.failed,
+                    'wait_avg': lane.wait_total / dequeued if dequeued else 0.0,
+                    'wait_max': lane.wait_max,
+                }
+            return out
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Stop accepting commands; workers exit once the queues are drained.
+
+        :param wait: bool, block until the workers have exited.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if wait:
+            for t in self._workers:
+                t.join()
@@ -0,0 +1,136 @@
+import math
+import threading
+from typing import NamedTuple
+
+from .vudialsclient import VUDial, response_data
+
+# Shortest easing period worth asking for; the dial firmware cannot move
+# meaningfully faster than this.
+MIN_PERIOD_MS = 20
+MAX_STEP = 100
+
+
+class Easing(NamedTuple):
+    period: int
+    step: int
+
+
+def compute_easing(update_rate: float, smoothness: float = 0.5, max_delta: int = 100) -> Easing:
+    """
+    Choose an easing (period, step) for a given update rate.
+
+    The hardware moves `step` units every `period` ms. The result lets a
+    change of max_delta finish just before the next update arrives, split
+    into as many increments as the smoothness asks for. Callers can then send
+    fewer, larger changes and let the dial interpolate between them.
+
+    :param update_rate: float, updates per second the caller will send.
+    :param smoothness: float, 0 jumps straight to the target, 1 moves in the
+        finest increments that still arrive in time.
+    :param max_delta: int, largest change expected between two updates (1-100).
+    :return: Easing
+    """
+    if update_rate <= 0:
+        raise ValueError(f"update_rate must be positive, got {update_rate!r}")
+    if not 0 <= smoothness <= 1:
+        raise ValueError(f"smoothness must be between 0 and 1, got {smoothness!r}")
+    max_delta = min(MAX_STEP, max(1, int(max_delta)))
+    budget_ms = 1000.0 / update_rate
+
+    increments = 1 + round(smoothness * (max_delta - 1))
+    # Never ask for more increments than fit in the budget at the minimum period.
+    increments = max(1, min(increments, int(budget_ms // MIN_PERIOD_MS)))
+    if increments == 1:
+        # A single move: take it whole at the first tick rather than waiting out the budget.
+        return Easing(MIN_PERIOD_MS, MAX_STEP)
+    step = math.ceil(max_delta / increments)
+    ticks = math.ceil(max_delta / step)
+    period = max(MIN_PERIOD_MS, int(budget_ms // ticks))
+    return Easing(period, step)
+
+
+class EasingTuner:
+    def __init__(self, client: VUDial):
+        """
+        Apply computed easing to dials, sending it only when it changes.
+
+        The current easing of each dial is read once with get_easing_config
+        and cached; later calls compare against the cache.
+
+        :param client: VUDial, the client used to read and set easing.
+        """
+        self.client = client
+        self._cache: dict[str, dict[str, Easing]] = {}
+        self._lock = threading.Lock()
+
+    def current(self, uid: str) -> dict[str, Easing]:
+        """
+        Return the cached easing of a dial, reading it from the server once.
+
+        :param uid: str, the uid of the vu-dial.
+        :return: dict[str, Easing], keyed by 'dial' and 'backlight'.
+        """
+        with self._lock:
+            cached = self._cache.get(uid)
+        if cached is not None:
+            return cached
+        data = response_data(self.client.get_easing_config(uid)) or {}
+        cached = {kind: Easing(data.get(f'{kind}_period'), data.get(f'{kind}_step'))
+                  for kind in ('dial', 'backlight')}
+        with self._lock:
+            return self._cache.setdefault(uid, cached)
+
+    def invalidate(self, uid: str | None = None) -> None:
+        """
+        Forget cached easing, e.g. after the dial was reset.
+
+        :param uid: str, the dial to forget; every dial if None.
+        """
+        with self._lock:
+            if uid is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(uid, None)
+
+    def set(self, uid: str, dial: Easing | None = None, backlight: Easing | None = None) -> list[str]:
+        """
+        Set easing, skipping values equal to the cached ones.
+
+        :param uid: str, the uid of the vu-dial.
+        :param dial: Easing, desired dial easing; unchanged if None.
+        :param backlight: Easing, desired backlight easing; unchanged if None.
+        :return: list[str], which of 'dial'/'backlight' were actually sent.
+        """
+        current = self.current(uid)
+        sent = []
+        if dial is not None and current['dial'] != dial:
+            self.client.set_dial_easing(uid, dial.period, dial.step)
+            sent.append('dial')
+        if backlight is not None and current['backlight'] != backlight:
+            self.client.set_backlight_easing(uid, backlight.period, backlight.step)
+            sent.append('backlight')
+        if sent:
+            with self._lock:
+                entry = dict(self._cache.get(uid, current))
+                if 'dial' in sent:
+                    entry['dial'] = dial
+                if 'backlight' in sent:
+                    entry['backlight'] = backlight
+                self._cache[uid] = entry
+        return sent
+
+    def tune(self, uid: str, update_rate: float, smoothness: float = 0.5, max_delta: int = 100,
+             backlight: bool = True) -> Easing:
+        """
+        Compute easing for an update rate and apply it to a dial.
+
+        :param uid: str, the uid of the vu-dial.
+        :param update_rate: float, updates per second the caller will send.
+        :param smoothness: float, see compute_easing.
+        :param max_delta: int, see compute_easing.
+        :param backlight: bool, apply the same easing to the backlight.
+        :return: Easing, the easing now in effect.
+        """
+        easing = compute_easing(update_rate, smoothness, max_delta)
+        self.set(uid, dial=easing, backlight=easing if backlight else None)
+        return easing
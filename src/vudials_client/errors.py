@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import copy
+import inspect
+import socket
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from .vudialsclient import response_data
+
+if TYPE_CHECKING:
+    import requests
+
+    from .vudialsclient import VUAdmin, VUDial
+
+
+class VUError(Exception):
+    """Base class for vu-dial server and transport failures."""
+
+    def __init__(self, message: str, status_code: int | None = None, uid: str | None = None):
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        self.uid = uid
+
+
+class DialNotFound(VUError):
+    """The server does not know the dial (HTTP 404)."""
+
+
+class Unauthorized(VUError):
+    """The key is invalid or not allowed to use the dial (HTTP 401/403)."""
+
+
+class OutOfScope(Unauthorized):
+    """Rejected locally: the dial is outside the key's DialScope; nothing was sent."""
+
+
+class ServerBusy(VUError):
+    """The server is overloaded and the call can be retried later (HTTP 429/503)."""
+
+
+class ServerError(VUError):
+    """Any other error response, e.g. a rejected parameter or internal error."""
+
+
+class TransportError(VUError):
+    """The request did not get a response: connection failure or timeout."""
+
+
+_STATUS_ERRORS: dict[int, type[VUError]] = {
+    401: Unauthorized,
+    403: Unauthorized,
+    404: DialNotFound,
+    429: ServerBusy,
+    503: ServerBusy,
+}
+
+
+def error_for_response(response: requests.Response, uid: str | None = None) -> VUError | None:
+    """
+    Classify an HTTP response without raising.
+
+    :param response: requests.Response
+    :param uid: str, the dial the call was about, if any.
+    :return: VUError, or None for a successful response.
+    """
+    status = response.status_code
+    if status < 400:
+        return None
+    cls = _STATUS_ERRORS.get(status, ServerError)
+    return cls(f'{status} {response.reason}', status, uid)
+
+
+def _is_transport_error(exc: Exception) -> bool:
+    # Only failures to reach the server. Local errors, such as a missing
+    # upload file (FileNotFoundError), are bugs for the caller and propagate.
+    if isinstance(exc, (ConnectionError, TimeoutError, socket.gaierror)):
+        return True
+    # Both transports report network failures as requests exceptions, so
+    # requests is already loaded whenever one of them is being handled here.
+    from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
+    return isinstance(exc, (RequestsConnectionError, Timeout))
+
+
+class Result:
+    """The outcome of one call: the response, or the error that prevented it."""
+
+    __slots__ = ('response', 'error')
+
+    def __init__(self, response: requests.Response | None, error: VUError | None = None):
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __bool__(self) -> bool:
+        return self.error is None
+
+    @property
+    def status_code(self) -> int | None:
+        return None if self.response is None else self.response.status_code
+
+    @property
+    def data(self) -> Any:
+        """The unwrapped response payload; raises the error for failed calls."""
+        return response_data(self.unwrap())
+
+    def unwrap(self) -> requests.Response:
+        """
+        Return the response, raising the error for failed calls.
+
+        :return: requests.Response
+        """
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+    def __repr__(self) -> str:
+        if self.error is None:
+            return f'<Result ok {self.status_code}>'
+        return f'<Result {type(self.error).__name__}: {self.error.message}>'
+
+
+class ResultClient:
+    def __init__(self, client: VUDial | VUAdmin):
+        """
+        A view of a client whose methods return Result objects instead of raising.
+
+        Error responses are classified from their status code, so failed
+        calls cost no exception unwinding; only transport failures, which are
+        raised by the HTTP library itself, are caught. The view shares the
+        client's connections, cache, locks and recorder.
+
+        :param client: VUDial or VUAdmin.
+        """
+        self.client = client
+        self._raw = copy.copy(client)
+        self._raw.raise_errors = False
+        self._methods: dict[str, Callable[..., Result]] = {}
+
+    def __getattr__(self, name: str) -> Callable[..., Result]:
+        method = self._methods.get(name)
+        if method is not None:
+            return method
+        target = getattr(self._raw, name)
+        if name.startswith('_') or not callable(target):
+            raise AttributeError(name)
+        takes_uid = next(iter(inspect.signature(target).parameters), None) == 'uid'
+
+        def call(*args: Any, **kwargs: Any) -> Result:
+            uid = None
+            if takes_uid:
+                uid = args[0] if args else kwargs.get('uid')
+                scope = getattr(self._raw, 'scope', None)
+                if scope is not None and not scope.allows(uid):
+                    return Result(None, OutOfScope(f'Dial {uid} is outside the API key scope', None, uid))
+            try:
+                response = target(*args, **kwargs)
+            except Exception as e:
+                if not _is_transport_error(e):
+                    raise
+                return Result(None, TransportError(str(e), None, uid))
+            if response is None:
+                return Result(None)
+            return Result(response, error_for_response(response, uid))
+
+        call.__name__ = name
+        self._methods[name] = call
+        return call
+
+    def map(self, method: str, uids: Iterable[str], *args: Any) -> dict[str, Result]:
+        """
+        Call a per-dial method for several dials, continuing past failures.
+
+        :param method: str, a method taking uid first, e.g. 'set_dial_value'.
+        :param uids: Iterable[str], the dials.
+        :param args: remaining positional arguments of the method.
+        :return: dict[str, Result], keyed by uid in call order.
+        """
+        call = getattr(self, method)
+        return {uid: call(uid, *args) for uid in uids}
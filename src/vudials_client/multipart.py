@@ -0,0 +1,147 @@
+import mmap
+import os
+import uuid
+from collections.abc import Callable, Iterator
+from typing import IO, Any
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class _FilePart:
+    __slots__ = ('header', 'fileobj', 'size', 'view', 'map', 'offset')
+
+    def __init__(self, header: bytes, fileobj: IO[bytes], use_mmap: bool):
+        self.header = header
+        self.fileobj = fileobj
+        self.offset = 0
+        self.map = None
+        self.view = None
+        start = fileobj.tell()
+        self.size = fileobj.seek(0, os.SEEK_END) - start
+        fileobj.seek(start)
+        if use_mmap and self.size > 0:
+            try:
+                fd = fileobj.fileno()
+            except (AttributeError, OSError, ValueError):
+                fd = None
+            if fd is not None:
+                self.map = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+                self.view = memoryview(self.map)[start:start + self.size]
+
+    def read(self, size: int) -> bytes:
+        if self.view is not None:
+            chunk = bytes(self.view[self.offset:self.offset + size])
+        else:
+            chunk = self.fileobj.read(size)
+        self.offset += len(chunk)
+        return chunk
+
+    def close(self) -> None:
+        if self.view is not None:
+            self.view.release()
+            self.view = None
+        if self.map is not None:
+            self.map.close()
+            self.map = None
+
+
+class MultipartEncoder:
+    def __init__(self, files: dict[str, Any], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 progress: Callable[[int, int], None] | None = None, use_mmap: bool = False):
+        """
+        Stream a multipart/form-data body without building it in memory.
+
+        :param files: dict[str, Any], field name to an open binary file, or a
+            (filename, fileobj) / (filename, fileobj, content_type) tuple, in the
+            same shape requests accepts for files=.
+        :param chunk_size: int, maximum bytes returned by a single read().
+        :param progress: Callable, optional; called as progress(bytes_sent, total)
+            after every chunk handed to the transport.
+        :param use_mmap: bool, read file contents through a read-only mmap
+            instead of file reads where the file object supports fileno().
+
+        The body length is known up front, so the request carries a normal
+        Content-Length header. Peak memory is bounded by chunk_size regardless
+        of file size.
+        """
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f'multipart/form-data; boundary={self.boundary}'
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self._parts = [_FilePart(self._part_header(name, value), self._fileobj(value), use_mmap)
+                       for name, value in files.items()]
+        self._trailer = f'--{self.boundary}--\r\n'.encode()
+        self.len = sum(len(p.header) + p.size + 2 for p in self._parts) + len(self._trailer)
+        self.bytes_read = 0
+        self._segments = self._generate()
+        self._pending = b''
+
+    @staticmethod
+    def _fileobj(value: Any) -> IO[bytes]:
+        return value[1] if isinstance(value, tuple) else value
+
+    def _part_header(self, name: str, value: Any) -> bytes:
+        if isinstance(value, tuple):
+            filename = value[0]
+            content_type = value[2] if len(value) > 2 else None
+        else:
+            fname = getattr(value, 'name', None)
+            filename = os.path.basename(fname) if isinstance(fname, str) and fname else name
+            content_type = None
+        filename = filename.replace('"', '%22')
+        header = (f'--{self.boundary}\r\n'
+                  f'Content-Disposition: form-data; name="{name}"; filename="{filename}"\r\n')
+        if content_type:
+            header += f'Content-Type: {content_type}\r\n'
+        return (header + '\r\n').encode()
+
+    def _generate(self) -> Iterator[bytes]:
+        for part in self._parts:
+            yield part.header
+            try:
+                while True:
+                    chunk = part.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+            finally:
+                part.close()
+            yield b'\r\n'
+        yield self._trailer
+
+    def __len__(self) -> int:
+        return self.len
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Return up to size bytes of the encoded body (chunk_size if size < 0).
+
+        :param size: int, maximum number of bytes to return.
+        :return: bytes, empty once the body is exhausted.
+        """
+        if size is None or size < 0:
+            size = self.chunk_size
+        buf = self._pending
+        while len(buf) < size:
+            segment = next(self._segments, None)
+            if segment is None:
+                break
+            buf += segment
+        chunk, self._pending = buf[:size], buf[size:]
+        if chunk:
+            self.bytes_read += len(chunk)
+            if self.progress is not None:
+                self.progress(self.bytes_read, self.len)
+        return chunk
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self) -> None:
+        """Release any mmaps still held by unread parts."""
+        for part in self._parts:
+            part.close()
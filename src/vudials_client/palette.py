@@ -0,0 +1,127 @@
+import colorsys
+import math
+from collections.abc import Sequence
+
+Color = tuple[int, int, int]
+
+SPACES = ('rgb', 'hsv', 'oklab')
+
+
+def _to_linear(c: float) -> float:
+    return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+
+def _from_linear(c: float) -> float:
+    return 12.92 * c if c <= 0.0031308 else 1.055 * c ** (1 / 2.4) - 0.055
+
+
+def _rgb_to_oklab(r: float, g: float, b: float) -> tuple[float, float, float]:
+    r, g, b = _to_linear(r), _to_linear(g), _to_linear(b)
+    l = math.cbrt(0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b)
+    m = math.cbrt(0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b)
+    s = math.cbrt(0.0883024619 * r + 0.2817188376 * g + 0.6299787005 * b)
+    return (0.2104542553 * l + 0.7936177850 * m - 0.0040720468 * s,
+            1.9779984951 * l - 2.4285922050 * m + 0.4505937099 * s,
+            0.0259040371 * l + 0.7827717662 * m - 0.8086757660 * s)
+
+
+def _oklab_to_rgb(L: float, a: float, b: float) -> tuple[float, float, float]:
+    l = (L + 0.3963377774 * a + 0.2158037573 * b) ** 3
+    m = (L - 0.1055613458 * a - 0.0638541728 * b) ** 3
+    s = (L - 0.0894841775 * a - 1.2914855480 * b) ** 3
+    return (_from_linear(4.0767416621 * l - 3.3077115913 * m + 0.2309699292 * s),
+            _from_linear(-1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s),
+            _from_linear(-0.0041960863 * l - 0.7034186147 * m + 1.7076147010 * s))
+
+
+def _mix(c0: tuple[float, ...], c1: tuple[float, ...], t: float, space: str) -> tuple[float, float, float]:
+    """Interpolate two 0-1 RGB colours in the given space."""
+    if space == 'hsv':
+        h0, s0, v0 = colorsys.rgb_to_hsv(*c0)
+        h1, s1, v1 = colorsys.rgb_to_hsv(*c1)
+        # Take the short way round the hue circle.
+        dh = (h1 - h0 + 0.5) % 1.0 - 0.5
+        return colorsys.hsv_to_rgb((h0 + dh * t) % 1.0, s0 + (s1 - s0) * t, v0 + (v1 - v0) * t)
+    if space == 'oklab':
+        p0, p1 = _rgb_to_oklab(*c0), _rgb_to_oklab(*c1)
+        return _oklab_to_rgb(*(x + (y - x) * t for x, y in zip(p0, p1)))
+    return tuple(x + (y - x) * t for x, y in zip(c0, c1))
+
+
+class Palette:
+    def __init__(self, stops: Sequence[tuple[float, Color]], space: str = 'rgb'):
+        """
+        A gradient precomputed into a lookup table indexed by dial value.
+
+        :param stops: Sequence[tuple[float, Color]], (dial value 0-100,
+            (red, green, blue) 0-100) pairs; at least one.
+        :param space: str, interpolation space: 'rgb', 'hsv' or the
+            perceptually uniform 'oklab'.
+        """
+        if not stops:
+            raise ValueError("A palette needs at least one stop")
+        if space not in SPACES:
+            raise ValueError(f"space must be one of {SPACES}, got {space!r}")
+        self.stops = sorted((float(pos), tuple(color)) for pos, color in stops)
+        self.space = space
+        self.lut: tuple[Color, ...] = tuple(self._compute(v) for v in range(101))
+
+    def _compute(self, value: int) -> Color:
+        stops = self.stops
+        if value <= stops[0][0]:
+            rgb = stops[0][1]
+        elif value >= stops[-1][0]:
+            rgb = stops[-1][1]
+        else:
+            for (p0, c0), (p1, c1) in zip(stops, stops[1:]):
+                if p0 <= value <= p1:
+                    t = (value - p0) / (p1 - p0) if p1 > p0 else 1.0
+                    mixed = _mix(tuple(x / 100 for x in c0), tuple(x / 100 for x in c1), t, self.space)
+                    rgb = tuple(x * 100 for x in mixed)
+                    break
+        return tuple(min(100, max(0, round(x))) for x in rgb)
+
+    def color(self, value: float) -> Color:
+        """
+        Return the colour for a dial value, quantized to whole channel percents.
+
+        :param value: float, the dial value; clamped to 0-100.
+        :return: Color, (red, green, blue) 0-100.
+        """
+        return self.lut[min(100, max(0, int(value)))]
+
+    def __repr__(self) -> str:
+        return f'Palette({self.stops!r}, space={self.space!r})'
+
+
+PALETTES: dict[str, Palette] = {
+    'traffic': Palette([(0, (0, 100, 0)), (50, (100, 100, 0)), (100, (100, 0, 0))], 'oklab'),
+    'heat': Palette([(0, (0, 0, 0)), (40, (100, 0, 0)), (75, (100, 100, 0)), (100, (100, 100, 100))], 'oklab'),
+    'ice': Palette([(0, (100, 100, 100)), (50, (0, 100, 100)), (100, (0, 0, 100))], 'oklab'),
+    'rainbow': Palette([(0, (100, 0, 0)), (50, (0, 100, 0)), (100, (0, 0, 100))], 'hsv'),
+}
+
+
+def register_palette(name: str, palette: Palette) -> None:
+    """
+    Make a palette available by name.
+
+    :param name: str
+    :param palette: Palette
+    """
+    PALETTES[name] = palette
+
+
+def get_palette(palette: str | Palette) -> Palette:
+    """
+    Look up a named palette; Palette instances are returned unchanged.
+
+    :param palette: str or Palette.
+    :return: Palette
+    """
+    if isinstance(palette, Palette):
+        return palette
+    try:
+        return PALETTES[palette]
+    except KeyError:
+        raise ValueError(f"Unknown palette: {palette!r}") from None
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    import requests
+
+PHASES = ('build', 'lock', 'connect', 'send', 'wait', 'read', 'parse')
+
+
+def endpoint_name(uri: str) -> str:
+    """
+    Name a request URI by endpoint, without the uid: 'dial/set', 'dial/list', 'admin/keys/list'.
+
+    :param uri: str, the request URI.
+    :return: str
+    """
+    seg = urlsplit(uri).path.split('/')[3:]
+    if seg[:1] == ['dial'] and len(seg) > 2:
+        return 'dial/' + '/'.join(seg[2:])
+    return '/'.join(seg)
+
+
+class Profiler:
+    def __init__(self):
+        """
+        Opt-in per-endpoint timing of client calls, split into phases.
+
+        Pass one to VUDial/VUAdmin (profiler=...) or assign client.profiler.
+        Phases are measured with time.perf_counter_ns:
+
+        - build: from the start of the client call (uid quoting, parameters,
+          get_uri) until the request is handed to the transport. Every call
+          starts a fresh mark, and the mark is cleared when the request
+          finishes or fails, on cache hits and on scope rejections, so idle
+          time never leaks into the next call.
+        - lock: in pooled mode, time spent waiting for the dial's write lock.
+        - connect, send, wait, read: with StdlibTransport, opening the
+          connection, writing the request, waiting for the response headers
+          and reading the body. requests only reports the time to the
+          response headers, which is counted as wait; everything else it
+          does (connect, send, read and its own overhead) is counted as send.
+        - parse: time spent in response.json().
+        """
+        self.clock = time.perf_counter_ns
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # endpoint -> phase -> [count, total ns, max ns]
+        self._stats: dict[str, dict[str, list[int]]] = {}
+        self._calls: dict[str, int] = {}
+
+    def mark(self) -> None:
+        """Start the build phase of a call on this thread."""
+        self._local.start = self.clock()
+        self._local.built = None
+
+    def built(self) -> None:
+        """End the build phase; the time until the request is sent counts as lock."""
+        self._local.built = self.clock()
+
+    def clear(self) -> None:
+        """Forget this thread's marks once its request has finished or failed."""
+        self._local.start = None
+        self._local.built = None
+
+    def record(self, endpoint: str, phase: str, ns: int) -> None:
+        with self._lock:
+            phases = self._stats.get(endpoint)
+            if phases is None:
+                phases = self._stats[endpoint] = {}
+            entry = phases.get(phase)
+            if entry is None:
+                phases[phase] = [1, ns, ns]
+            else:
+                entry[0] += 1
+                entry[1] += ns
+                if ns > entry[2]:
+                    entry[2] = ns
+
+    def observe(self, uri: str, sent: int, response: requests.Response) -> None:
+        """
+        Record one finished request. Called by the client after the transport returns.
+
+        :param uri: str, the request URI.
+        :param sent: int, clock value when the request was handed to the transport.
+        :param response: requests.Response or LiteResponse.
+        """
+        done = self.clock()
+        endpoint = endpoint_name(uri)
+        start = getattr(self._local, 'start', None)
+        built = getattr(self._local, 'built', None)
+        with self._lock:
+            self._calls[endpoint] = self._calls.get(endpoint, 0) + 1
+        if start is not None:
+            if built is None:
+                self.record(endpoint, 'build', sent - start)
+            else:
+                self.record(endpoint, 'build', built - start)
+                self.record(endpoint, 'lock', sent - built)
+        phases = getattr(response, 'phases', None)
+        if phases:
+            for phase, ns in phases.items():
+                self.record(endpoint, phase, ns)
+        else:
+            elapsed = getattr(response, 'elapsed', None)
+            wait = int(elapsed.total_seconds() * 1e9) if elapsed is not None else 0
+            wait = min(wait, done - sent)
+            self.record(endpoint, 'wait', wait)
+            self.record(endpoint, 'send', done - sent - wait)
+        self._time_json(response, endpoint)
+
+    def _time_json(self, response: Any, endpoint: str) -> None:
+        parse = response.json
+
+        def json(**kwargs: Any) -> Any:
+            t = self.clock()
+            try:
+                return parse(**kwargs)
+            finally:
+                self.record(endpoint, 'parse', self.clock() - t)
+
+        response.json = json
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        with self._lock:
+            self._stats.clear()
+            self._calls.clear()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Aggregated timings in seconds.
+
+        :return: dict, endpoint -> {'calls': int, phase: {'count', 'total', 'mean', 'max'}}.
+        """
+        with self._lock:
+            out: dict[str, dict[str, Any]] = {}
+            for endpoint, phases in self._stats.items():
+                row: dict[str, Any] = {'calls': self._calls.get(endpoint, 0)}
+                for phase, (count, total, peak) in phases.items():
+                    row[phase] = {'count': count, 'total': total / 1e9, 'mean': total / count / 1e9,
+                                  'max': peak / 1e9}
+                out[endpoint] = row
+            return out
+
+    def summary(self) -> str:
+        """
+        A text table of mean milliseconds per call, by endpoint and phase.
+
+        :return: str
+        """
+        stats = self.stats()
+        header = f'{"endpoint":<24}{"calls":>8}' + ''.join(f'{p:>9}' for p in PHASES) + f'{"total":>9}{"sum s":>9}'
+        lines = [header, '-' * len(header)]
+        for endpoint in sorted(stats, key=lambda e: -sum(v['total'] for k, v in stats[e].items() if k != 'calls')):
+            row = stats[endpoint]
+            calls = row['calls'] or 1
+            means = [row[p]['total'] / calls * 1000 if p in row else 0.0 for p in PHASES]
+            total = sum(v['total'] for k, v in row.items() if k != 'calls')
+            lines.append(f'{endpoint:<24}{row["calls"]:>8}' + ''.join(f'{m:>9.3f}' for m in means)
+                         + f'{total / calls * 1000:>9.3f}{total:>9.3f}')
+        return '\n'.join(lines)
+
+    def folded(self) -> str:
+        """
+        Collapsed-stack lines ('vu1;endpoint;phase microseconds') for flamegraph.pl or speedscope.
+
+        :return: str
+        """
+        with self._lock:
+            return '\n'.join(f'vu1;{endpoint};{phase} {total // 1000}'
+                             for endpoint, phases in sorted(self._stats.items())
+                             for phase, (_, total, _) in phases.items())
@@ -0,0 +1,220 @@
+"""
+pytest fixtures for testing code that drives VU1 dials.
+
+Installed as a pytest11 entry point, so the fixtures are available as soon as
+the package is installed. Without installing, enable it with
+``-p vudials_client.pytest_plugin``.
+
+Fixtures:
+
+- ``vu1_simulator``: an in-process VU1Simulator. Options come from the
+  ``vu1`` marker, e.g. ``@pytest.mark.vu1(dials=["a", "b"], latency=0.01)``.
+- ``vu1_calls``: a CallCounter that sees every command sent by ``vu1_client``.
+  Pass ``recorder=vu1_calls`` to count requests from your own clients.
+- ``vu1_client`` / ``vu1_admin``: VUDial and VUAdmin bound to the simulator.
+
+Counting mode: ``--vu1-counts=FILE`` compares the requests made by each test
+that uses ``vu1_calls`` against the counts stored in FILE, failing tests that
+exceed them by more than ``--vu1-tolerance``; ``--vu1-update-counts`` rewrites
+FILE instead. ``@pytest.mark.vu1(max_requests=N)`` sets a fixed limit.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+
+from .recording import RecordedCommand, parse_command
+from .simulator import VU1Simulator
+from .vudialsclient import VUAdmin, VUDial
+
+_COUNTS = pytest.StashKey[dict]()
+
+
+class CallCounter:
+    def __init__(self):
+        """
+        Records the commands a client sends. Pass it as VUDial's recorder.
+        """
+        self.calls: list[RecordedCommand] = []
+        self._lock = threading.Lock()
+
+    def record(self, path_uri: str, files: dict | None = None) -> None:
+        uid, endpoint, params = parse_command(path_uri)
+        with self._lock:
+            self.calls.append(RecordedCommand(time.monotonic(), uid, endpoint, params))
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls.clear()
+
+    def _matching(self, endpoint: str | None, uid: str | None) -> list[RecordedCommand]:
+        with self._lock:
+            calls = list(self.calls)
+        return [c for c in calls
+                if (endpoint is None or c.endpoint == endpoint) and (uid is None or c.uid == uid)]
+
+    def count(self, endpoint: str | None = None, uid: str | None = None) -> int:
+        """
+        Number of commands sent, optionally for one endpoint and/or dial.
+
+        :param endpoint: str, endpoint relative to the dial, e.g. 'set' or 'list'.
+        :param uid: str, the uid of the vu-dial.
+        :return: int
+        """
+        return len(self._matching(endpoint, uid))
+
+    def redundant_writes(self) -> list[RecordedCommand]:
+        """
+        Writes that repeat the previous write to the same dial endpoint.
+
+        :return: list[RecordedCommand]
+        """
+        last: dict[tuple[str, str], str] = {}
+        repeated = []
+        for c in self._matching(None, None):
+            if not c.is_write or c.endpoint == 'image/set':
+                continue
+            key = (c.uid, c.endpoint)
+            if last.get(key) == c.params:
+                repeated.append(c)
+            last[key] = c.params
+        return repeated
+
+    def assert_count(self, expected: int, endpoint: str | None = None, uid: str | None = None) -> None:
+        actual = self.count(endpoint, uid)
+        assert actual == expected, f"expected {expected} {_describe(endpoint, uid)}, got {actual}"
+
+    def assert_at_most(self, limit: int, endpoint: str | None = None, uid: str | None = None) -> None:
+        actual = self.count(endpoint, uid)
+        assert actual <= limit, f"expected at most {limit} {_describe(endpoint, uid)}, got {actual}"
+
+    def assert_no_redundant_writes(self) -> None:
+        repeated = self.redundant_writes()
+        assert not repeated, 'redundant writes: ' + ', '.join(
+            f'{c.uid}/{c.endpoint}?{c.params}' for c in repeated)
+
+    @contextmanager
+    def budget(self, max_requests: int | None = None, max_seconds: float | None = None,
+               endpoint: str | None = None) -> Iterator[None]:
+        """
+        Assert that the block sends at most max_requests commands and
+        finishes within max_seconds.
+
+        :param max_requests: int, request limit for the block.
+        :param max_seconds: float, wall-clock limit for the block.
+        :param endpoint: str, count only this endpoint.
+        """
+        before = self.count(endpoint)
+        start = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - start
+        sent = self.count(endpoint) - before
+        if max_requests is not None:
+            assert sent <= max_requests, \
+                f"block sent {sent} {_describe(endpoint, None)}, budget is {max_requests}"
+        if max_seconds is not None:
+            assert elapsed <= max_seconds, f"block took {elapsed * 1000:.1f} ms, budget is {max_seconds * 1000:.1f} ms"
+
+
+def _describe(endpoint: str | None, uid: str | None) -> str:
+    what = f'{endpoint!r} requests' if endpoint else 'requests'
+    return f'{what} for {uid!r}' if uid else what
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup('vu1', 'VU1 dial request counting')
+    group.addoption('--vu1-counts', metavar='FILE', default=None,
+                    help='compare request counts of tests using vu1_calls against FILE (JSON)')
+    group.addoption('--vu1-update-counts', action='store_true', default=False,
+                    help='write the request counts to the --vu1-counts file instead of comparing')
+    group.addoption('--vu1-tolerance', type=float, default=0.0,
+                    help='allowed relative growth over the stored counts, e.g. 0.1 for 10%%')
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line('markers', 'vu1(max_requests=None, **simulator_options): '
+                                       'configure the vu1_simulator fixture and limit requests')
+    config.stash[_COUNTS] = {}
+
+
+def _marker_options(request: pytest.FixtureRequest) -> dict:
+    options: dict = {}
+    for marker in reversed(list(request.node.iter_markers('vu1'))):
+        options.update(marker.kwargs)
+    return options
+
+
+def _load_counts(path: str) -> dict[str, int]:
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def vu1_simulator(request: pytest.FixtureRequest) -> Iterator[VU1Simulator]:
+    options = _marker_options(request)
+    options.pop('max_requests', None)
+    with VU1Simulator(**options) as sim:
+        yield sim
+
+
+@pytest.fixture
+def vu1_calls(request: pytest.FixtureRequest) -> Iterator[CallCounter]:
+    counter = CallCounter()
+    yield counter
+
+    config = request.config
+    nodeid = request.node.nodeid
+    sent = counter.count()
+    config.stash[_COUNTS][nodeid] = sent
+    limit = _marker_options(request).get('max_requests')
+    if limit is not None and sent > limit:
+        pytest.fail(f'{nodeid} sent {sent} requests, limit is {limit}', pytrace=False)
+    path = config.getoption('vu1_counts')
+    if path and not config.getoption('vu1_update_counts'):
+        baseline = _load_counts(path).get(nodeid)
+        tolerance = config.getoption('vu1_tolerance')
+        if baseline is not None and sent > baseline * (1 + tolerance):
+            pytest.fail(f'{nodeid} sent {sent} requests, {baseline} recorded in {path}', pytrace=False)
+
+
+@pytest.fixture
+def vu1_client(vu1_simulator: VU1Simulator, vu1_calls: CallCounter) -> Iterator[VUDial]:
+    client = VUDial(vu1_simulator.address, vu1_simulator.port, vu1_simulator.api_key, recorder=vu1_calls)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def vu1_admin(vu1_simulator: VU1Simulator) -> Iterator[VUAdmin]:
+    admin = VUAdmin(vu1_simulator.address, vu1_simulator.port, vu1_simulator.admin_key)
+    yield admin
+    admin.close()
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    path = config.getoption('vu1_counts')
+    counts = config.stash[_COUNTS]
+    if not (path and config.getoption('vu1_update_counts') and counts):
+        return
+    merged = {**_load_counts(path), **counts}
+    with open(path, 'w') as f:
+        json.dump(dict(sorted(merged.items())), f, indent=2)
+        f.write('\n')
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    counts = config.stash[_COUNTS]
+    if not config.getoption('vu1_counts') or not counts:
+        return
+    terminalreporter.section('VU1 request counts')
+    for nodeid, sent in sorted(counts.items()):
+        terminalreporter.write_line(f'{sent:6d}  {nodeid}')
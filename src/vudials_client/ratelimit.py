@@ -0,0 +1,53 @@
+import threading
+import time
+
+
+class RateLimiter:
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Thread-safe token bucket.
+
+        :param rate: float, tokens added per second; 0 or less disables limiting.
+        :param burst: int, bucket capacity (calls allowed back to back).
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def try_acquire(self) -> bool:
+        """
+        Take a token without waiting.
+
+        :return: bool, True if a token was available.
+        """
+        if self.rate <= 0:
+            return True
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def delay(self) -> float:
+        """
+        Return seconds until a token becomes available (0 if one is ready).
+
+        :return: float
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            self._refill(time.monotonic())
+            return max(0.0, (1 - self._tokens) / self.rate)
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        while not self.try_acquire():
+            time.sleep(self.delay())
@@ -0,0 +1,246 @@
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class _Call:
+    """A single in-flight call shared by every thread asking for the same key."""
+
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        """
+        Coalesce concurrent identical calls so only one of them does the work.
+
+        The first caller for a key runs the function; callers arriving while it
+        is still running block and receive the same result (or exception).
+        """
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn once for all concurrent callers using the same key.
+
+        :param key: Hashable, identifies identical calls.
+        :param fn: Callable, zero-argument function performing the call.
+        :return: the value returned by fn.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    def __init__(self):
+        """
+        asyncio counterpart of SingleFlight.
+
+        Must be used from a single event loop; concurrent awaiters of the same
+        key share one task and its result.
+        """
+        self._calls: dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await fn once for all concurrent callers using the same key.
+
+        :param key: Hashable, identifies identical calls.
+        :param fn: Callable, zero-argument function returning an awaitable.
+        :return: the value produced by the awaitable.
+        """
+        fut = self._calls.get(key)
+        if fut is not None:
+            self.coalesced += 1
+            # shield() so one cancelled waiter does not cancel the shared call.
+            return await asyncio.shield(fut)
+
+        fut = asyncio.ensure_future(fn())
+        self._calls[key] = fut
+        try:
+            return await asyncio.shield(fut)
+        finally:
+            if fut.done():
+                self._calls.pop(key, None)
+            else:
+                fut.add_done_callback(lambda _f: self._calls.pop(key, None))
+
+
+class _TTLStore:
+    def __init__(self, ttls: dict[str, float] | None, default_ttl: float):
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self._entries: dict[tuple[str, Hashable], tuple[float, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def ttl_for(self, endpoint: str) -> float:
+        return self.ttls.get(endpoint, self.default_ttl)
+
+    def lookup(self, endpoint: str, key: Hashable) -> tuple[bool, Any]:
+        entry = self._entries.get((endpoint, key))
+        if entry is not None:
+            expires, value = entry
+            if time.monotonic() < expires:
+                self.hits += 1
+                return True, value
+            del self._entries[(endpoint, key)]
+        self.misses += 1
+        return False, None
+
+    def store(self, endpoint: str, key: Hashable, value: Any) -> None:
+        ttl = self.ttl_for(endpoint)
+        if ttl > 0:
+            self._entries[(endpoint, key)] = (time.monotonic() + ttl, value)
+
+    def invalidate(self, endpoint: str | None = None) -> None:
+        if endpoint is None:
+            self._entries.clear()
+            return
+        for k in [k for k in self._entries if k[0] == endpoint]:
+            del self._entries[k]
+
+
+class ReadCache:
+    def __init__(self, ttls: dict[str, float] | None = None, default_ttl: float = 0.0):
+        """
+        Thread-safe single-flight coalescing plus an optional TTL response cache.
+
+        :param ttls: dict[str, float], per-endpoint TTL in seconds, keyed by
+            endpoint name (e.g. 'list_dials', 'get_dial_info', 'get_easing_config').
+        :param default_ttl: float, TTL for endpoints not listed in ttls. A TTL
+            of 0 disables caching but concurrent reads are still coalesced.
+
+        Cached responses may be up to one TTL stale; call invalidate() after
+        writes whose effect must be visible to the next read.
+        """
+        self._lock = threading.Lock()
+        self._store = _TTLStore(ttls, default_ttl)
+        self._flight = SingleFlight()
+
+    def get(self, endpoint: str, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Return a cached value or run fn, coalescing concurrent identical calls.
+
+        :param endpoint: str, endpoint name used to select the TTL.
+        :param key: Hashable, identifies the request (e.g. the request URI).
+        :param fn: Callable, zero-argument function performing the request.
+        :return: the cached or freshly fetched value.
+        """
+        with self._lock:
+            hit, value = self._store.lookup(endpoint, key)
+        if hit:
+            return value
+
+        def fetch():
+            value = fn()
+            with self._lock:
+                self._store.store(endpoint, key, value)
+            return value
+
+        return self._flight.do((endpoint, key), fetch)
+
+    def invalidate(self, endpoint: str | None = None) -> None:
+        """
+        Drop cached entries.
+
+        :param endpoint: str, only drop entries for this endpoint; all if None.
+        """
+        with self._lock:
+            self._store.invalidate(endpoint)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return hit/miss/coalesced counters.
+
+        :return: dict[str, int]
+        """
+        with self._lock:
+            return {'hits': self._store.hits, 'misses': self._store.misses,
+                    'coalesced': self._flight.coalesced}
+
+
+class AsyncReadCache:
+    def __init__(self, ttls: dict[str, float] | None = None, default_ttl: float = 0.0):
+        """
+        asyncio counterpart of ReadCache for use from a single event loop.
+
+        :param ttls: dict[str, float], per-endpoint TTL in seconds.
+        :param default_ttl: float, TTL for endpoints not listed in ttls.
+
+        The blocking VUDial read methods can be awaited through it with
+        asyncio.to_thread, e.g.
+        ``await cache.get('list_dials', 'list', lambda: asyncio.to_thread(dial.list_dials))``.
+        """
+        self._store = _TTLStore(ttls, default_ttl)
+        self._flight = AsyncSingleFlight()
+
+    async def get(self, endpoint: str, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return a cached value or await fn, coalescing concurrent identical calls.
+
+        :param endpoint: str, endpoint name used to select the TTL.
+        :param key: Hashable, identifies the request.
+        :param fn: Callable, zero-argument function returning an awaitable.
+        :return: the cached or freshly fetched value.
+        """
+        hit, value = self._store.lookup(endpoint, key)
+        if hit:
+            return value
+
+        async def fetch():
+            value = await fn()
+            self._store.store(endpoint, key, value)
+            return value
+
+        return await self._flight.do((endpoint, key), fetch)
+
+    def invalidate(self, endpoint: str | None = None) -> None:
+        """
+        Drop cached entries.
+
+        :param endpoint: str, only drop entries for this endpoint; all if None.
+        """
+        self._store.invalidate(endpoint)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return hit/miss/coalesced counters.
+
+        :return: dict[str, int]
+        """
+        return {'hits': self._store.hits, 'misses': self._store.misses,
+                'coalesced': self._flight.coalesced}
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from .ratelimit import RateLimiter
+from .vudialsclient import VUDial, response_data
+
+if TYPE_CHECKING:
+    import requests
+
+LOGGER = logging.getLogger(__name__)
+
+
+class DesiredState:
+    def __init__(self):
+        """
+        What one dial should show. Fields left as None are not managed.
+        """
+        self.value: int | None = None
+        self.color: tuple[int, int, int] | None = None
+        self.dial_easing: tuple[int, int] | None = None
+        self.backlight_easing: tuple[int, int] | None = None
+        self.name: str | None = None
+        self.background: str | None = None
+
+
+class DialReconciler:
+    def __init__(self, client: VUDial, interval: float = 5.0, calls_per_second: float = 20.0):
+        """
+        Continuously converge dials on a declared desired state.
+
+        Each pass reads every managed dial with get_dial_info (plus
+        get_dial_image_crc when a background is managed), compares it with the
+        desired state and sends only the calls needed to correct the drift.
+        All requests go through one token-bucket rate limiter.
+
+        :param client: VUDial, the client used for reads and corrections.
+        :param interval: float, seconds between passes when run in the background.
+        :param calls_per_second: float, global request budget; 0 disables limiting.
+        """
+        self.client = client
+        self.interval = interval
+        self.limiter = RateLimiter(calls_per_second, burst=max(1, int(calls_per_second)))
+        self._desired: dict[str, DesiredState] = {}
+        self._image_crc: dict[str, tuple[str, object]] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def set_desired(self, uid: str, value: int | None = None, color: tuple[int, int, int] | None = None,
+                    dial_easing: tuple[int, int] | None = None,
+                    backlight_easing: tuple[int, int] | None = None,
+                    name: str | None = None, background: str | None = None) -> None:
+        """
+        Declare (part of) the desired state of a dial and wake the reconciler.
+
+        :param uid: str, the uid of the vu-dial.
+        :param value: int, dial value (0-100).
+        :param color: tuple[int, int, int], backlight (red, green, blue), 0-100 each.
+        :param dial_easing: tuple[int, int], dial easing (period, step).
+        :param backlight_easing: tuple[int, int], backlight easing (period, step).
+        :param name: str, dial name.
+        :param background: str, path to the background image file.
+        """
+        with self._lock:
+            state = self._desired.setdefault(uid, DesiredState())
+            if value is not None:
+                state.value = int(value)
+            if color is not None:
+                state.color = tuple(int(c) for c in color)
+            if dial_easing is not None:
+                state.dial_easing = tuple(int(e) for e in dial_easing)
+            if backlight_easing is not None:
+                state.backlight_easing = tuple(int(e) for e in backlight_easing)
+            if name is not None:
+                state.name = name
+            if background is not None:
+                state.background = background
+        self._wake.set()
+
+    def forget(self, uid: str) -> None:
+        """
+        Stop managing a dial.
+
+        :param uid: str, the uid of the vu-dial.
+        """
+        with self._lock:
+            self._desired.pop(uid, None)
+            self._image_crc.pop(uid, None)
+
+    def _call(self, fn: Callable, *args) -> requests.Response:
+        self.limiter.acquire()
+        return fn(*args)
+
+    def _diff(self, uid: str, want: DesiredState, info: dict) -> list[tuple[str, Callable, tuple]]:
+        c = self.client
+        fixes = []
+        if want.name is not None and info.get('dial_name') != want.name:
+            fixes.append(('name', c.set_dial_name, (uid, want.name)))
+        easing = info.get('easing')
+        if (want.dial_easing or want.backlight_easing) and not isinstance(easing, dict):
+            easing = response_data(self._call(c.get_easing_config, uid)) or {}
+        if want.dial_easing is not None and \
+                (easing.get('dial_period'), easing.get('dial_step')) != want.dial_easing:
+            fixes.append(('dial_easing', c.set_dial_easing, (uid, *want.dial_easing)))
+        if want.backlight_easing is not None and \
+                (easing.get('backlight_period'), easing.get('backlight_step')) != want.backlight_easing:
+            fixes.append(('backlight_easing', c.set_backlight_easing, (uid, *want.backlight_easing)))
+        if want.value is not None and info.get('value') != want.value:
+            fixes.append(('value', c.set_dial_value, (uid, want.value)))
+        if want.color is not None:
+            bl = info.get('backlight') or {}
+            if (bl.get('red'), bl.get('green'), bl.get('blue')) != want.color:
+                fixes.append(('color', c.set_dial_color, (uid, *want.color)))
+        if want.background is not None:
+            known = self._image_crc.get(uid)
+            crc = response_data(self._call(c.get_dial_image_crc, uid))
+            if known is None or known != (want.background, crc):
+                fixes.append(('background', c.set_dial_background, (uid, want.background)))
+        return fixes
+
+    def reconcile_once(self) -> dict[str, list[str]]:
+        """
+        Run one read/compare/correct pass over every managed dial.
+
+        Reads for all dials are issued first, then the corrections as one
+        batch. A failure on one dial is logged and does not stop the others.
+
+        :return: dict[str, list[str]], uid to the names of the corrected fields;
+            a failed dial maps to ['error'].
+        """
+        with self._lock:
+            desired = {uid: self._copy(s) for uid, s in self._desired.items()}
+
+        plan: dict[str, list] = {}
+        report: dict[str, list[str]] = {}
+        for uid, want in desired.items():
+            try:
+                info = response_data(self._call(self.client.get_dial_info, uid)) or {}
+                fixes = self._diff(uid, want, info)
+            except Exception as e:
+                LOGGER.warning('Reconcile read failed for dial %s: %s', uid, e)
+                report[uid] = ['error']
+                continue
+            if fixes:
+                plan[uid] = fixes
+
+        for uid, fixes in plan.items():
+            done = []
+            try:
+                for field, fn, args in fixes:
+                    self._call(fn, *args)
+                    done.append(field)
+                    if field == 'background':
+                        crc = response_data(self._call(self.client.get_dial_image_crc, uid))
+                        with self._lock:
+                            self._image_crc[uid] = (args[1], crc)
+            except Exception as e:
+                # Includes local errors such as an unreadable background file.
+                LOGGER.warning('Reconcile correction failed for dial %s: %s', uid, e)
+                done.append('error')
+            report[uid] = done
+        return report
+
+    @staticmethod
+    def _copy(state: DesiredState) -> DesiredState:
+        copy = DesiredState()
+        copy.__dict__.update(state.__dict__)
+        return copy
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                self.reconcile_once()
+            except Exception:
+                LOGGER.exception('Reconcile pass failed')
+            self._wake.wait(self.interval)
+
+    def start(self) -> None:
+        """Reconcile every `interval` seconds, and promptly after set_desired, in a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='vu1-reconciler', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background thread."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,209 @@
+"""
+Record the commands a VUDial sends and replay them later.
+
+The log is append-only and binary: an 8-byte file magic followed by records of
+``<d H H H`` (wall-clock timestamp, uid/endpoint/params byte lengths) and the
+three UTF-8 strings. The API key is never written. Logs are read through mmap,
+so large captures are parsed without loading them into memory.
+"""
+import argparse
+import mmap
+import struct
+import threading
+import time
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, NamedTuple
+from urllib.parse import quote, unquote, urlsplit
+
+if TYPE_CHECKING:
+    from .vudialsclient import VUDial
+
+MAGIC = b'VU1REC\x00\x01'
+_HEADER = struct.Struct('<dHHH')
+
+
+class RecordedCommand(NamedTuple):
+    timestamp: float
+    uid: str
+    endpoint: str
+    params: str
+
+    @property
+    def is_write(self) -> bool:
+        return self.endpoint not in ('list', 'status', 'image/crc', 'easing/get')
+
+
+def parse_command(path_uri: str) -> tuple[str, str, str]:
+    """
+    Split a request URI into (uid, endpoint, params), dropping the API key.
+
+    :param path_uri: str, a URI built by VUUtil.get_uri.
+    :return: tuple[str, str, str], uid ('' for dial/list), endpoint relative to
+        the dial (e.g. 'set', 'easing/dial') and the remaining query string.
+    """
+    url = urlsplit(path_uri)
+    parts = url.path.split('/api/v0/dial/', 1)[-1].split('/')
+    if parts == ['list']:
+        uid, endpoint = '', 'list'
+    else:
+        uid, endpoint = unquote(parts[0]), '/'.join(parts[1:])
+    params = '&'.join(p for p in url.query.split('&') if p and not p.startswith('key='))
+    return uid, endpoint, params
+
+
+class CommandRecorder:
+    def __init__(self, path: str, flush_every: int = 64):
+        """
+        Append every command sent through a VUDial to a binary log.
+
+        Attach it with ``VUDial(..., recorder=CommandRecorder(path))``.
+
+        :param path: str, log file; created if missing, appended to otherwise.
+        :param flush_every: int, flush the file buffer after this many records.
+        """
+        self.path = path
+        self.flush_every = max(1, flush_every)
+        self.count = 0
+        self._lock = threading.Lock()
+        self._file = open(path, 'ab')
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+
+    def record(self, path_uri: str, files: dict | None = None) -> None:
+        """
+        Append one command.
+
+        :param path_uri: str, the request URI.
+        :param files: dict, upload files; only the file name is recorded.
+        """
+        uid, endpoint, params = parse_command(path_uri)
+        if files:
+            fileobj = next(iter(files.values()), None) if isinstance(files, dict) else None
+            name = getattr(fileobj, 'name', '')
+            params = f'imgfile={quote(name, safe="") if isinstance(name, str) else ""}'
+        u, e, p = uid.encode(), endpoint.encode(), params.encode()
+        data = _HEADER.pack(time.time(), len(u), len(e), len(p)) + u + e + p
+        with self._lock:
+            self._file.write(data)
+            self.count += 1
+            if self.count % self.flush_every == 0:
+                self._file.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def __enter__(self) -> 'CommandRecorder':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_log(path: str) -> Iterator[RecordedCommand]:
+    """
+    Iterate over the commands in a log.
+
+    :param path: str, a log written by CommandRecorder.
+    :return: Iterator[RecordedCommand]
+    """
+    with open(path, 'rb') as f:
+        if f.seek(0, 2) <= len(MAGIC):
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            if m[:len(MAGIC)] != MAGIC:
+                raise ValueError(f'{path} is not a vu-dial command log')
+            pos, end = len(MAGIC), len(m)
+            while pos + _HEADER.size <= end:
+                ts, lu, le, lp = _HEADER.unpack_from(m, pos)
+                pos += _HEADER.size
+                if pos + lu + le + lp > end:
+                    break  # truncated tail from an interrupted writer
+                uid = m[pos:pos + lu].decode()
+                pos += lu
+                endpoint = m[pos:pos + le].decode()
+                pos += le
+                params = m[pos:pos + lp].decode()
+                pos += lp
+                yield RecordedCommand(ts, uid, endpoint, params)
+
+
+def replay(path: str, client: 'VUDial', speed: float = 1.0, writes_only: bool = True,
+           image: str | None = None) -> dict[str, float]:
+    """
+    Re-send recorded commands through a client, preserving their timing.
+
+    :param path: str, a log written by CommandRecorder.
+    :param client: VUDial, the client to send through (real server or simulator).
+    :param speed: float, time scale; 2.0 replays twice as fast, 0 sends
+        back to back with no delays.
+    :param writes_only: bool, skip recorded reads.
+    :param image: str, file uploaded for recorded image/set commands; they
+        are skipped if None.
+    :return: dict[str, float], counts of sent, skipped and failed commands and
+        the elapsed wall time.
+    """
+    import requests
+
+    stats = {'sent': 0, 'skipped': 0, 'errors': 0, 'elapsed': 0.0}
+    start = time.perf_counter()
+    first = None
+    for cmd in read_log(path):
+        if writes_only and not cmd.is_write:
+            stats['skipped'] += 1
+            continue
+        if first is None:
+            first = cmd.timestamp
+        if speed > 0:
+            wait = (cmd.timestamp - first) / speed - (time.perf_counter() - start)
+            if wait > 0:
+                time.sleep(wait)
+        try:
+            if cmd.endpoint == 'image/set':
+                if image is None:
+                    stats['skipped'] += 1
+                    continue
+                client.set_dial_background(cmd.uid, image)
+            else:
+                api_call = 'dial/list' if cmd.endpoint == 'list' else f'dial/{quote(cmd.uid, safe="")}/{cmd.endpoint}'
+                params = f'&{cmd.params}' if cmd.params else ''
+                client.send_http_request(client.get_uri(client.server_url, client.key, api_call, params), None)
+            stats['sent'] += 1
+        except requests.RequestException:
+            stats['errors'] += 1
+    stats['elapsed'] = time.perf_counter() - start
+    return stats
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description='Inspect or replay a vu-dial command log.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    dump = sub.add_parser('dump', help='print the log as tab-separated lines')
+    dump.add_argument('log')
+    rep = sub.add_parser('replay', help='replay the log against a server')
+    rep.add_argument('log')
+    rep.add_argument('--server', required=True, help='HOST:PORT')
+    rep.add_argument('--api-key', required=True)
+    rep.add_argument('--speed', type=float, default=1.0)
+    rep.add_argument('--include-reads', action='store_true')
+    rep.add_argument('--image', help='file to upload for recorded image/set commands')
+    args = parser.parse_args(argv)
+
+    from .vudialsclient import VUDial
+
+    if args.command == 'dump':
+        for cmd in read_log(args.log):
+            print(f'{cmd.timestamp:.6f}\t{cmd.uid}\t{cmd.endpoint}\t{cmd.params}')
+        return
+    host, port = args.server.rsplit(':', 1)
+    print(replay(args.log, VUDial(host, int(port), args.api_key), args.speed,
+                 not args.include_reads, args.image))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
+
+from .errors import OutOfScope
+from .vudialsclient import response_data
+
+if TYPE_CHECKING:
+    from .vudialsclient import VUAdmin, VUDial
+
+
+# Returned by a scope loader when the key no longer exists; allows no dial.
+REVOKED = object()
+
+
+def parse_dials(dials: str | Iterable[str] | None) -> frozenset[str] | None:
+    """
+    Normalize a key's dial list as found in admin data.
+
+    :param dials: str (';'-separated, as sent to and listed by the server),
+        iterable of uids, or None.
+    :return: frozenset[str], or None when the key may use every dial: None,
+        '*' or 'all', or an empty string or iterable (the server's own
+        convention, so DialScope([]) matches update_api_key(..., [])).
+    """
+    if dials is None:
+        return None
+    if isinstance(dials, str):
+        dials = dials.split(';')
+    uids = frozenset(d for d in dials if d)
+    if not uids or uids & {'*', 'all'}:
+        return None
+    return uids
+
+
+class DialScope:
+    def __init__(self, uids: str | Iterable[str] | None = None,
+                 loader: Callable[[], str | Iterable[str] | None] | None = None):
+        """
+        The set of dials an API key may use, checked locally in O(1).
+
+        The set is replaced as a whole on update, so checks never take a lock.
+
+        :param uids: the allowed uids (see parse_dials); None allows every dial.
+        :param loader: Callable, optional; returns a fresh uid list for
+            refresh(), or REVOKED when the key no longer exists.
+        """
+        self.loader = loader
+        self.allowed = parse_dials(uids)
+
+    @classmethod
+    def from_list_dials(cls, client: VUDial) -> DialScope:
+        """
+        Scope a key to the dials its list_dials currently returns.
+
+        Dials connected later are rejected until refresh() is called.
+
+        :param client: VUDial, using the key to scope.
+        :return: DialScope
+        """
+        def load() -> list[str]:
+            return [d['uid'] for d in response_data(client.list_dials()) or []]
+
+        return cls(load(), load)
+
+    @classmethod
+    def from_admin(cls, admin: VUAdmin, key: str, watch: bool = True) -> DialScope:
+        """
+        Scope a key to the dials listed for it by list_api_keys.
+
+        :param admin: VUAdmin
+        :param key: str, the API key to scope.
+        :param watch: bool, update the scope when admin.update_api_key or
+            admin.remove_api_key changes this key.
+        :return: DialScope
+        """
+        def load() -> str | list[str] | None | object:
+            for entry in response_data(admin.list_api_keys()) or []:
+                if entry.get('key') == key:
+                    return entry.get('dials')
+            # An unknown key is rejected by the server for every dial.
+            return REVOKED
+
+        scope = cls(loader=load)
+        scope.refresh()
+        if watch:
+            admin.watch_scope(key, scope)
+        return scope
+
+    def allows(self, uid: str) -> bool:
+        allowed = self.allowed
+        return allowed is None or uid in allowed
+
+    __contains__ = allows
+
+    def check(self, uid: str) -> None:
+        """
+        Raise OutOfScope if the key may not use the dial.
+
+        :param uid: str, the uid of the vu-dial.
+        """
+        allowed = self.allowed
+        if allowed is not None and uid not in allowed:
+            raise OutOfScope(f'Dial {uid} is outside the API key scope', None, uid)
+
+    def update(self, uids: str | Iterable[str] | None) -> None:
+        """
+        Replace the allowed set.
+
+        :param uids: the allowed uids (see parse_dials); None allows every dial.
+        """
+        self.allowed = parse_dials(uids)
+
+    def revoke(self) -> None:
+        """Reject every dial, e.g. after the key was removed."""
+        self.allowed = frozenset()
+
+    def refresh(self) -> None:
+        """Reload the allowed set from the source the scope was created from."""
+        if self.loader is None:
+            raise ValueError("This scope has no loader to refresh from")
+        uids = self.loader()
+        if uids is REVOKED:
+            self.revoke()
+        else:
+            self.update(uids)
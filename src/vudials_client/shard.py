@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import pickle
+import queue
+import threading
+import zlib
+from concurrent.futures import Future
+from typing import Any
+
+from .transport import LiteResponse
+from .vudialsclient import VUDial
+
+DEFAULT_SERVER = 'default'
+
+
+def shard_of(server: str, uid: str, shards: int) -> int:
+    """
+    Stable shard index for a dial, identical in every process.
+
+    :param server: str, the server name.
+    :param uid: str, the uid of the vu-dial.
+    :param shards: int, the number of shards.
+    :return: int
+    """
+    return zlib.crc32(f'{server}\0{uid}'.encode()) % shards
+
+
+def _portable(exc: Exception) -> Exception:
+    try:
+        pickle.dumps(exc)
+        return exc
+    except Exception:
+        return RuntimeError(f'{type(exc).__name__}: {exc}')
+
+
+def _worker(commands, results, servers: dict[str, dict], threads: int) -> None:
+    # Runs in the child process. Each dial is always handled by the same
+    # thread, so commands to one dial are sent in submission order.
+    clients = {name: VUDial(**{'pool_size': threads, **kwargs}) for name, kwargs in servers.items()}
+    for client in clients.values():
+        client.raise_errors = False
+    send_lock = threading.Lock()
+    inboxes = [queue.SimpleQueue() for _ in range(threads)]
+
+    def run(inbox: queue.SimpleQueue) -> None:
+        while True:
+            item = inbox.get()
+            if item is None:
+                return
+            seq, server, method, uid, args = item
+            try:
+                r = getattr(clients[server], method)(uid, *args)
+                reply = (seq, True, (r.url, r.status_code, r.reason,
+                                     {k.lower(): v for k, v in r.headers.items()}, r.content))
+            except Exception as e:
+                reply = (seq, False, _portable(e))
+            with send_lock:
+                results.send(reply)
+
+    pool = [threading.Thread(target=run, args=(inbox,), daemon=True) for inbox in inboxes]
+    for t in pool:
+        t.start()
+    try:
+        while True:
+            batch = commands.recv()
+            if batch is None:
+                break
+            for item in batch:
+                inboxes[zlib.crc32(item[3].encode()) % threads].put(item)
+    except EOFError:
+        pass
+    for inbox in inboxes:
+        inbox.put(None)
+    for t in pool:
+        t.join()
+    for client in clients.values():
+        client.close()
+    results.close()
+
+
+def _settle(future: Future, result: Any = None, error: BaseException | None = None) -> None:
+    # The caller may have cancelled while the command was in flight.
+    if not future.set_running_or_notify_cancel():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+class _Shard:
+    def __init__(self, ctx, servers: dict[str, dict], threads: int):
+        cmd_recv, self.commands = ctx.Pipe(duplex=False)
+        self.results, res_send = ctx.Pipe(duplex=False)
+        self.process = ctx.Process(target=_worker, args=(cmd_recv, res_send, servers, threads), daemon=True)
+        self.process.start()
+        # Keep only our ends open, so each side sees EOF when the other exits.
+        cmd_recv.close()
+        res_send.close()
+        self.lock = threading.Lock()
+        self.futures: dict[int, Future] = {}
+        self.dead = False
+        self.reader = threading.Thread(target=self._read, daemon=True)
+        self.reader.start()
+
+    def send(self, batch: list[tuple[tuple, Future]]) -> None:
+        with self.lock:
+            if self.dead:
+                raise RuntimeError("Worker process has exited")
+            for item, future in batch:
+                self.futures[item[0]] = future
+            self.commands.send([item for item, _ in batch])
+
+    def stop(self) -> None:
+        with self.lock:
+            if not self.dead:
+                try:
+                    self.commands.send(None)
+                except OSError:
+                    pass
+
+    def fail_pending(self) -> None:
+        with self.lock:
+            self.dead = True
+            pending = list(self.futures.values())
+            self.futures.clear()
+        for future in pending:
+            _settle(future, error=RuntimeError("Worker process exited before replying"))
+
+    def _read(self) -> None:
+        while True:
+            try:
+                seq, ok, payload = self.results.recv()
+            except (EOFError, OSError):
+                self.fail_pending()
+                return
+            with self.lock:
+                future = self.futures.pop(seq)
+            if not ok:
+                _settle(future, error=payload)
+                continue
+            response = LiteResponse(*payload)
+            if response.status_code >= 400:
+                try:
+                    response.raise_for_status()
+                except Exception as e:
+                    _settle(future, error=e)
+                    continue
+            _settle(future, response)
+
+
+class ShardedDispatcher:
+    def __init__(self, servers: dict[str, dict], processes: int = 2, threads: int = 4,
+                 start_method: str = 'spawn'):
+        """
+        Spread dial commands over worker processes to get past the GIL.
+
+        Dials are partitioned across processes by a stable hash of (server,
+        uid); each process builds its own pooled VUDial per server and sends
+        with `threads` threads, one per sub-partition, so commands to one
+        dial keep their order. Commands travel over pipes in batches and
+        results come back as LiteResponse objects.
+
+        :param servers: dict[str, dict], server name to VUDial keyword
+            arguments (server_address, server_port, api_key, ...); values
+            must be picklable.
+        :param processes: int, worker processes.
+        :param threads: int, sending threads and pooled connections per process.
+        :param start_method: str, multiprocessing start method. 'spawn' is
+            safe for callers that already run threads.
+        """
+        if not servers:
+            raise ValueError("At least one server is required")
+        if processes < 1 or threads < 1:
+            raise ValueError("processes and threads must be at least 1")
+        self.servers = dict(servers)
+        self._seq = itertools.count()
+        ctx = multiprocessing.get_context(start_method)
+        self._shards = [_Shard(ctx, self.servers, threads) for _ in range(processes)]
+        self._closed = False
+
+    @classmethod
+    def for_server(cls, server_address: str, server_port: int, api_key: str, **kwargs: Any) -> ShardedDispatcher:
+        """
+        Shortcut for a single server, named 'default'.
+
+        :return: ShardedDispatcher
+        """
+        return cls({DEFAULT_SERVER: {'server_address': server_address, 'server_port': server_port,
+                                     'api_key': api_key}}, **kwargs)
+
+    def _command(self, method: str, uid: str, args: tuple, server: str) -> tuple[int, tuple]:
+        if self._closed:
+            raise RuntimeError("Dispatcher is closed")
+        if method.startswith('_') or not callable(getattr(VUDial, method, None)):
+            raise ValueError(f"Unknown client method: {method!r}")
+        if server not in self.servers:
+            raise ValueError(f"Unknown server: {server!r}")
+        shard = shard_of(server, uid, len(self._shards))
+        return shard, (next(self._seq), server, method, uid, args)
+
+    def submit(self, method: str, uid: str, *args: Any, server: str = DEFAULT_SERVER) -> Future:
+        """
+        Send one VUDial call to the dial's shard.
+
+        :param method: str, a VUDial method taking uid first, e.g. 'set_dial_value'.
+        :param uid: str, the uid of the vu-dial.
+        :param args: remaining positional arguments of the method.
+        :param server: str, the server name.
+        :return: Future resolving to a LiteResponse, or raising like VUDial.
+        """
+        shard, item = self._command(method, uid, args, server)
+        future: Future = Future()
+        self._shards[shard].send([(item, future)])
+        return future
+
+    def submit_many(self, calls: list[tuple], server: str = DEFAULT_SERVER) -> list[Future]:
+        """
+        Send many calls with one pipe write per shard.
+
+        :param calls: list[tuple], (method, uid, *args) tuples.
+        :param server: str, the server name for every call.
+        :return: list[Future], in the order of calls.
+        """
+        # Validate every call before registering any future.
+        commands = [self._command(method, uid, tuple(args), server) for method, uid, *args in calls]
+        batches: dict[int, list] = {}
+        futures = []
+        for shard, item in commands:
+            future: Future = Future()
+            batches.setdefault(shard, []).append((item, future))
+            futures.append(future)
+        for shard, batch in batches.items():
+            self._shards[shard].send(batch)
+        return futures
+
+    def pending(self) -> int:
+        """
+        Commands submitted but not finished.
+
+        :return: int
+        """
+        return sum(len(shard.futures) for shard in self._shards)
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Let the workers finish queued commands, then stop them.
+
+        :param timeout: float, seconds to wait for each worker.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        for shard in self._shards:
+            shard.stop()
+        for shard in self._shards:
+            shard.process.join(timeout)
+            shard.reader.join(timeout)
+            shard.commands.close()
+            shard.results.close()
+            shard.fail_pending()
+
+    def __enter__(self) -> ShardedDispatcher:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
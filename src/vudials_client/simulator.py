@@ -0,0 +1,420 @@
+"""
+A local, stateful stand-in for the VU1 dial server.
+
+Implements the endpoints used by VUDial and VUAdmin over real HTTP so client
+code can be exercised under real concurrency, latency and connection limits
+without hardware. Run it directly with ``python -m vudials_client.simulator``.
+"""
+import argparse
+import email
+import json
+import random
+import secrets
+import threading
+import time
+import zlib
+from email import policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+DEFAULT_EASING_PERIOD = 50
+DEFAULT_EASING_STEP = 5
+
+
+class SimulatedDial:
+    def __init__(self, uid: str, name: str = ''):
+        """
+        State of one simulated dial.
+
+        Value and backlight move toward their targets by `step` every `period`
+        milliseconds, like the hardware easing, and are evaluated lazily.
+
+        :param uid: str, the dial uid.
+        :param name: str, the initial dial name.
+        """
+        self.uid = uid
+        self.name = name or f'Dial {uid}'
+        self.dial_easing = [DEFAULT_EASING_PERIOD, DEFAULT_EASING_STEP]
+        self.backlight_easing = [DEFAULT_EASING_PERIOD, DEFAULT_EASING_STEP]
+        self.value_target = 0
+        self._value_from = 0
+        self._value_since = time.monotonic()
+        self.backlight_target = [0, 0, 0]
+        self._backlight_from = [0, 0, 0]
+        self._backlight_since = time.monotonic()
+        self.image = b''
+        self.image_file = ''
+
+    @staticmethod
+    def _ease(start: float, target: float, since: float, easing: list[int]) -> int:
+        period, step = easing
+        if period <= 0 or step <= 0:
+            return int(target)
+        ticks = int((time.monotonic() - since) * 1000 // period)
+        moved = min(abs(target - start), ticks * step)
+        return int(start + moved if target >= start else start - moved)
+
+    @property
+    def value(self) -> int:
+        return self._ease(self._value_from, self.value_target, self._value_since, self.dial_easing)
+
+    @property
+    def backlight(self) -> list[int]:
+        return [self._ease(s, t, self._backlight_since, self.backlight_easing)
+                for s, t in zip(self._backlight_from, self.backlight_target)]
+
+    def set_value(self, value: int) -> None:
+        self._value_from = self.value
+        self._value_since = time.monotonic()
+        self.value_target = value
+
+    def set_backlight(self, rgb: list[int]) -> None:
+        self._backlight_from = self.backlight
+        self._backlight_since = time.monotonic()
+        self.backlight_target = rgb
+
+    @property
+    def image_crc(self) -> int:
+        return zlib.crc32(self.image)
+
+    def easing(self) -> dict:
+        return {'dial_period': self.dial_easing[0], 'dial_step': self.dial_easing[1],
+                'backlight_period': self.backlight_easing[0], 'backlight_step': self.backlight_easing[1]}
+
+    def summary(self) -> dict:
+        # Like the real server, report the last commanded value and colour;
+        # the eased physical position is exposed separately in status().
+        r, g, b = self.backlight_target
+        return {'uid': self.uid, 'dial_name': self.name, 'value': self.value_target,
+                'backlight': {'red': r, 'green': g, 'blue': b}, 'image_file': self.image_file}
+
+    def status(self) -> dict:
+        info = self.summary()
+        r, g, b = self.backlight
+        info.update({'position': self.value, 'backlight_position': {'red': r, 'green': g, 'blue': b},
+                     'easing': self.easing(), 'image_crc': self.image_crc, 'fw_version': 'sim',
+                     'hw_version': 'sim', 'protocol_version': 'sim'})
+        return info
+
+
+class _SimError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class VU1Simulator:
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, api_key: str = 'sim-api-key',
+                 admin_key: str = 'sim-admin-key', dials: int | list[str] = 4,
+                 latency: float = 0.0, jitter: float = 0.0, failure_rate: float = 0.0,
+                 max_connections: int | None = None, seed: int | None = None, etags: bool = False):
+        """
+        Initialize the simulator; call start() to begin serving.
+
+        :param host: str, the interface to bind.
+        :param port: int, the port to bind; 0 picks a free port.
+        :param api_key: str, an API key with access to every dial.
+        :param admin_key: str, the admin key.
+        :param dials: int | list[str], number of dials to create, or their uids.
+        :param latency: float, seconds added to every response.
+        :param jitter: float, extra random latency in [0, jitter) seconds.
+        :param failure_rate: float, probability in [0, 1] of answering 500.
+        :param max_connections: int, concurrent requests served before
+            answering 503; unlimited if None.
+        :param seed: int, seeds the latency/failure random generator.
+        :param etags: bool, send an ETag with every successful GET and answer
+            304 Not Modified when If-None-Match matches it.
+        """
+        uids = [f'SIM{i:04d}' for i in range(dials)] if isinstance(dials, int) else list(dials)
+        self.lock = threading.Lock()
+        self.dials: dict[str, SimulatedDial] = {uid: SimulatedDial(uid) for uid in uids}
+        self.unprovisioned: dict[str, SimulatedDial] = {}
+        self.admin_key = admin_key
+        self._api_key = api_key
+        self.api_keys: dict[str, dict] = {api_key: {'name': 'default', 'dials': None}}
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.max_connections = max_connections
+        self.etags = etags
+        self.request_counts: dict[str, int] = {}
+        self.connections_accepted = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._random = random.Random(seed)
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def address(self) -> str:
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def api_key(self) -> str:
+        return self._api_key
+
+    def start(self) -> 'VU1Simulator':
+        """Serve requests from a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,),
+                                        name='vu1-simulator', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def serve_forever(self) -> None:
+        """Serve requests from the calling thread until interrupted."""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def __enter__(self) -> 'VU1Simulator':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def attach_dial(self, uid: str) -> None:
+        """Plug in new hardware; it appears in dial/list after provisioning."""
+        with self.lock:
+            self.unprovisioned[uid] = SimulatedDial(uid)
+
+    def detach_dial(self, uid: str) -> None:
+        """Unplug a dial."""
+        with self.lock:
+            self.dials.pop(uid, None)
+            self.unprovisioned.pop(uid, None)
+
+    def reset_counts(self) -> None:
+        """Zero the per-endpoint request counters."""
+        with self.lock:
+            self.request_counts.clear()
+
+    # -- request handling ---------------------------------------------------
+
+    def _handler_class(self):
+        sim = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body go out in separate writes; without TCP_NODELAY
+            # keep-alive clients stall on delayed ACKs.
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with sim.lock:
+                    sim.connections_accepted += 1
+
+            def do_GET(self):
+                sim._serve(self, None)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                sim._serve(self, self.rfile.read(length) if length else b'')
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def _serve(self, handler: BaseHTTPRequestHandler, body: bytes | None) -> None:
+        with self.lock:
+            if self.max_connections is not None and self.in_flight >= self.max_connections:
+                busy = True
+            else:
+                busy = False
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        if busy:
+            self._reply(handler, 503, {'status': 'fail', 'message': 'Server busy', 'data': None})
+            return
+        try:
+            delay = self.latency + (self._random.random() * self.jitter if self.jitter else 0.0)
+            if delay:
+                time.sleep(delay)
+            if self.failure_rate and self._random.random() < self.failure_rate:
+                raise _SimError(500, 'Simulated failure')
+            url = urlsplit(handler.path)
+            params = {k: v[0] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+            segments = [unquote(s) for s in url.path.split('/')[3:]]
+            data = self._dispatch(segments, params, handler, body)
+            status, payload = 200, {'status': 'ok', 'message': '', 'data': data}
+        except _SimError as e:
+            status, payload = e.status, {'status': 'fail', 'message': e.message, 'data': None}
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+        self._reply(handler, status, payload, etag=self.etags and status == 200 and body is None)
+
+    @staticmethod
+    def _reply(handler: BaseHTTPRequestHandler, status: int, payload: dict, etag: bool = False) -> None:
+        raw = json.dumps(payload).encode()
+        if etag:
+            tag = f'"{zlib.crc32(raw):08x}"'
+            if handler.headers.get('If-None-Match') == tag:
+                handler.send_response(304)
+                handler.send_header('ETag', tag)
+                handler.end_headers()
+                return
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json')
+        if etag:
+            handler.send_header('ETag', tag)
+        handler.send_header('Content-Length', str(len(raw)))
+        handler.end_headers()
+        handler.wfile.write(raw)
+
+    def _count(self, endpoint: str) -> None:
+        self.request_counts[endpoint] = self.request_counts.get(endpoint, 0) + 1
+
+    def _dispatch(self, seg: list[str], params: dict, handler, body: bytes | None):
+        if not handler.path.startswith('/api/v0/'):
+            raise _SimError(404, 'Not found')
+        with self.lock:
+            if seg[:1] == ['admin'] or seg == ['dial', 'provision']:
+                endpoint = '/'.join(seg)
+                self._count(endpoint)
+                if params.get('admin_key') != self.admin_key:
+                    raise _SimError(401, 'Invalid admin key')
+                return self._admin(endpoint, params)
+
+            endpoint = 'dial/list' if seg == ['dial', 'list'] else 'dial/' + '/'.join(seg[2:])
+            self._count(endpoint)
+            key = self.api_keys.get(params.get('key'))
+            if key is None:
+                raise _SimError(401, 'Invalid API key')
+            if endpoint == 'dial/list':
+                return [d.summary() for uid, d in self.dials.items()
+                        if key['dials'] is None or uid in key['dials']]
+            if len(seg) < 3 or seg[0] != 'dial':
+                raise _SimError(404, 'Not found')
+            dial = self.dials.get(seg[1])
+            if dial is None:
+                raise _SimError(404, f'Dial {seg[1]} not found')
+            if key['dials'] is not None and dial.uid not in key['dials']:
+                raise _SimError(403, 'API key has no access to this dial')
+            return self._dial(endpoint, dial, params, handler, body)
+
+    @staticmethod
+    def _int(params: dict, name: str, low: int, high: int) -> int:
+        try:
+            value = int(params[name])
+        except (KeyError, ValueError):
+            raise _SimError(400, f'Missing or invalid parameter: {name}')
+        if not low <= value <= high:
+            raise _SimError(400, f'Parameter {name} out of range')
+        return value
+
+    def _dial(self, endpoint: str, dial: SimulatedDial, params: dict, handler, body: bytes | None):
+        if endpoint == 'dial/status':
+            return dial.status()
+        if endpoint == 'dial/set':
+            dial.set_value(self._int(params, 'value', 0, 100))
+            return None
+        if endpoint == 'dial/backlight':
+            dial.set_backlight([self._int(params, c, 0, 100) for c in ('red', 'green', 'blue')])
+            return None
+        if endpoint == 'dial/name':
+            if not params.get('name'):
+                raise _SimError(400, 'Missing or invalid parameter: name')
+            dial.name = params['name']
+            return None
+        if endpoint == 'dial/reload':
+            return None
+        if endpoint in ('dial/easing/dial', 'dial/easing/backlight'):
+            easing = [self._int(params, 'period', 0, 100000), self._int(params, 'step', 0, 100)]
+            if endpoint.endswith('dial'):
+                dial.dial_easing = easing
+            else:
+                dial.backlight_easing = easing
+            return None
+        if endpoint == 'dial/easing/get':
+            return dial.easing()
+        if endpoint == 'dial/image/crc':
+            return dial.image_crc
+        if endpoint == 'dial/image/set':
+            if body is None:
+                raise _SimError(405, 'Image upload requires POST')
+            raw = f"Content-Type: {handler.headers.get('Content-Type', '')}\r\n\r\n".encode() + body
+            for part in email.message_from_bytes(raw, policy=policy.HTTP).iter_parts():
+                if part.get_param('name', header='content-disposition') == 'imgfile':
+                    dial.image = part.get_payload(decode=True) or b''
+                    dial.image_file = part.get_filename() or ''
+                    return None
+            raise _SimError(400, 'Missing imgfile')
+        raise _SimError(404, 'Not found')
+
+    def _admin(self, endpoint: str, params: dict):
+        if endpoint == 'dial/provision':
+            provisioned = list(self.unprovisioned)
+            self.dials.update(self.unprovisioned)
+            self.unprovisioned.clear()
+            return provisioned
+        if endpoint == 'admin/keys/list':
+            return [{'key': k, 'name': v['name'],
+                     'dials': '*' if v['dials'] is None else ';'.join(sorted(v['dials']))}
+                    for k, v in self.api_keys.items()]
+        if endpoint == 'admin/keys/create':
+            new_key = secrets.token_hex(16)
+            self.api_keys[new_key] = {'name': params.get('name', ''),
+                                      'dials': self._dial_set(params.get('dials', ''))}
+            return new_key
+        if endpoint == 'admin/keys/update':
+            target = params.get('key')
+            if target not in self.api_keys:
+                raise _SimError(404, 'Key not found')
+            self.api_keys[target] = {'name': params.get('name', ''),
+                                     'dials': self._dial_set(params.get('dials', ''))}
+            return None
+        if endpoint == 'admin/keys/remove':
+            if self.api_keys.pop(params.get('key'), None) is None:
+                raise _SimError(404, 'Key not found')
+            return None
+        raise _SimError(404, 'Not found')
+
+    @staticmethod
+    def _dial_set(dials: str) -> set[str] | None:
+        uids = {d for d in dials.split(';') if d}
+        return None if not uids or uids & {'*', 'all'} else uids
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description='Run a local VU1 dial server simulator.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5340)
+    parser.add_argument('--api-key', default='sim-api-key')
+    parser.add_argument('--admin-key', default='sim-admin-key')
+    parser.add_argument('--dials', type=int, default=4, help='number of simulated dials')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='extra random latency in seconds')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='probability of a 500 response')
+    parser.add_argument('--max-connections', type=int, default=None,
+                        help='concurrent requests served before answering 503')
+    parser.add_argument('--etags', action='store_true', help='support conditional GETs with ETag/If-None-Match')
+    args = parser.parse_args(argv)
+    sim = VU1Simulator(args.host, args.port, args.api_key, args.admin_key, args.dials,
+                       args.latency, args.jitter, args.failure_rate, args.max_connections,
+                       etags=args.etags)
+    print(f'VU1 simulator listening on http://{sim.address}:{sim.port} '
+          f'(api key {args.api_key!r}, admin key {args.admin_key!r}, dials {", ".join(sim.dials)})')
+    try:
+        sim.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+import hashlib
+import threading
+from typing import Any, NamedTuple
+
+from .vudialsclient import VUDial, response_data
+
+
+class Snapshot(NamedTuple):
+    data: Any
+    changed: bool
+
+
+class _Entry:
+    __slots__ = ('etag', 'last_modified', 'digest', 'data')
+
+    def __init__(self, etag: str | None, last_modified: str | None, digest: bytes, data: Any):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.digest = digest
+        self.data = data
+
+
+class SnapshotPoller:
+    def __init__(self, client: VUDial):
+        """
+        Poll list_dials, get_dial_info and get_easing_config, skipping work
+        for payloads that have not changed since the previous poll.
+
+        When the server sent an ETag or Last-Modified header, the next poll
+        sends If-None-Match / If-Modified-Since and a 304 answer reuses the
+        previous data. Otherwise the body is hashed and an identical body is
+        not parsed again. Either way the result says whether anything changed,
+        so callers can skip their own processing too.
+
+        Requests go straight to the server, bypassing the client's read_cache.
+
+        :param client: VUDial
+        """
+        self.client = client
+        self._lock = threading.Lock()
+        self._entries: dict[str, _Entry] = {}
+        self._stats = {'changed': 0, 'not_modified': 0, 'unchanged': 0}
+
+    def _poll(self, api_call: str) -> Snapshot:
+        c = self.client
+        r_uri = c.get_uri(c.server_url, c.key, api_call, '')
+        with self._lock:
+            entry = self._entries.get(r_uri)
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+        r = c.send_http_request(r_uri, None, headers=headers or None)
+        if r.status_code == 304 and entry is not None:
+            with self._lock:
+                self._stats['not_modified'] += 1
+            return Snapshot(entry.data, False)
+        r.raise_for_status()
+
+        digest = hashlib.blake2b(r.content, digest_size=16).digest()
+        etag, last_modified = r.headers.get('etag'), r.headers.get('last-modified')
+        if entry is not None and entry.digest == digest:
+            with self._lock:
+                entry.etag, entry.last_modified = etag, last_modified
+                self._stats['unchanged'] += 1
+            return Snapshot(entry.data, False)
+        data = response_data(r)
+        with self._lock:
+            self._entries[r_uri] = _Entry(etag, last_modified, digest, data)
+            self._stats['changed'] += 1
+        return Snapshot(data, True)
+
+    def list_dials(self) -> Snapshot:
+        """
+        :return: Snapshot, the dial list and whether it changed since the last poll.
+        """
+        if self.client.profiler is not None:
+            self.client.profiler.mark()
+        return self._poll('dial/list')
+
+    def get_dial_info(self, uid: str) -> Snapshot:
+        """
+        :param uid: str, the uid of the vu-dial.
+        :return: Snapshot, the dial status and whether it changed since the last poll.
+        """
+        return self._poll(self.client._dial_path(uid, 'status'))
+
+    def get_easing_config(self, uid: str) -> Snapshot:
+        """
+        :param uid: str, the uid of the vu-dial.
+        :return: Snapshot, the easing config and whether it changed since the last poll.
+        """
+        return self._poll(self.client._dial_path(uid, 'easing/get'))
+
+    def forget(self) -> None:
+        """Drop remembered payloads so the next poll of each endpoint reports a change."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Polls by outcome: 'changed', 'not_modified' (304 from the server) and
+        'unchanged' (same body, parsing skipped).
+
+        :return: dict[str, int]
+        """
+        with self._lock:
+            return dict(self._stats)
@@ -0,0 +1,198 @@
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from .reconciler import DesiredState
+from .vudialsclient import VUDial, response_data
+
+LOGGER = logging.getLogger(__name__)
+
+# Order in which the steps for one dial are applied; the slow image upload
+# goes last so cheap settings land first.
+FIELDS = ('name', 'dial_easing', 'backlight_easing', 'color', 'value', 'background')
+
+
+class TransactionReport:
+    def __init__(self):
+        """
+        Outcome of DialTransaction.commit(). Times are in seconds.
+        """
+        self.ok = False
+        self.applied: list[tuple[str, str]] = []
+        self.skipped: list[tuple[str, str]] = []
+        self.failed: list[tuple[str, str, Exception]] = []
+        self.rolled_back: list[tuple[str, str]] = []
+        self.rollback_failed: list[tuple[str, str, Exception]] = []
+        self.not_restorable: list[tuple[str, str]] = []
+        self.timings: dict[str, float] = {}
+
+    def __repr__(self) -> str:
+        return (f'<TransactionReport ok={self.ok} applied={len(self.applied)} failed={len(self.failed)} '
+                f'rolled_back={len(self.rolled_back)} total={self.timings.get("total", 0.0):.3f}s>')
+
+
+class DialTransaction:
+    def __init__(self, client: VUDial, workers: int = 8):
+        """
+        Configure one or more dials as a unit, rolling back on failure.
+
+        commit() reads the current state of every staged dial, applies the
+        staged settings that differ from it, and if any step fails, restores
+        the steps that did succeed from the captured state. Each dial's
+        settings are sent one at a time in FIELDS order, while different
+        dials are configured in parallel; rollback works the same way.
+        Background images cannot be read back from the server, so an applied
+        background is reported in not_restorable instead of being undone.
+
+        :param client: VUDial
+        :param workers: int, dials configured at once.
+        """
+        self.client = client
+        self.workers = workers
+        self._staged: dict[str, DesiredState] = {}
+
+    def configure(self, uid: str, name: str | None = None, color: tuple[int, int, int] | None = None,
+                  dial_easing: tuple[int, int] | None = None,
+                  backlight_easing: tuple[int, int] | None = None,
+                  value: int | None = None, background: str | None = None) -> 'DialTransaction':
+        """
+        Stage settings for a dial. Fields left as None are not touched.
+
+        :param uid: str, the uid of the vu-dial.
+        :param name: str, dial name.
+        :param color: tuple[int, int, int], backlight (red, green, blue), 0-100 each.
+        :param dial_easing: tuple[int, int], dial easing (period, step).
+        :param backlight_easing: tuple[int, int], backlight easing (period, step).
+        :param value: int, dial value (0-100).
+        :param background: str, path to the background image file.
+        :return: DialTransaction, self.
+        """
+        state = self._staged.setdefault(uid, DesiredState())
+        if name is not None:
+            state.name = name
+        if color is not None:
+            state.color = tuple(int(c) for c in color)
+        if dial_easing is not None:
+            state.dial_easing = tuple(int(e) for e in dial_easing)
+        if backlight_easing is not None:
+            state.backlight_easing = tuple(int(e) for e in backlight_easing)
+        if value is not None:
+            state.value = int(value)
+        if background is not None:
+            state.background = background
+        return self
+
+    def _capture(self, uid: str, want: DesiredState) -> DesiredState:
+        c = self.client
+        info = response_data(c.get_dial_info(uid)) or {}
+        have = DesiredState()
+        have.name = info.get('dial_name')
+        have.value = info.get('value')
+        bl = info.get('backlight')
+        if isinstance(bl, dict):
+            have.color = (bl.get('red'), bl.get('green'), bl.get('blue'))
+        if want.dial_easing is not None or want.backlight_easing is not None:
+            easing = info.get('easing')
+            if not isinstance(easing, dict):
+                easing = response_data(c.get_easing_config(uid)) or {}
+            have.dial_easing = (easing.get('dial_period'), easing.get('dial_step'))
+            have.backlight_easing = (easing.get('backlight_period'), easing.get('backlight_step'))
+        return have
+
+    def _setter(self, field: str) -> Callable:
+        c = self.client
+        return {'name': c.set_dial_name, 'dial_easing': c.set_dial_easing,
+                'backlight_easing': c.set_backlight_easing, 'color': c.set_dial_color,
+                'value': c.set_dial_value, 'background': c.set_dial_background}[field]
+
+    def _send(self, uid: str, field: str, setting) -> None:
+        args = setting if isinstance(setting, tuple) else (setting,)
+        self._setter(field)(uid, *args)
+
+    def _send_all(self, uid: str, steps: list[tuple[str, object]]) -> list[tuple[str, str, Exception | None]]:
+        results = []
+        for field, setting in steps:
+            try:
+                self._send(uid, field, setting)
+            except Exception as e:
+                results.append((uid, field, e))
+            else:
+                results.append((uid, field, None))
+        return results
+
+    def _run_steps(self, steps: list[tuple[str, str, object]]) -> list[tuple[str, str, Exception | None]]:
+        by_dial: dict[str, list[tuple[str, object]]] = {}
+        for uid, field, setting in steps:
+            by_dial.setdefault(uid, []).append((field, setting))
+        if not by_dial:
+            return []
+        with ThreadPoolExecutor(min(self.workers, len(by_dial))) as ex:
+            futures = [ex.submit(self._send_all, uid, dial_steps) for uid, dial_steps in by_dial.items()]
+        return [result for f in futures for result in f.result()]
+
+    def commit(self) -> TransactionReport:
+        """
+        Apply every staged setting, or none of them.
+
+        :return: TransactionReport
+        """
+        report = TransactionReport()
+        start = t = time.perf_counter()
+        staged = self._staged
+        self._staged = {}
+
+        with ThreadPoolExecutor(max(1, min(self.workers, len(staged)))) as ex:
+            captures = {uid: ex.submit(self._capture, uid, want) for uid, want in staged.items()}
+        previous: dict[str, DesiredState] = {}
+        for uid, f in captures.items():
+            if f.exception() is not None:
+                report.failed.append((uid, 'capture', f.exception()))
+            else:
+                previous[uid] = f.result()
+        report.timings['capture'] = time.perf_counter() - t
+        if report.failed:
+            # Nothing has been changed yet.
+            report.timings['total'] = time.perf_counter() - start
+            return report
+
+        steps = []
+        for uid, want in staged.items():
+            for field in FIELDS:
+                setting = getattr(want, field)
+                if setting is None:
+                    continue
+                if field != 'background' and getattr(previous[uid], field) == setting:
+                    report.skipped.append((uid, field))
+                    continue
+                steps.append((uid, field, setting))
+        t = time.perf_counter()
+        for uid, field, error in self._run_steps(steps):
+            if error is None:
+                report.applied.append((uid, field))
+            else:
+                LOGGER.warning('Configuring %s of dial %s failed: %s', field, uid, error)
+                report.failed.append((uid, field, error))
+        report.timings['apply'] = time.perf_counter() - t
+
+        if report.failed:
+            t = time.perf_counter()
+            undo = []
+            for uid, field in report.applied:
+                setting = getattr(previous[uid], field)
+                if field == 'background' or setting is None or \
+                        (isinstance(setting, tuple) and None in setting):
+                    report.not_restorable.append((uid, field))
+                else:
+                    undo.append((uid, field, setting))
+            for uid, field, error in self._run_steps(undo):
+                if error is None:
+                    report.rolled_back.append((uid, field))
+                else:
+                    LOGGER.warning('Rolling back %s of dial %s failed: %s', field, uid, error)
+                    report.rollback_failed.append((uid, field, error))
+            report.timings['rollback'] = time.perf_counter() - t
+        else:
+            report.ok = True
+        report.timings['total'] = time.perf_counter() - start
+        return report
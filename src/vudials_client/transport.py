@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import http.client
+import json
+import socket
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    import requests
+
+
+def _exceptions():
+    # Imported only when an error has to be raised.
+    from requests import exceptions
+    return exceptions
+
+
+class LiteResponse:
+    def __init__(self, url: str, status_code: int, reason: str, headers: dict[str, str], content: bytes,
+                 phases: dict[str, int] | None = None):
+        """
+        The subset of requests.Response used by this library and its callers.
+
+        :param url: str, the request URL.
+        :param status_code: int, the HTTP status code.
+        :param reason: str, the HTTP reason phrase.
+        :param headers: dict[str, str], response headers (lower-cased names).
+        :param content: bytes, the response body.
+        :param phases: dict[str, int], optional; nanoseconds spent connecting,
+            sending, waiting for the response headers and reading the body.
+        """
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+        self.phases = phases
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self, **kwargs: Any) -> Any:
+        return json.loads(self.content, **kwargs)
+
+    def raise_for_status(self) -> None:
+        """
+        Raise requests.exceptions.HTTPError for 4xx/5xx, like requests does.
+
+        requests is only imported when an error actually has to be raised.
+        """
+        if self.status_code >= 400:
+            kind = 'Client' if self.status_code < 500 else 'Server'
+            raise _exceptions().HTTPError(
+                f'{self.status_code} {kind} Error: {self.reason} for url: {self.url}', response=self)
+
+
+class StdlibTransport:
+    def __init__(self):
+        """
+        A minimal HTTP transport built on http.client.
+
+        Handles plain GETs and body-less POSTs with one keep-alive connection
+        per thread and host; uploads with a body are delegated to requests,
+        which is imported on first use. Network failures are raised as the
+        matching requests exceptions so callers see the same error types.
+        """
+        self._local = threading.local()
+
+    def _connection(self, host: str, port: int, timeout: float) -> http.client.HTTPConnection:
+        conns = getattr(self._local, 'conns', None)
+        if conns is None:
+            conns = self._local.conns = {}
+        conn = conns.get((host, port))
+        if conn is None:
+            conn = conns[(host, port)] = http.client.HTTPConnection(host, port, timeout=timeout)
+        conn.timeout = timeout
+        return conn
+
+    def _drop(self, host: str, port: int) -> None:
+        conn = self._local.conns.pop((host, port), None)
+        if conn is not None:
+            conn.close()
+
+    def request(self, method: str, url: str, timeout: float = 10,
+                headers: dict[str, str] | None = None) -> LiteResponse:
+        parts = urlsplit(url)
+        if parts.scheme != 'http':
+            raise ValueError(f"StdlibTransport only supports http:// URLs, got {url!r}")
+        host, port = parts.hostname, parts.port or 80
+        target = f'{parts.path}?{parts.query}' if parts.query else parts.path
+        for attempt in (1, 2):
+            conn = self._connection(host, port, timeout)
+            try:
+                t0 = time.perf_counter_ns()
+                if conn.sock is None:
+                    conn.connect()
+                t1 = time.perf_counter_ns()
+                conn.request(method, target, headers=headers or {})
+                t2 = time.perf_counter_ns()
+                r = conn.getresponse()
+                t3 = time.perf_counter_ns()
+                content = r.read()
+                t4 = time.perf_counter_ns()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as e:
+                # A stale keep-alive connection closed by the server; retry
+                # idempotent GETs once on a fresh connection.
+                self._drop(host, port)
+                if attempt == 2 or method != 'GET':
+                    raise _exceptions().ConnectionError(e) from e
+                continue
+            except socket.timeout as e:
+                self._drop(host, port)
+                raise _exceptions().Timeout(e) from e
+            except (OSError, http.client.HTTPException) as e:
+                # Includes responses cut off mid-way, e.g. IncompleteRead.
+                self._drop(host, port)
+                raise _exceptions().ConnectionError(e) from e
+            if r.will_close:
+                self._drop(host, port)
+            headers = {k.lower(): v for k, v in r.getheaders()}
+            return LiteResponse(url, r.status, r.reason, headers, content,
+                                {'connect': t1 - t0, 'send': t2 - t1, 'wait': t3 - t2, 'read': t4 - t3})
+
+    def get(self, url: str, timeout: float = 10, headers: dict[str, str] | None = None,
+            **kwargs: Any) -> LiteResponse | requests.Response:
+        if kwargs:
+            import requests
+            return requests.get(url, timeout=timeout, headers=headers, **kwargs)
+        return self.request('GET', url, timeout, headers)
+
+    def post(self, url: str, timeout: float = 10, **kwargs: Any) -> LiteResponse | requests.Response:
+        if kwargs:
+            import requests
+            return requests.post(url, timeout=timeout, **kwargs)
+        return self.request('POST', url, timeout)
+
+    def close(self) -> None:
+        """Close the calling thread's connections."""
+        for conn in getattr(self._local, 'conns', {}).values():
+            conn.close()
+        self._local.conns = {}
@@ -1,13 +1,90 @@
-import requests
+from __future__ import annotations
+
 import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, ContextManager
 from urllib.parse import quote
 
+from .commands import Command, SetColor, color_params, easing_params, name_params, value_params
+from .connections import DialLocks, no_lock
+
+if TYPE_CHECKING:
+    import requests
+
+    from .connections import ConnectionPool
+    from .multipart import MultipartEncoder
+    from .readcache import ReadCache
+    from .recording import CommandRecorder
+    from .palette import Palette
+    from .profiling import Profiler
+    from .scope import DialScope
+    from .transport import StdlibTransport
+    from .warmup import WarmUp
+
+
+def _requests():
+    # requests (with urllib3, charset detection and certifi) dominates start-up
+    # time for short-lived scripts, so it is imported on first use only and
+    # never by scripts that use the lightweight StdlibTransport.
+    import requests
+    return requests
+
+
+def __getattr__(name: str) -> Any:
+    # Keep vudialsclient.requests available to callers that reach for it.
+    if name == 'requests':
+        return _requests()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Library code must not call logging.basicConfig() — that configures the root
 # logger for the entire host application. Let the application control logging.
 LOGGER = logging.getLogger(__name__)
 
 
+def response_data(response: requests.Response) -> Any:
+    """
+    Return the payload of a vu-dial server response.
+
+    The server wraps results as {"status": ..., "message": ..., "data": ...};
+    unwrapped bodies are returned unchanged.
+
+    :param response: requests.Response
+    :return: the decoded "data" member, or the whole JSON body.
+    """
+    body = response.json()
+    if isinstance(body, dict) and 'data' in body and 'status' in body:
+        return body['data']
+    return body
+
+
+class _ErrorResponse(Exception):
+    def __init__(self, response: requests.Response):
+        self.response = response
+
+
+def _cacheable(response: requests.Response) -> requests.Response:
+    if response.status_code >= 400:
+        raise _ErrorResponse(response)
+    return response
+
+
+def _make_transport(pool_size: int | None, transport: ConnectionPool | StdlibTransport | None):
+    if pool_size is None:
+        return transport
+    if transport is not None:
+        raise ValueError("Pass either pool_size or transport, not both")
+    from .connections import ConnectionPool
+    return ConnectionPool(pool_size)
+
+
 class VUUtil:
+    transport: ConnectionPool | StdlibTransport | None = None
+    recorder: CommandRecorder | None = None
+    # False returns error responses instead of raising; see errors.ResultClient.
+    raise_errors: bool = True
+    profiler: Profiler | None = None
+
     def get_uri(self, server_url: str, api_key: str, api_call: str, keyword_params: str) -> str:
         # Security note: The API key is transmitted as a URL query parameter.
         # This means it will appear in server access logs, proxy logs, and
@@ -15,40 +92,110 @@ class VUUtil:
         # in the future, prefer an Authorization or X-API-Key header instead.
         return f'{server_url}/api/v0/{api_call}?key={quote(api_key, safe="")}{keyword_params}'
 
-    def send_http_request(self, path_uri: str, files: dict, timeout: int = 10) -> requests.Response:
-        if files:
-            r = requests.post(path_uri, files=files, timeout=timeout)
-        else:
-            r = requests.get(path_uri, timeout=timeout)
-        r.raise_for_status()
+    def send_http_request(self, path_uri: str, files: dict | MultipartEncoder, timeout: int = 10,
+                          progress: Callable[[int, int], None] | None = None,
+                          headers: dict[str, str] | None = None) -> requests.Response:
+        if self.recorder is not None:
+            self.recorder.record(path_uri, files)
+        http = self.transport or _requests()
+        profiler = self.profiler
+        if profiler is not None:
+            sent = profiler.clock()
+        try:
+            if files:
+                from .multipart import MultipartEncoder
+
+                # Stream the multipart body in chunks instead of letting requests
+                # assemble it in memory, so upload memory does not scale with image size.
+                body = files if isinstance(files, MultipartEncoder) else MultipartEncoder(files, progress=progress)
+                try:
+                    r = http.post(path_uri, data=body, headers={'Content-Type': body.content_type},
+                                  timeout=timeout)
+                finally:
+                    body.close()
+            elif headers:
+                r = http.get(path_uri, timeout=timeout, headers=headers)
+            else:
+                r = http.get(path_uri, timeout=timeout)
+            if profiler is not None:
+                profiler.observe(path_uri, sent, r)
+        finally:
+            if profiler is not None:
+                profiler.clear()
+        if self.raise_errors:
+            r.raise_for_status()
         return r
 
 
 class VUAdminUtil:
+    transport: ConnectionPool | StdlibTransport | None = None
+    raise_errors: bool = True
+    profiler: Profiler | None = None
+
     def get_uri(self, server_url: str, api_key: str, api_call: str, keyword_params: str) -> str:
         # Security note: See VUUtil.get_uri — same key-in-URL caveat applies.
+        if self.profiler is not None:
+            self.profiler.mark()
         return f'{server_url}/api/v0/{api_call}?admin_key={quote(api_key, safe="")}{keyword_params}'
 
     def send_http_request(self, path_uri: str, method: str, timeout: int = 10) -> requests.Response:
+        http = self.transport or _requests()
+        profiler = self.profiler
+        if profiler is not None:
+            sent = profiler.clock()
         method = method.lower()
-        if method == "post":
-            r = requests.post(path_uri, timeout=timeout)
-        elif method == "get":
-            r = requests.get(path_uri, timeout=timeout)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method!r}")
-        r.raise_for_status()
+        try:
+            if method == "post":
+                r = http.post(path_uri, timeout=timeout)
+            elif method == "get":
+                r = http.get(path_uri, timeout=timeout)
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method!r}")
+            if profiler is not None:
+                profiler.observe(path_uri, sent, r)
+        finally:
+            if profiler is not None:
+                profiler.clear()
+        if self.raise_errors:
+            r.raise_for_status()
         return r
 
 
 class VUDial(VUUtil):
-    def __init__(self, server_address: str, server_port: int, api_key: str):
+    def __init__(self, server_address: str, server_port: int, api_key: str,
+                 read_cache: ReadCache | None = None, pool_size: int | None = None,
+                 recorder: CommandRecorder | None = None,
+                 transport: ConnectionPool | StdlibTransport | None = None,
+                 warm_up: bool | str = False, scope: DialScope | None = None,
+                 profiler: Profiler | None = None):
         """
         Initialize the class with required values.
 
         :param server_address: str, the server ip address.
         :param server_port: int, the vu-dial server port.
         :param api_key: str, a valid api key for the vu-dial server.
+        :param read_cache: ReadCache, optional; coalesces concurrent identical
+            list_dials/get_dial_info/get_easing_config calls and caches their
+            responses for the configured per-endpoint TTL.
+        :param pool_size: int, optional; enables thread-safe mode for sharing one
+            instance across a thread pool. Each thread keeps its own keep-alive
+            connection, at most pool_size requests run at once, and writes to
+            the same dial are serialized while different dials never contend.
+        :param recorder: CommandRecorder, optional; appends every command sent
+            to a replayable log (see vudials_client.recording).
+        :param transport: optional object with requests-style get()/post()
+            used instead of the requests module, e.g. StdlibTransport for fast
+            start-up in short-lived scripts. Cannot be combined with pool_size.
+        :param warm_up: bool or 'background', optional; pay first-request costs
+            (import, DNS, key check with list_dials) now instead of on the
+            first command. The connection is only kept for later commands by
+            a blocking warm-up with pool_size or a transport. 'background'
+            does it without blocking. The report is kept in self.warmup (see
+            vudials_client.warmup).
+        :param scope: DialScope, optional; the dials this key may use. Calls
+            for other dials raise errors.OutOfScope without being sent.
+        :param profiler: Profiler, optional; times each call by endpoint and
+            phase (see vudials_client.profiling).
 
         Security note: Communication uses plain HTTP. Ensure the server is
         only reachable on a trusted local network interface. The API key is
@@ -56,6 +203,70 @@ class VUDial(VUUtil):
         """
         self.server_url = f'http://{server_address}:{server_port}'
         self.key = api_key
+        self.read_cache = read_cache
+        self.recorder = recorder
+        self.transport = _make_transport(pool_size, transport)
+        self.profiler = profiler
+        self._dial_lock = DialLocks() if pool_size is not None else no_lock
+        self.scope = scope
+        # Last backlight colour this client set per dial, for set_value_with_palette.
+        self._colors: dict[str, tuple[int, int, int]] = {}
+        self.warmup = self.warm_up(background=warm_up == 'background') if warm_up else None
+
+    def close(self) -> None:
+        """
+        Close pooled connections, if any.
+        """
+        if self.transport is not None:
+            self.transport.close()
+
+    def warm_up(self, background: bool = False) -> WarmUp:
+        """
+        Resolve the server and check the key before the first real command.
+
+        :param background: bool, run on a background thread instead of blocking.
+        :return: WarmUp, with per-phase timings once finished.
+        """
+        from .warmup import WarmUp
+
+        warmup = WarmUp(self)
+        return warmup.start() if background else warmup.run()
+
+    def _dial_path(self, uid: str, action: str) -> str:
+        # Every dial call starts here, so this is where its build phase begins.
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.mark()
+        if self.scope is not None:
+            try:
+                self.scope.check(uid)
+            except Exception:
+                if profiler is not None:
+                    profiler.clear()
+                raise
+        return f'dial/{quote(uid, safe="")}/{action}'
+
+    def _locked(self, uid: str) -> ContextManager:
+        # In pooled mode, waiting for the dial's lock is timed as its own phase.
+        if self.profiler is not None and self._dial_lock is not no_lock:
+            self.profiler.built()
+        return self._dial_lock(uid)
+
+    def _read(self, endpoint: str, r_uri: str) -> requests.Response:
+        if self.read_cache is None:
+            return self.send_http_request(r_uri, None)
+        try:
+            if self.raise_errors:
+                return self.read_cache.get(endpoint, r_uri, lambda: self.send_http_request(r_uri, None))
+            # Error responses must not be cached, so they leave the cache as an exception.
+            try:
+                return self.read_cache.get(endpoint, r_uri, lambda: _cacheable(self.send_http_request(r_uri, None)))
+            except _ErrorResponse as e:
+                return e.response
+        finally:
+            # A cache hit never reaches send_http_request, which clears the mark.
+            if self.profiler is not None:
+                self.profiler.clear()
 
     def list_dials(self) -> requests.Response:
         """
@@ -63,8 +274,10 @@ class VUDial(VUUtil):
 
         :return: requests.Response
         """
+        if self.profiler is not None:
+            self.profiler.mark()
         r_uri = self.get_uri(self.server_url, self.key, 'dial/list', '')
-        return self.send_http_request(r_uri, None)
+        return self._read('list_dials', r_uri)
 
     def get_dial_info(self, uid: str) -> requests.Response:
         """
@@ -73,9 +286,9 @@ class VUDial(VUUtil):
         :param uid: str, the uid of the vu-dial.
         :return: requests.Response
         """
-        api_call = f'dial/{quote(uid, safe="")}/status'
+        api_call = self._dial_path(uid, 'status')
         r_uri = self.get_uri(self.server_url, self.key, api_call, '')
-        return self.send_http_request(r_uri, None)
+        return self._read('get_dial_info', r_uri)
 
     def set_dial_value(self, uid: str, value: int) -> requests.Response:
         """
@@ -85,10 +298,11 @@ class VUDial(VUUtil):
         :param value: int, the dial value.
         :return: requests.Response
         """
-        api_call = f'dial/{quote(uid, safe="")}/set'
-        params = f'&value={int(value)}'
+        api_call = self._dial_path(uid, 'set')
+        params = value_params(int(value))
         r_uri = self.get_uri(self.server_url, self.key, api_call, params)
-        return self.send_http_request(r_uri, None)
+        with self._locked(uid):
+            return self.send_http_request(r_uri, None)
 
     def set_dial_color(self, uid: str, red: int, green: int, blue: int) -> requests.Response:
         """
@@ -100,24 +314,74 @@ class VUDial(VUUtil):
         :param blue: int, blue channel (0-100).
         :return: requests.Response
         """
-        api_call = f'dial/{quote(uid, safe="")}/backlight'
-        params = f'&red={int(red)}&green={int(green)}&blue={int(blue)}'
+        api_call = self._dial_path(uid, 'backlight')
+        params = color_params(int(red), int(green), int(blue))
         r_uri = self.get_uri(self.server_url, self.key, api_call, params)
-        return self.send_http_request(r_uri, None)
+        with self._locked(uid):
+            r = self.send_http_request(r_uri, None)
+            if r.status_code < 400:
+                self._colors[uid] = (int(red), int(green), int(blue))
+        return r
+
+    def send(self, command: Command) -> requests.Response:
+        """
+        Send a prebuilt command from vudials_client.commands.
+
+        The command was validated and serialized when it was created, so
+        sending it only joins the URI.
+
+        :param command: Command, e.g. SetValue(uid, 50).
+        :return: requests.Response
+        """
+        uid = command.uid
+        api_call = self._dial_path(uid, command.action)
+        r_uri = self.get_uri(self.server_url, self.key, api_call, command.params)
+        with self._locked(uid):
+            r = self.send_http_request(r_uri, None)
+            if isinstance(command, SetColor) and r.status_code < 400:
+                self._colors[uid] = command.args
+        return r
+
+    def set_value_with_palette(self, uid: str, value: int, palette: str | Palette) -> requests.Response:
+        """
+        Set the dial value and the matching backlight colour from a palette.
+
+        The colour request is skipped when the palette colour equals the last
+        colour this client set on the dial.
+
+        :param uid: str, the uid of the vu-dial.
+        :param value: int, the dial value.
+        :param palette: str or Palette, a palette or the name of a registered one
+            (see vudials_client.palette).
+        :return: requests.Response, of the value request.
+        """
+        from .palette import get_palette
 
-    def set_dial_background(self, uid: str, file: str) -> requests.Response:
+        color = get_palette(palette).color(value)
+        r = self.set_dial_value(uid, value)
+        if r.status_code < 400 and self._colors.get(uid) != color:
+            self.set_dial_color(uid, *color)
+        return r
+
+    def set_dial_background(self, uid: str, file: str,
+                            progress: Callable[[int, int], None] | None = None) -> requests.Response:
         """
         Set the dial background image.
 
+        The image is streamed from disk in chunks, so memory use does not grow
+        with image size or the number of concurrent uploads.
+
         :param uid: str, the uid of the vu-dial.
         :param file: str, path to the image file to upload.
+        :param progress: Callable, optional; called as progress(bytes_sent, total).
         :return: requests.Response
         """
-        api_call = f'dial/{quote(uid, safe="")}/image/set'
+        api_call = self._dial_path(uid, 'image/set')
         with open(file, 'rb') as f:
             files = {'imgfile': f}
             r_uri = self.get_uri(self.server_url, self.key, api_call, '')
-            return self.send_http_request(r_uri, files)
+            with self._locked(uid):
+                return self.send_http_request(r_uri, files, progress=progress)
 
     def get_dial_image_crc(self, uid: str) -> requests.Response:
         """
@@ -126,7 +390,7 @@ class VUDial(VUUtil):
         :param uid: str, the uid of the vu-dial.
         :return: requests.Response
         """
-        api_call = f'dial/{quote(uid, safe="")}/image/crc'
+        api_call = self._dial_path(uid, 'image/crc')
         r_uri = self.get_uri(self.server_url, self.key, api_call, '')
         return self.send_http_request(r_uri, None)
 
@@ -138,10 +402,11 @@ class VUDial(VUUtil):
         :param name: str, the name to assign to the dial.
         :return: requests.Response
         """
-        api_call = f'dial/{quote(uid, safe="")}/name'
-        params = f'&name={quote(name, safe="")}'
+        api_call = self._dial_path(uid, 'name')
+        params = name_params(name)
         r_uri = self.get_uri(self.server_url, self.key, api_call, params)
-        return self.send_http_request(r_uri, None)
+        with self._locked(uid):
+            return self.send_http_request(r_uri, None)
 
     def reload_hw_info(self, uid: str) -> requests.Response:
         """
@@ -150,9 +415,10 @@ class VUDial(VUUtil):
         :param uid: str, the uid of the vu-dial.
         :return: requests.Response
         """
-        api_call = f'dial/{quote(uid, safe="")}/reload'
+        api_call = self._dial_path(uid, 'reload')
         r_uri = self.get_uri(self.server_url, self.key, api_call, '')
-        return self.send_http_request(r_uri, None)
+        with self._locked(uid):
+            return self.send_http_request(r_uri, None)
 
     def set_dial_easing(self, uid: str, period: int, step: int) -> requests.Response:
         """
@@ -163,10 +429,11 @@ class VUDial(VUUtil):
         :param step: int, easing step.
         :return: requests.Response
         """
-        api_call = f'dial/{quote(uid, safe="")}/easing/dial'
-        params = f'&period={int(period)}&step={int(step)}'
+        api_call = self._dial_path(uid, 'easing/dial')
+        params = easing_params(int(period), int(step))
         r_uri = self.get_uri(self.server_url, self.key, api_call, params)
-        return self.send_http_request(r_uri, None)
+        with self._locked(uid):
+            return self.send_http_request(r_uri, None)
 
     def set_backlight_easing(self, uid: str, period: int, step: int) -> requests.Response:
         """
@@ -177,10 +444,11 @@ class VUDial(VUUtil):
         :param step: int, easing step.
         :return: requests.Response
         """
-        api_call = f'dial/{quote(uid, safe="")}/easing/backlight'
-        params = f'&period={int(period)}&step={int(step)}'
+        api_call = self._dial_path(uid, 'easing/backlight')
+        params = easing_params(int(period), int(step))
         r_uri = self.get_uri(self.server_url, self.key, api_call, params)
-        return self.send_http_request(r_uri, None)
+        with self._locked(uid):
+            return self.send_http_request(r_uri, None)
 
     def get_easing_config(self, uid: str) -> requests.Response:
         """
@@ -189,19 +457,28 @@ class VUDial(VUUtil):
         :param uid: str, the uid of the vu-dial.
         :return: requests.Response
         """
-        api_call = f'dial/{quote(uid, safe="")}/easing/get'
+        api_call = self._dial_path(uid, 'easing/get')
         r_uri = self.get_uri(self.server_url, self.key, api_call, '')
-        return self.send_http_request(r_uri, None)
+        return self._read('get_easing_config', r_uri)
 
 
 class VUAdmin(VUAdminUtil):
-    def __init__(self, server_address: str, server_port: int, admin_key: str):
+    def __init__(self, server_address: str, server_port: int, admin_key: str,
+                 pool_size: int | None = None, transport: ConnectionPool | StdlibTransport | None = None,
+                 warm_up: bool | str = False, profiler: Profiler | None = None):
         """
         Initialize the class with required values.
 
         :param server_address: str, the server ip address.
         :param server_port: int, the vu-dial server port.
         :param admin_key: str, a valid admin key for the vu-dial server.
+        :param pool_size: int, optional; reuse keep-alive connections through a
+            thread-safe ConnectionPool of this size.
+        :param transport: optional object with requests-style get()/post()
+            used instead of the requests module. Cannot be combined with pool_size.
+        :param warm_up: bool or 'background', optional; as for VUDial, checking
+            the key with list_api_keys.
+        :param profiler: Profiler, optional; as for VUDial.
 
         Security note: Communication uses plain HTTP. Ensure the server is
         only reachable on a trusted local network interface. The admin key is
@@ -209,6 +486,38 @@ class VUAdmin(VUAdminUtil):
         """
         self.server_url = f'http://{server_address}:{server_port}'
         self.key = admin_key
+        self.transport = _make_transport(pool_size, transport)
+        self.profiler = profiler
+        self._scopes: dict[str, list[DialScope]] = {}
+        self.warmup = self.warm_up(background=warm_up == 'background') if warm_up else None
+
+    def close(self) -> None:
+        """
+        Close pooled connections, if any.
+        """
+        if self.transport is not None:
+            self.transport.close()
+
+    def warm_up(self, background: bool = False) -> WarmUp:
+        """
+        Resolve the server and check the key before the first real command.
+
+        :param background: bool, run on a background thread instead of blocking.
+        :return: WarmUp, with per-phase timings once finished.
+        """
+        from .warmup import WarmUp
+
+        warmup = WarmUp(self)
+        return warmup.start() if background else warmup.run()
+
+    def watch_scope(self, target_key: str, scope: DialScope) -> None:
+        """
+        Keep a DialScope in step with update_api_key/remove_api_key calls made here.
+
+        :param target_key: str, the API key the scope belongs to.
+        :param scope: DialScope
+        """
+        self._scopes.setdefault(target_key, []).append(scope)
 
     def provision_dials(self) -> requests.Response:
         """
@@ -237,7 +546,11 @@ class VUAdmin(VUAdminUtil):
         """
         params = f'&key={quote(target_key, safe="")}'
         r_uri = self.get_uri(self.server_url, self.key, 'admin/keys/remove', params)
-        return self.send_http_request(r_uri, 'get')
+        r = self.send_http_request(r_uri, 'get')
+        if r.status_code < 400:
+            for scope in self._scopes.pop(target_key, ()):
+                scope.revoke()
+        return r
 
     def create_api_key(self, name: str, dials: list[str]) -> requests.Response:
         """
@@ -262,4 +575,8 @@ class VUAdmin(VUAdminUtil):
         """
         params = f'&key={quote(target_key, safe="")}&name={quote(name, safe="")}&dials={quote(";".join(dials), safe="")}'
         r_uri = self.get_uri(self.server_url, self.key, 'admin/keys/update', params)
-        return self.send_http_request(r_uri, 'post')
+        r = self.send_http_request(r_uri, 'post')
+        if r.status_code < 400:
+            for scope in self._scopes.get(target_key, ()):
+                scope.update(';'.join(dials))
+        return r
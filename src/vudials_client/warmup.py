@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import logging
+import socket
+import threading
+import time
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from .vudialsclient import _requests, response_data
+
+if TYPE_CHECKING:
+    from .vudialsclient import VUAdmin, VUDial
+
+LOGGER = logging.getLogger(__name__)
+
+
+class WarmUp:
+    def __init__(self, client: VUDial | VUAdmin):
+        """
+        Pay a client's first-request costs ahead of time.
+
+        Imports the HTTP library, resolves the server address, and makes one
+        cheap authenticated call (list_dials, or list_api_keys for VUAdmin)
+        that checks the key and warms the server. For a VUDial the dial list
+        goes through the client's read cache, if any, and the uids are kept
+        in `dials`.
+
+        The TCP connect is only saved by a blocking warm-up on a client with
+        pool_size or a transport: those keep one connection per thread, and
+        the call runs on the thread that will send the commands. Without
+        either, the requests module opens a new connection per request, and
+        a background warm-up connects from its own thread.
+
+        :param client: VUDial or VUAdmin.
+        """
+        self.client = client
+        self.timings: dict[str, float] = {}
+        self.dials: list[str] | None = None
+        self.error: Exception | None = None
+        self.done = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _phase(self, name: str, start: float) -> float:
+        now = time.perf_counter()
+        self.timings[name] = now - start
+        return now
+
+    def _warm(self) -> None:
+        start = t = time.perf_counter()
+        try:
+            if self.client.transport is None:
+                _requests()
+                t = self._phase('import', t)
+            url = urlsplit(self.client.server_url)
+            socket.getaddrinfo(url.hostname, url.port, type=socket.SOCK_STREAM)
+            t = self._phase('resolve', t)
+            if hasattr(self.client, 'list_dials'):
+                dials = response_data(self.client.list_dials()) or []
+                self.dials = [d['uid'] for d in dials]
+            else:
+                self.client.list_api_keys()
+            self._phase('check', t)
+        except Exception as e:
+            self.error = e
+            raise
+        finally:
+            self._phase('total', start)
+        LOGGER.debug('Warm-up of %s took %.1f ms', self.client.server_url, self.timings['total'] * 1000)
+
+    def run(self) -> WarmUp:
+        """
+        Warm up on the calling thread. Errors, e.g. a rejected key, are raised.
+
+        :return: WarmUp, self.
+        """
+        try:
+            self._warm()
+        finally:
+            self.done.set()
+        return self
+
+    def _run_logged(self) -> None:
+        try:
+            self._warm()
+        except Exception as e:
+            LOGGER.warning('Background warm-up of %s failed: %s', self.client.server_url, e)
+        finally:
+            self.done.set()
+
+    def start(self) -> WarmUp:
+        """
+        Warm up on a background thread. Errors are logged and kept in `error`.
+
+        :return: WarmUp, self.
+        """
+        self._thread = threading.Thread(target=self._run_logged, name='vu1-warmup', daemon=True)
+        self._thread.start()
+        return self
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Block until warm-up has finished.
+
+        :param timeout: float, seconds to wait; forever if None.
+        :return: bool, whether warm-up finished.
+        """
+        return self.done.wait(timeout)
+
+    @property
+    def ok(self) -> bool:
+        return self.done.is_set() and self.error is None
@@ -1,6 +1,10 @@
 import pytest
 from vudials_client.vudialsclient import VUDial, VUAdmin
 
+# The repo's own pytest plugin supplies the simulator fixtures; test modules
+# choose their dials with a module-level pytest.mark.vu1(dials=[...]).
+pytest_plugins = ["vudials_client.pytest_plugin"]
+
 
 @pytest.fixture
 def vudial():
@@ -10,3 +14,8 @@ def vudial():
 @pytest.fixture
 def vuadmin():
     return VUAdmin("localhost", 5340, "test-admin-key")
+
+
+@pytest.fixture
+def sim(vu1_simulator):
+    return vu1_simulator
@@ -0,0 +1,187 @@
+"""Tests for the system metric collectors."""
+import os
+import time
+import pytest
+
+from vudials_client import collectors
+from vudials_client.collectors import (CPUCollector, Collector, CollectorRunner, DiskCollector,
+                                       MemoryCollector, NetworkCollector, load_config, make_collector,
+                                       register_source)
+from vudials_client.vudialsclient import VUDial
+
+pytestmark = pytest.mark.vu1(dials=["d1", "d2"])
+
+
+def rewrite(path, text):
+    """Rewrite in place so already-open descriptors see the new content."""
+    with open(path, "w") as f:
+        f.write(text)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = FakeClock()
+    monkeypatch.setattr(collectors.time, "monotonic", c)
+    return c
+
+
+class Fixed(Collector):
+    def __init__(self, value=0):
+        super().__init__()
+        self.value = float(value)
+
+    def read(self):
+        return self.value
+
+
+# ---------------------------------------------------------------------------
+# Sources
+# ---------------------------------------------------------------------------
+
+class TestSources:
+    def test_cpu_delta(self, tmp_path):
+        stat = tmp_path / "stat"
+        rewrite(stat, "cpu  100 0 100 800 0 0 0 0 0 0\ncpu0 1 2 3 4\n")
+        c = CPUCollector(str(stat))
+        rewrite(stat, "cpu  160 0 120 870 10 0 0 0 0 0\ncpu0 1 2 3 4\n")
+        # 160 ticks elapsed, 80 idle + iowait.
+        assert c.read() == pytest.approx(50.0)
+        assert c.read() == 0.0
+        c.close()
+
+    def test_memory(self, tmp_path):
+        meminfo = tmp_path / "meminfo"
+        rewrite(meminfo, "MemTotal:  1000 kB\nMemFree:  100 kB\nMemAvailable:  250 kB\n")
+        c = MemoryCollector(str(meminfo))
+        assert c.read() == pytest.approx(75.0)
+        rewrite(meminfo, "MemTotal:  1000 kB\nMemFree:  100 kB\nMemAvailable:  900 kB\n")
+        assert c.read() == pytest.approx(10.0)
+
+    def test_disk_busy(self, tmp_path, clock):
+        stat = tmp_path / "stat"
+        rewrite(stat, "1 0 2 3 4 0 5 6 0 1000 7\n")
+        c = DiskCollector(path=str(stat))
+        clock.now += 2
+        rewrite(stat, "1 0 2 3 4 0 5 6 0 1500 7\n")
+        assert c.read() == pytest.approx(25.0)
+
+    def test_network_rate(self, tmp_path, clock):
+        for name in ("rx_bytes", "tx_bytes"):
+            rewrite(tmp_path / name, "0\n")
+        c = NetworkCollector(max_rate="1000", path=str(tmp_path))
+        clock.now += 1
+        rewrite(tmp_path / "rx_bytes", "300\n")
+        rewrite(tmp_path / "tx_bytes", "200\n")
+        assert c.read() == pytest.approx(50.0)
+        clock.now += 1
+        rewrite(tmp_path / "rx_bytes", "5000\n")
+        assert c.read() == 100.0
+
+    def test_network_single_direction(self, tmp_path, clock):
+        rewrite(tmp_path / "tx_bytes", "0\n")
+        c = NetworkCollector(max_rate=100, direction="tx", path=str(tmp_path))
+        clock.now += 1
+        rewrite(tmp_path / "tx_bytes", "10\n")
+        assert c.read() == pytest.approx(10.0)
+
+    def test_network_invalid_arguments(self, tmp_path):
+        with pytest.raises(ValueError):
+            NetworkCollector(direction="up", path=str(tmp_path))
+        with pytest.raises(ValueError):
+            NetworkCollector(max_rate=0, path=str(tmp_path))
+
+    def test_file_descriptors_reused(self, tmp_path):
+        meminfo = tmp_path / "meminfo"
+        rewrite(meminfo, "MemTotal:  1000 kB\nMemFree:  100 kB\nMemAvailable:  250 kB\n")
+        c = MemoryCollector(str(meminfo))
+        fd = c._files[0].fd
+        for _ in range(3):
+            c.read()
+        assert c._files[0].fd == fd
+        c.close()
+        assert c._files[0].fd == -1
+
+    @pytest.mark.skipif(not os.path.exists("/proc/stat"), reason="needs Linux /proc")
+    def test_real_proc(self):
+        for c in (CPUCollector(), MemoryCollector()):
+            assert 0.0 <= c.read() <= 100.0
+            c.close()
+
+
+class TestRegistry:
+    def test_make_by_name(self, tmp_path):
+        rewrite(tmp_path / "meminfo", "MemTotal: 10 kB\nMemAvailable: 5 kB\n")
+        assert isinstance(make_collector("memory", path=str(tmp_path / "meminfo")), MemoryCollector)
+
+    def test_register_and_import_path(self):
+        register_source("fixed", Fixed)
+        try:
+            assert make_collector("fixed", value="7").read() == 7.0
+        finally:
+            del collectors.SOURCES["fixed"]
+        assert make_collector(f"{__name__}:Fixed", value="3").read() == 3.0
+
+    def test_unknown(self):
+        with pytest.raises(ValueError):
+            make_collector("gpu")
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def sim(sim):
+    sim.dials["d1"].name = "CPU"
+    return sim
+
+
+class TestCollectorRunner:
+    def test_resolves_names_and_sends_changes_only(self, sim):
+        cpu, other = Fixed(42.4), Fixed(10)
+        runner = CollectorRunner(VUDial(sim.address, sim.port, sim.api_key), {"CPU": cpu, "d2": other})
+        assert runner.run_once() == {"d1": 42, "d2": 10}
+        assert sim.dials["d1"].value_target == 42
+        assert runner.run_once() == {}
+        cpu.value = 43
+        assert runner.run_once() == {"d1": 43}
+        assert sim.request_counts["dial/list"] == 1
+        assert sim.request_counts["dial/set"] == 3
+
+    def test_failure_does_not_stop_other_dials(self, sim):
+        class Broken(Collector):
+            def read(self):
+                raise OSError("gone")
+
+        runner = CollectorRunner(VUDial(sim.address, sim.port, sim.api_key), {"CPU": Broken(), "d2": Fixed(5)})
+        assert runner.run_once() == {"d2": 5}
+
+    def test_background_thread(self, sim):
+        runner = CollectorRunner(VUDial(sim.address, sim.port, sim.api_key), {"d2": Fixed(9)}, interval=0.01)
+        runner.start()
+        try:
+            for _ in range(200):
+                if sim.dials["d2"].value_target == 9:
+                    break
+                time.sleep(0.01)
+        finally:
+            runner.stop()
+        assert sim.dials["d2"].value_target == 9
+
+    def test_load_config(self, sim, tmp_path):
+        rewrite(tmp_path / "meminfo", "MemTotal: 100 kB\nMemAvailable: 40 kB\n")
+        cfg = tmp_path / "dials.ini"
+        rewrite(cfg, f"[vu1]\nserver = {sim.address}:{sim.port}\napi_key = {sim.api_key}\ninterval = 0.5\n\n"
+                     f"[CPU]\nsource = memory\npath = {tmp_path / 'meminfo'}\n")
+        runner = load_config(str(cfg))
+        assert runner.interval == 0.5
+        assert runner.run_once() == {"d1": 60}
+        runner.stop()
@@ -0,0 +1,87 @@
+"""Tests for validated, reusable dial commands."""
+import pickle
+
+import pytest
+
+from vudials_client.commands import (SetBacklightEasing, SetColor, SetDialEasing, SetName, SetValue,
+                                     color_params, easing_params, from_record, value_params)
+from vudials_client.dispatch import PriorityDispatcher
+from vudials_client.recording import RecordedCommand
+from vudials_client.vudialsclient import VUDial
+
+pytestmark = pytest.mark.vu1(dials=["d1", "d2"])
+
+
+class TestBuilders:
+    def test_params_match_setter_format(self):
+        assert value_params(7) == "&value=7"
+        assert value_params(255) == "&value=255"
+        assert color_params(1, 2, 3) == "&red=1&green=2&blue=3"
+        assert easing_params(50, 5) == "&period=50&step=5"
+
+    def test_repeated_params_are_shared(self):
+        assert value_params(42) is value_params(42)
+        assert color_params(10, 20, 30) is color_params(10, 20, 30)
+        assert easing_params(100, 10) is easing_params(100, 10)
+
+
+class TestCommands:
+    def test_serialized_once(self):
+        cmd = SetColor("d1", 100, "50", 0.0)
+        assert cmd.args == (100, 50, 0)
+        assert cmd.params == "&red=100&green=50&blue=0"
+        assert cmd.as_call() == ("set_dial_color", "d1", 100, 50, 0)
+
+    @pytest.mark.parametrize("make", [
+        lambda: SetValue("d1", 101),
+        lambda: SetValue("d1", -1),
+        lambda: SetColor("d1", 0, 255, 0),
+        lambda: SetDialEasing("d1", 100001, 1),
+        lambda: SetBacklightEasing("d1", 10, 101),
+        lambda: SetName("d1", ""),
+    ])
+    def test_out_of_range_rejected(self, make):
+        with pytest.raises(ValueError):
+            make()
+
+    def test_equality_and_pickle(self):
+        assert SetValue("d1", 5) == SetValue("d1", 5)
+        assert SetValue("d1", 5) != SetValue("d2", 5)
+        assert SetDialEasing("d1", 1, 2) != SetBacklightEasing("d1", 1, 2)
+        assert len({SetValue("d1", 5), SetValue("d1", 5)}) == 1
+        cmd = pickle.loads(pickle.dumps(SetName("d1", "cpu load")))
+        assert cmd == SetName("d1", "cpu load") and cmd.params == "&name=cpu%20load"
+
+    def test_from_record(self):
+        assert from_record(RecordedCommand(0.0, "d1", "backlight", "red=1&green=2&blue=3")) == SetColor("d1", 1, 2, 3)
+        assert from_record(RecordedCommand(0.0, "d1", "name", "name=a%20b")) == SetName("d1", "a b")
+        assert from_record(RecordedCommand(0.0, "d1", "reload", "")) is None
+        with pytest.raises(ValueError):
+            from_record(RecordedCommand(0.0, "d1", "set", ""))
+
+
+class TestSending:
+    def test_send(self, sim):
+        client = VUDial(sim.address, sim.port, sim.api_key)
+        client.send(SetValue("d1", 33))
+        client.send(SetColor("d1", 0, 100, 0))
+        client.send(SetDialEasing("d1", 200, 10))
+        client.send(SetBacklightEasing("d1", 300, 20))
+        client.send(SetName("d1", "Temp"))
+        d = sim.dials["d1"]
+        assert d.value_target == 33
+        assert d.backlight_target == [0, 100, 0]
+        assert (d.dial_easing, d.backlight_easing) == ([200, 10], [300, 20])
+        assert d.name == "Temp"
+        # The remembered colour lets palettes skip a redundant request.
+        client.set_value_with_palette("d1", 0, "traffic")
+        assert sim.request_counts["dial/backlight"] == 1
+
+    def test_submit_command(self, sim):
+        client = VUDial(sim.address, sim.port, sim.api_key)
+        dispatcher = PriorityDispatcher(client)
+        try:
+            dispatcher.submit_command("urgent", SetValue("d2", 12)).result(timeout=5)
+        finally:
+            dispatcher.close()
+        assert sim.dials["d2"].value_target == 12
@@ -0,0 +1,118 @@
+"""Tests for the thread-safe connection pool and per-dial locking."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import responses as resp
+
+from vudials_client.connections import ConnectionPool, DialLocks
+from vudials_client.simulator import VU1Simulator
+from vudials_client.vudialsclient import VUDial, VUAdmin
+
+
+BASE = "http://localhost:5340"
+
+
+class TestConnectionPool:
+    def test_rejects_zero_size(self):
+        with pytest.raises(ValueError):
+            ConnectionPool(0)
+
+    def test_session_per_thread(self):
+        pool = ConnectionPool(4)
+        sessions = []
+        threads = [threading.Thread(target=lambda: sessions.append(pool.session())) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len({id(s) for s in sessions}) == 3
+
+    def test_session_reused_within_thread(self):
+        pool = ConnectionPool(1)
+        assert pool.session() is pool.session()
+
+    @resp.activate
+    def test_get_and_post(self):
+        resp.add(resp.GET, f"{BASE}/a", json={}, status=200)
+        resp.add(resp.POST, f"{BASE}/b", json={}, status=200)
+        pool = ConnectionPool(1)
+        pool.get(f"{BASE}/a")
+        pool.post(f"{BASE}/b")
+        assert [c.request.method for c in resp.calls] == ["GET", "POST"]
+
+    def test_close_drops_sessions(self):
+        pool = ConnectionPool(1)
+        first = pool.session()
+        pool.close()
+        assert pool.session() is not first
+
+
+class TestDialLocks:
+    def test_same_uid_same_lock(self):
+        locks = DialLocks()
+        assert locks("a") is locks("a")
+
+    def test_different_uids_different_locks(self):
+        locks = DialLocks()
+        assert locks("a") is not locks("b")
+
+
+class TestVUDialPooled:
+    @resp.activate
+    def test_pooled_requests_use_pool(self):
+        resp.add(resp.GET, f"{BASE}/api/v0/dial/uid1/set", json={}, status=200)
+        d = VUDial("localhost", 5340, "k", pool_size=2)
+        d.set_dial_value("uid1", 10)
+        assert d.transport.session().adapters["http://"]._pool_maxsize == 1
+        assert "value=10" in resp.calls[0].request.url
+
+    @resp.activate
+    def test_admin_pooled(self):
+        resp.add(resp.GET, f"{BASE}/api/v0/admin/keys/list", json=[], status=200)
+        a = VUAdmin("localhost", 5340, "k", pool_size=1)
+        assert a.list_api_keys().status_code == 200
+        a.close()
+
+    def test_default_is_unpooled(self, vudial):
+        assert vudial.transport is None
+
+
+class TestContentionStress:
+    def test_same_dial_writes_serialized_other_dials_parallel(self):
+        with VU1Simulator(dials=4, latency=0.005) as sim:
+            dial = VUDial(sim.address, sim.port, sim.api_key, pool_size=8)
+            uids = list(sim.dials)
+            active = {uid: 0 for uid in uids}
+            overlap = {uid: 0 for uid in uids}
+            peak_total = [0]
+            guard = threading.Lock()
+            send = dial.send_http_request
+
+            def tracking_send(path_uri, files, *args, **kwargs):
+                uid = path_uri.split("/dial/")[1].split("/")[0]
+                with guard:
+                    active[uid] += 1
+                    overlap[uid] = max(overlap[uid], active[uid])
+                    peak_total[0] = max(peak_total[0], sum(active.values()))
+                try:
+                    return send(path_uri, files, *args, **kwargs)
+                finally:
+                    with guard:
+                        active[uid] -= 1
+
+            dial.send_http_request = tracking_send
+            with ThreadPoolExecutor(8) as ex:
+                list(ex.map(lambda i: dial.set_dial_value(uids[i % 4], i % 101), range(200)))
+            dial.close()
+
+        assert all(v == 1 for v in overlap.values())
+        assert peak_total[0] > 1
+        assert sim.request_counts["dial/set"] == 200
+
+    def test_pool_reuses_connections(self):
+        with VU1Simulator(dials=1) as sim:
+            dial = VUDial(sim.address, sim.port, sim.api_key, pool_size=1)
+            for _ in range(20):
+                dial.set_dial_value("SIM0000", 1)
+            dial.close()
+        assert sim.connections_accepted == 1
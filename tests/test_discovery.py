@@ -0,0 +1,116 @@
+"""Tests for dial auto-discovery."""
+import threading
+import pytest
+
+from vudials_client.discovery import DialWatcher
+from vudials_client.readcache import ReadCache
+from vudials_client.vudialsclient import VUAdmin, VUDial
+
+pytestmark = pytest.mark.vu1(dials=["d1", "d2"])
+
+
+@pytest.fixture
+def client(sim):
+    return VUDial(sim.address, sim.port, sim.api_key)
+
+
+@pytest.fixture
+def admin(sim):
+    return VUAdmin(sim.address, sim.port, sim.admin_key)
+
+
+class TestDialWatcher:
+    def test_first_poll_reports_existing(self, client):
+        seen = []
+        watcher = DialWatcher(client, on_added=lambda uid, info: seen.append((uid, info["uid"])))
+        assert watcher.poll_once() == (["d1", "d2"], [])
+        assert seen == [("d1", "d1"), ("d2", "d2")]
+
+    def test_report_existing_off(self, client):
+        watcher = DialWatcher(client, report_existing=False)
+        assert watcher.poll_once() == ([], [])
+        assert set(watcher.dials) == {"d1", "d2"}
+
+    def test_provisions_new_hardware(self, sim, client, admin):
+        added = []
+        watcher = DialWatcher(client, admin)
+        watcher.on_added(lambda uid, info: added.append(uid))
+        watcher.poll_once()
+        sim.attach_dial("d3")
+        assert watcher.poll_once() == (["d3"], [])
+        assert added == ["d1", "d2", "d3"]
+        assert "d3" in sim.dials
+
+    def test_without_admin_unprovisioned_is_invisible(self, sim, client):
+        watcher = DialWatcher(client)
+        watcher.poll_once()
+        sim.attach_dial("d3")
+        assert watcher.poll_once() == ([], [])
+
+    def test_removed(self, sim, client):
+        removed = []
+        watcher = DialWatcher(client, on_removed=removed.append)
+        watcher.poll_once()
+        sim.detach_dial("d2")
+        assert watcher.poll_once() == ([], ["d2"])
+        assert removed == ["d2"]
+
+    def test_adaptive_interval(self, sim, client, admin):
+        watcher = DialWatcher(client, admin, min_interval=1, max_interval=5, backoff=2)
+        intervals = []
+        for _ in range(5):
+            watcher.poll_once()
+            intervals.append(watcher.interval)
+        assert intervals == [1, 2, 4, 5, 5]
+        sim.attach_dial("d3")
+        watcher.poll_once()
+        assert watcher.interval == 1
+
+    def test_provisioning_invalidates_cached_list(self, sim, admin):
+        client = VUDial(sim.address, sim.port, sim.api_key, read_cache=ReadCache(ttls={"list_dials": 60}))
+        watcher = DialWatcher(client, admin)
+        watcher.poll_once()
+        sim.attach_dial("d3")
+        assert watcher.poll_once() == (["d3"], [])
+
+    def test_provisions_only_when_due(self, sim, client, admin):
+        watcher = DialWatcher(client, admin, min_interval=1, max_interval=8, backoff=2)
+        for _ in range(4):
+            watcher.poll_once()
+        # The polls at intervals 2 and 4, while backing off, skip provisioning.
+        assert sim.request_counts["dial/provision"] == 2
+        assert sim.request_counts["dial/list"] == 4
+
+        sim.attach_dial("d3")
+        assert watcher.poll_once() == (["d3"], [])
+        # A change hints that more hardware may follow.
+        sim.attach_dial("d4")
+        assert watcher.poll_once() == (["d4"], [])
+        assert sim.request_counts["dial/provision"] == 4
+
+    def test_callback_errors_do_not_stop_others(self, client):
+        calls = []
+
+        def broken(uid, info):
+            raise RuntimeError("boom")
+
+        watcher = DialWatcher(client, on_added=broken)
+        watcher.on_added(lambda uid, info: calls.append(uid))
+        watcher.poll_once()
+        assert calls == ["d1", "d2"]
+
+    def test_background_thread(self, sim, client, admin):
+        found = threading.Event()
+        watcher = DialWatcher(client, admin, min_interval=0.01, max_interval=0.05,
+                              on_added=lambda uid, info: uid == "d3" and found.set())
+        watcher.start()
+        try:
+            sim.attach_dial("d3")
+            watcher.wake()
+            assert found.wait(2)
+        finally:
+            watcher.stop()
+
+    def test_invalid_intervals(self, client):
+        with pytest.raises(ValueError):
+            DialWatcher(client, min_interval=5, max_interval=1)
@@ -0,0 +1,172 @@
+"""Tests for the prioritized dispatch queue."""
+import threading
+import time
+import pytest
+
+from vudials_client.dispatch import PriorityDispatcher
+from vudials_client.simulator import VU1Simulator
+from vudials_client.vudialsclient import VUDial
+
+
+class StubClient:
+    """Records calls; the first call blocks until released so a backlog can build up."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+        self.started = threading.Event()
+
+    def _call(self, name, uid, *args):
+        self.calls.append((name, uid) + args)
+        self.started.set()
+        self.release.wait(2)
+        return (name, uid) + args
+
+    def set_dial_value(self, uid, value):
+        return self._call("set_dial_value", uid, value)
+
+    def set_dial_color(self, uid, red, green, blue):
+        return self._call("set_dial_color", uid, red, green, blue)
+
+    def get_dial_info(self, uid):
+        if uid == "missing":
+            raise KeyError(uid)
+        return self._call("get_dial_info", uid)
+
+
+@pytest.fixture
+def stub():
+    return StubClient()
+
+
+def backlog(dispatcher, stub):
+    """Occupy the single worker so later submissions queue up."""
+    first = dispatcher.submit("routine", "set_dial_value", "blocker", 0)
+    assert stub.started.wait(2)
+    return first
+
+
+class TestPriorityDispatcher:
+    def test_returns_result(self, stub):
+        stub.release.set()
+        d = PriorityDispatcher(stub)
+        assert d.submit("routine", "set_dial_value", "a", 5).result(2) == ("set_dial_value", "a", 5)
+        d.close()
+
+    def test_urgent_skips_ahead(self, stub):
+        d = PriorityDispatcher(stub)
+        backlog(d, stub)
+        for i in range(5):
+            d.submit("routine", "set_dial_value", f"r{i}", i)
+        alarm = d.submit("urgent", "set_dial_color", "a", 100, 0, 0)
+        stub.release.set()
+        alarm.result(2)
+        d.close()
+        assert stub.calls[1] == ("set_dial_color", "a", 100, 0, 0)
+
+    def test_routine_collapsed_per_uid(self, stub):
+        d = PriorityDispatcher(stub)
+        backlog(d, stub)
+        futures = [d.submit("routine", "set_dial_value", "a", v) for v in (1, 2, 3)]
+        d.submit("routine", "set_dial_color", "a", 1, 2, 3)
+        stub.release.set()
+        results = [f.result(2) for f in futures]
+        d.close()
+        assert results == [("set_dial_value", "a", 3)] * 3
+        assert stub.calls[1:] == [("set_dial_value", "a", 3), ("set_dial_color", "a", 1, 2, 3)]
+        assert d.stats()["routine"]["collapsed"] == 2
+
+    def test_urgent_not_collapsed(self, stub):
+        d = PriorityDispatcher(stub)
+        backlog(d, stub)
+        d.submit("urgent", "set_dial_value", "a", 1)
+        d.submit("urgent", "set_dial_value", "a", 2)
+        stub.release.set()
+        d.close()
+        assert stub.calls[1:] == [("set_dial_value", "a", 1), ("set_dial_value", "a", 2)]
+
+    def test_stats_depth_and_wait(self, stub):
+        d = PriorityDispatcher(stub)
+        backlog(d, stub)
+        d.submit("routine", "set_dial_value", "a", 1)
+        d.submit("urgent", "set_dial_value", "b", 1)
+        stats = d.stats()
+        assert stats["routine"]["depth"] == 1
+        assert stats["urgent"]["depth"] == 1
+        time.sleep(0.02)
+        stub.release.set()
+        d.close()
+        stats = d.stats()
+        assert stats["urgent"]["depth"] == 0
+        assert stats["urgent"]["wait_max"] >= 0.02
+        assert stats["routine"]["completed"] == 2
+
+    def test_cancelled_while_queued_skipped(self, stub):
+        d = PriorityDispatcher(stub)
+        backlog(d, stub)
+        cancelled = d.submit("urgent", "set_dial_value", "a", 1)
+        kept = d.submit("routine", "set_dial_value", "b", 2)
+        assert cancelled.cancel()
+        stub.release.set()
+        assert kept.result(2) == ("set_dial_value", "b", 2)
+        d.close()
+        assert ("set_dial_value", "a", 1) not in stub.calls
+
+    def test_collapsed_entry_runs_for_remaining_callers(self, stub):
+        d = PriorityDispatcher(stub)
+        backlog(d, stub)
+        first = d.submit("routine", "set_dial_value", "a", 1)
+        second = d.submit("routine", "set_dial_value", "a", 2)
+        first.cancel()
+        stub.release.set()
+        assert second.result(2) == ("set_dial_value", "a", 2)
+        d.close()
+
+    def test_idle_workers_do_not_burn_tokens(self, stub):
+        stub.release.set()
+        d = PriorityDispatcher(stub, calls_per_second=20, workers=4)
+        d.submit("urgent", "set_dial_value", "a", 1).result(2)
+        time.sleep(0.1)
+        start = time.perf_counter()
+        d.submit("urgent", "set_dial_value", "a", 2).result(2)
+        d.close()
+        assert time.perf_counter() - start < 0.04
+
+    def test_failure_sets_exception(self, stub):
+        stub.release.set()
+        d = PriorityDispatcher(stub)
+        with pytest.raises(KeyError):
+            d.submit("routine", "get_dial_info", "missing").result(2)
+        d.close()
+        assert d.stats()["routine"]["failed"] == 1
+
+    def test_unknown_lane_and_method(self, stub):
+        d = PriorityDispatcher(stub)
+        with pytest.raises(ValueError):
+            d.submit("bulk", "set_dial_value", "a", 1)
+        with pytest.raises(ValueError):
+            d.submit("routine", "no_such_method", "a")
+        d.close()
+
+    def test_closed_rejects(self, stub):
+        d = PriorityDispatcher(stub)
+        d.close()
+        with pytest.raises(RuntimeError):
+            d.submit("routine", "set_dial_value", "a", 1)
+
+    def test_shared_rate_limit(self, stub):
+        stub.release.set()
+        d = PriorityDispatcher(stub, calls_per_second=50)
+        start = time.perf_counter()
+        futures = [d.submit("urgent", "set_dial_value", "a", i) for i in range(4)]
+        for f in futures:
+            f.result(2)
+        d.close()
+        assert time.perf_counter() - start >= 3 / 50 * 0.9
+
+    def test_against_simulator(self):
+        with VU1Simulator(dials=["d1"]) as sim:
+            d = PriorityDispatcher(VUDial(sim.address, sim.port, sim.api_key), workers=2)
+            d.submit("urgent", "set_dial_color", "d1", 100, 0, 0).result(2)
+            d.close()
+            assert sim.dials["d1"].backlight_target == [100, 0, 0]
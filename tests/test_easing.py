@@ -0,0 +1,83 @@
+"""Tests for easing auto-tuning."""
+import pytest
+
+from vudials_client.easing import Easing, EasingTuner, compute_easing, MIN_PERIOD_MS
+from vudials_client.vudialsclient import VUDial
+
+pytestmark = pytest.mark.vu1(dials=["d1"])
+
+
+class TestComputeEasing:
+    @pytest.mark.parametrize("rate", [0.2, 1, 2, 5, 10])
+    @pytest.mark.parametrize("smoothness", [0, 0.25, 0.5, 1])
+    def test_full_move_finishes_before_next_update(self, rate, smoothness):
+        e = compute_easing(rate, smoothness)
+        ticks = -(-100 // e.step)
+        assert ticks * e.period <= 1000 / rate or e.period == MIN_PERIOD_MS
+        assert e.period >= MIN_PERIOD_MS
+        assert 1 <= e.step <= 100
+
+    def test_zero_smoothness_jumps(self):
+        assert compute_easing(1, 0) == Easing(MIN_PERIOD_MS, 100)
+        assert compute_easing(20, 0, max_delta=10) == Easing(MIN_PERIOD_MS, 100)
+
+    def test_full_smoothness_uses_small_steps(self):
+        assert compute_easing(0.5, 1) == Easing(20, 1)
+
+    def test_smoother_means_smaller_steps(self):
+        assert compute_easing(1, 0.9).step < compute_easing(1, 0.1).step
+
+    def test_fast_rate_limited_by_min_period(self):
+        assert compute_easing(20, 1) == Easing(25, 50)
+        assert compute_easing(50, 1) == Easing(MIN_PERIOD_MS, 100)
+
+    def test_max_delta(self):
+        e = compute_easing(1, 1, max_delta=10)
+        assert e.step == 1
+        assert e.period == 100
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            compute_easing(0)
+        with pytest.raises(ValueError):
+            compute_easing(1, 1.5)
+
+
+@pytest.fixture
+def tuner(sim):
+    return EasingTuner(VUDial(sim.address, sim.port, sim.api_key))
+
+
+class TestEasingTuner:
+    def test_tune_applies_to_dial_and_backlight(self, sim, tuner):
+        easing = tuner.tune("d1", update_rate=1, smoothness=0.5)
+        d = sim.dials["d1"]
+        assert d.dial_easing == list(easing)
+        assert d.backlight_easing == list(easing)
+
+    def test_reads_easing_once_and_skips_unchanged(self, sim, tuner):
+        tuner.tune("d1", update_rate=1)
+        tuner.tune("d1", update_rate=1)
+        tuner.tune("d1", update_rate=1)
+        assert sim.request_counts == {"dial/easing/get": 1, "dial/easing/dial": 1, "dial/easing/backlight": 1}
+
+    def test_resends_when_changed(self, sim, tuner):
+        tuner.tune("d1", update_rate=1)
+        sim.reset_counts()
+        tuner.tune("d1", update_rate=2)
+        assert sim.request_counts == {"dial/easing/dial": 1, "dial/easing/backlight": 1}
+
+    def test_skips_when_server_already_matches(self, sim, tuner):
+        sim.dials["d1"].dial_easing = [50, 5]
+        assert tuner.set("d1", dial=Easing(50, 5)) == []
+        assert "dial/easing/dial" not in sim.request_counts
+
+    def test_dial_only(self, sim, tuner):
+        tuner.tune("d1", update_rate=1, backlight=False)
+        assert "dial/easing/backlight" not in sim.request_counts
+
+    def test_invalidate_rereads(self, sim, tuner):
+        tuner.current("d1")
+        tuner.invalidate("d1")
+        tuner.current("d1")
+        assert sim.request_counts["dial/easing/get"] == 2
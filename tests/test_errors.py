@@ -0,0 +1,119 @@
+"""Tests for the structured error model and non-raising calls."""
+import pytest
+import requests
+import responses as resp
+
+from vudials_client.errors import (DialNotFound, Result, ResultClient, ServerBusy, ServerError,
+                                   TransportError, Unauthorized, VUError, error_for_response)
+from vudials_client.readcache import ReadCache
+from vudials_client.simulator import VU1Simulator
+from vudials_client.transport import StdlibTransport
+from vudials_client.vudialsclient import VUAdmin, VUDial
+
+pytestmark = pytest.mark.vu1(dials=["d1", "d2"])
+
+BASE = "http://localhost:5340"
+
+
+class TestErrorForResponse:
+    @pytest.mark.parametrize("status,cls", [
+        (401, Unauthorized), (403, Unauthorized), (404, DialNotFound),
+        (429, ServerBusy), (503, ServerBusy), (400, ServerError), (500, ServerError),
+    ])
+    @resp.activate
+    def test_classification(self, status, cls):
+        resp.add(resp.GET, f"{BASE}/x", status=status)
+        err = error_for_response(requests.get(f"{BASE}/x"), uid="d1")
+        assert type(err) is cls
+        assert isinstance(err, VUError)
+        assert err.status_code == status
+        assert err.uid == "d1"
+
+    @resp.activate
+    def test_success_is_none(self):
+        resp.add(resp.GET, f"{BASE}/x", status=204)
+        assert error_for_response(requests.get(f"{BASE}/x")) is None
+
+
+class TestResult:
+    def test_unwrap_raises_error(self):
+        r = Result(None, DialNotFound("404 Not Found", 404, "d9"))
+        assert not r
+        assert not r.ok
+        assert r.status_code is None
+        with pytest.raises(DialNotFound):
+            r.unwrap()
+        with pytest.raises(DialNotFound):
+            r.data
+        assert "DialNotFound" in repr(r)
+
+
+class TestResultClient:
+    def test_partial_failure_does_not_abort(self, sim):
+        safe = ResultClient(VUDial(sim.address, sim.port, sim.api_key))
+        results = safe.map("set_dial_value", ["d1", "missing", "d2"], 40)
+        assert list(results) == ["d1", "missing", "d2"]
+        assert results["d1"].ok and results["d2"].ok
+        assert isinstance(results["missing"].error, DialNotFound)
+        assert results["missing"].error.uid == "missing"
+        assert results["missing"].status_code == 404
+        assert sim.dials["d2"].value_target == 40
+
+    def test_data(self, sim):
+        safe = ResultClient(VUDial(sim.address, sim.port, sim.api_key))
+        assert {d["uid"] for d in safe.list_dials().data} == {"d1", "d2"}
+
+    def test_unauthorized(self, sim):
+        r = ResultClient(VUDial(sim.address, sim.port, "wrong")).get_dial_info("d1")
+        assert isinstance(r.error, Unauthorized)
+
+    def test_simulated_failure(self):
+        with VU1Simulator(dials=["d1"], failure_rate=1.0) as s:
+            r = ResultClient(VUDial(s.address, s.port, s.api_key)).set_dial_value("d1", 5)
+        assert isinstance(r.error, ServerError)
+
+    def test_transport_error(self, sim):
+        host, port = sim.address, sim.port
+        sim.stop()
+        r = ResultClient(VUDial(host, port, "k")).set_dial_value("d1", 5)
+        assert isinstance(r.error, TransportError)
+        assert r.error.uid == "d1"
+
+    def test_transport_error_stdlib(self, sim):
+        host, port = sim.address, sim.port
+        sim.stop()
+        r = ResultClient(VUDial(host, port, "k", transport=StdlibTransport())).list_dials()
+        assert isinstance(r.error, TransportError)
+        assert r.error.uid is None
+
+    def test_local_errors_propagate(self, sim, tmp_path):
+        client = ResultClient(VUDial(sim.address, sim.port, sim.api_key))
+        with pytest.raises(FileNotFoundError):
+            client.set_dial_background("d1", str(tmp_path / "missing.png"))
+
+    def test_admin(self, sim):
+        r = ResultClient(VUAdmin(sim.address, sim.port, "wrong")).list_api_keys()
+        assert isinstance(r.error, Unauthorized)
+
+    def test_original_client_still_raises(self, sim):
+        client = VUDial(sim.address, sim.port, sim.api_key)
+        ResultClient(client)
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.set_dial_value("missing", 1)
+
+    def test_error_responses_not_cached(self, sim):
+        cache = ReadCache(ttls={"get_dial_info": 60})
+        safe = ResultClient(VUDial(sim.address, sim.port, sim.api_key, read_cache=cache))
+        assert isinstance(safe.get_dial_info("later").error, DialNotFound)
+        sim.attach_dial("later")
+        VUAdmin(sim.address, sim.port, sim.admin_key).provision_dials()
+        assert safe.get_dial_info("later").ok
+        assert safe.get_dial_info("later").ok
+        assert cache.stats()["hits"] == 1
+
+    def test_non_transport_errors_propagate(self, sim):
+        safe = ResultClient(VUDial(sim.address, sim.port, sim.api_key))
+        with pytest.raises(TypeError):
+            safe.set_dial_value("d1")
+        with pytest.raises(AttributeError):
+            safe.no_such_method
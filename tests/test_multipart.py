@@ -0,0 +1,108 @@
+"""Tests for the streaming multipart encoder."""
+import email
+import io
+from email import policy
+import responses as resp
+
+from vudials_client.multipart import MultipartEncoder
+from vudials_client.vudialsclient import VUUtil, VUDial
+
+
+BASE = "http://localhost:5340"
+
+
+def parse(encoder: MultipartEncoder, body: bytes):
+    raw = f"Content-Type: {encoder.content_type}\r\n\r\n".encode() + body
+    return list(email.message_from_bytes(raw, policy=policy.HTTP).iter_parts())
+
+
+def drain(encoder: MultipartEncoder, size: int = -1) -> bytes:
+    out = b""
+    while chunk := encoder.read(size):
+        out += chunk
+    return out
+
+
+class TestMultipartEncoder:
+    def test_round_trip(self):
+        enc = MultipartEncoder({"imgfile": ("dial.png", io.BytesIO(b"\x89PNG data"))})
+        parts = parse(enc, drain(enc))
+        assert len(parts) == 1
+        assert parts[0].get_filename() == "dial.png"
+        assert parts[0].get_payload(decode=True) == b"\x89PNG data"
+
+    def test_length_matches_body(self):
+        enc = MultipartEncoder({"imgfile": io.BytesIO(b"x" * 1000)})
+        assert len(enc) == len(drain(enc))
+
+    def test_reads_bounded_by_chunk_size(self):
+        enc = MultipartEncoder({"imgfile": io.BytesIO(b"x" * 10000)}, chunk_size=128)
+        sizes = []
+        while chunk := enc.read():
+            sizes.append(len(chunk))
+        assert max(sizes) <= 128
+        assert sum(sizes) == len(enc)
+
+    def test_small_reads(self):
+        enc = MultipartEncoder({"imgfile": io.BytesIO(b"abcdef")})
+        body = drain(enc, 3)
+        assert parse(enc, body)[0].get_payload(decode=True) == b"abcdef"
+
+    def test_progress_callback(self):
+        seen = []
+        enc = MultipartEncoder({"imgfile": io.BytesIO(b"x" * 500)}, chunk_size=100,
+                               progress=lambda sent, total: seen.append((sent, total)))
+        drain(enc)
+        assert seen[-1] == (len(enc), len(enc))
+        assert [s for s, _ in seen] == sorted(s for s, _ in seen)
+
+    def test_filename_from_file_name(self, tmp_path):
+        path = tmp_path / "bg.png"
+        path.write_bytes(b"img")
+        with open(path, "rb") as f:
+            enc = MultipartEncoder({"imgfile": f})
+            assert parse(enc, drain(enc))[0].get_filename() == "bg.png"
+
+    def test_content_type_in_tuple(self):
+        enc = MultipartEncoder({"imgfile": ("a.png", io.BytesIO(b"x"), "image/png")})
+        assert parse(enc, drain(enc))[0].get_content_type() == "image/png"
+
+    def test_mmap_source(self, tmp_path):
+        path = tmp_path / "bg.png"
+        path.write_bytes(b"0123456789" * 1000)
+        with open(path, "rb") as f:
+            enc = MultipartEncoder({"imgfile": f}, use_mmap=True, chunk_size=256)
+            body = drain(enc)
+        assert parse(enc, body)[0].get_payload(decode=True) == b"0123456789" * 1000
+
+    def test_mmap_falls_back_without_fileno(self):
+        enc = MultipartEncoder({"imgfile": io.BytesIO(b"abc")}, use_mmap=True)
+        assert parse(enc, drain(enc))[0].get_payload(decode=True) == b"abc"
+
+    def test_empty_file(self):
+        enc = MultipartEncoder({"imgfile": io.BytesIO(b"")}, use_mmap=True)
+        assert parse(enc, drain(enc))[0].get_payload(decode=True) == b""
+
+
+class TestStreamingUpload:
+    @resp.activate
+    def test_sends_multipart_content_type(self):
+        resp.add(resp.POST, f"{BASE}/api/v0/dial/abc/image/set", json={}, status=200)
+        VUUtil().send_http_request(f"{BASE}/api/v0/dial/abc/image/set", {"imgfile": io.BytesIO(b"img")})
+        assert resp.calls[0].request.headers["Content-Type"].startswith("multipart/form-data; boundary=")
+
+    @resp.activate
+    def test_sends_content_length(self):
+        resp.add(resp.POST, f"{BASE}/api/v0/dial/abc/image/set", json={}, status=200)
+        VUUtil().send_http_request(f"{BASE}/api/v0/dial/abc/image/set", {"imgfile": io.BytesIO(b"img")})
+        assert int(resp.calls[0].request.headers["Content-Length"]) > 0
+
+    @resp.activate
+    def test_set_dial_background_progress(self, tmp_path):
+        resp.add(resp.POST, f"{BASE}/api/v0/dial/uid1/image/set", json={}, status=200)
+        path = tmp_path / "bg.png"
+        path.write_bytes(b"x" * 100)
+        seen = []
+        VUDial("localhost", 5340, "k").set_dial_background(
+            "uid1", str(path), progress=lambda sent, total: seen.append((sent, total)))
+        assert seen and seen[-1][0] == seen[-1][1]
@@ -0,0 +1,95 @@
+"""Tests for the palette and gradient engine."""
+import pytest
+
+from vudials_client.palette import PALETTES, Palette, get_palette, register_palette
+from vudials_client.vudialsclient import VUDial
+
+pytestmark = pytest.mark.vu1(dials=["d1"])
+
+
+class TestPalette:
+    def test_lut_covers_every_value(self):
+        p = Palette([(0, (0, 0, 0)), (100, (100, 100, 100))])
+        assert len(p.lut) == 101
+        assert p.color(0) == (0, 0, 0)
+        assert p.color(50) == (50, 50, 50)
+        assert p.color(100) == (100, 100, 100)
+
+    def test_clamps_and_truncates_like_set_dial_value(self):
+        p = Palette([(0, (0, 0, 0)), (100, (100, 0, 0))])
+        assert p.color(-5) == (0, 0, 0)
+        assert p.color(250) == (100, 0, 0)
+        assert p.color(10.9) == p.color(10)
+
+    def test_flat_outside_stops(self):
+        p = Palette([(20, (0, 100, 0)), (80, (100, 0, 0))])
+        assert p.color(0) == p.color(20) == (0, 100, 0)
+        assert p.color(100) == (100, 0, 0)
+
+    def test_single_stop(self):
+        assert set(Palette([(50, (10, 20, 30))]).lut) == {(10, 20, 30)}
+
+    def test_stops_sorted(self):
+        assert Palette([(100, (100, 0, 0)), (0, (0, 0, 0))]).color(0) == (0, 0, 0)
+
+    def test_hsv_takes_short_hue_path(self):
+        # Red to magenta passes through pink, not green.
+        p = Palette([(0, (100, 0, 0)), (100, (100, 0, 100))], "hsv")
+        r, g, b = p.color(50)
+        assert r == 100 and g == 0 and 0 < b < 100
+
+    def test_oklab_keeps_midpoint_bright(self):
+        rgb = Palette([(0, (0, 100, 0)), (100, (100, 0, 0))], "rgb").color(50)
+        oklab = Palette([(0, (0, 100, 0)), (100, (100, 0, 0))], "oklab").color(50)
+        assert sum(oklab) > sum(rgb)
+
+    def test_channels_in_range(self):
+        for palette in PALETTES.values():
+            assert all(0 <= c <= 100 for color in palette.lut for c in color)
+
+    def test_traffic(self):
+        p = get_palette("traffic")
+        assert p.color(0) == (0, 100, 0)
+        assert p.color(50) == (100, 100, 0)
+        assert p.color(100) == (100, 0, 0)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            Palette([])
+        with pytest.raises(ValueError):
+            Palette([(0, (0, 0, 0))], "cmyk")
+        with pytest.raises(ValueError):
+            get_palette("nope")
+
+    def test_register(self):
+        p = Palette([(0, (1, 2, 3))])
+        register_palette("custom", p)
+        try:
+            assert get_palette("custom") is p
+        finally:
+            del PALETTES["custom"]
+
+
+class TestSetValueWithPalette:
+    def test_sets_value_and_color(self, sim):
+        client = VUDial(sim.address, sim.port, sim.api_key)
+        client.set_value_with_palette("d1", 100, "traffic")
+        assert sim.dials["d1"].value_target == 100
+        assert sim.dials["d1"].backlight_target == [100, 0, 0]
+
+    def test_skips_unchanged_color(self, sim):
+        client = VUDial(sim.address, sim.port, sim.api_key)
+        flat = Palette([(0, (0, 0, 100)), (10, (0, 0, 100)), (11, (100, 0, 0))])
+        for value in (1, 5, 9, 10):
+            client.set_value_with_palette("d1", value, flat)
+        assert sim.request_counts == {"dial/set": 4, "dial/backlight": 1}
+        client.set_value_with_palette("d1", 50, flat)
+        assert sim.request_counts["dial/backlight"] == 2
+
+    def test_direct_color_call_is_tracked(self, sim):
+        client = VUDial(sim.address, sim.port, sim.api_key)
+        client.set_value_with_palette("d1", 0, "traffic")
+        client.set_dial_color("d1", 1, 1, 1)
+        client.set_value_with_palette("d1", 0, "traffic")
+        assert sim.request_counts["dial/backlight"] == 3
+        assert sim.dials["d1"].backlight_target == [0, 100, 0]
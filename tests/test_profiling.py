@@ -0,0 +1,143 @@
+"""Tests for the opt-in call profiler."""
+import threading
+import time
+
+import pytest
+import requests
+import responses as resp
+
+from vudials_client.profiling import PHASES, Profiler, endpoint_name
+from vudials_client.errors import OutOfScope
+from vudials_client.readcache import ReadCache
+from vudials_client.scope import DialScope
+from vudials_client.transport import StdlibTransport
+from vudials_client.vudialsclient import VUAdmin, VUDial, response_data
+
+pytestmark = pytest.mark.vu1(dials=["d1"])
+
+BASE = "http://localhost:5340"
+
+
+class TestEndpointName:
+    @pytest.mark.parametrize("uri,name", [
+        (f"{BASE}/api/v0/dial/d1/set?key=k&value=1", "dial/set"),
+        (f"{BASE}/api/v0/dial/d1/easing/dial?key=k", "dial/easing/dial"),
+        (f"{BASE}/api/v0/dial/list?key=k", "dial/list"),
+        (f"{BASE}/api/v0/admin/keys/list?admin_key=k", "admin/keys/list"),
+    ])
+    def test_names(self, uri, name):
+        assert endpoint_name(uri) == name
+
+
+class TestProfiler:
+    def test_stdlib_transport_full_split(self, sim):
+        profiler = Profiler()
+        client = VUDial(sim.address, sim.port, sim.api_key, transport=StdlibTransport(), profiler=profiler)
+        for v in range(3):
+            client.set_dial_value("d1", v)
+        response_data(client.get_dial_info("d1"))
+        stats = profiler.stats()
+        assert stats["dial/set"]["calls"] == 3
+        assert set(stats["dial/set"]) == {"calls", "build", "connect", "send", "wait", "read"}
+        assert stats["dial/set"]["wait"]["count"] == 3
+        assert stats["dial/status"]["parse"]["count"] == 1
+        assert all(stats["dial/set"][p]["total"] >= 0 for p in ("build", "connect", "send", "wait", "read"))
+
+    def test_requests_transport(self, sim):
+        profiler = Profiler()
+        client = VUDial(sim.address, sim.port, sim.api_key, profiler=profiler)
+        client.list_dials().json()
+        row = profiler.stats()["dial/list"]
+        assert {"build", "send", "wait", "parse"} <= set(row)
+        assert row["wait"]["total"] > 0
+
+    def test_admin(self, sim):
+        profiler = Profiler()
+        VUAdmin(sim.address, sim.port, sim.admin_key, profiler=profiler).list_api_keys()
+        assert profiler.stats()["admin/keys/list"]["calls"] == 1
+
+    @resp.activate
+    def test_errors_still_recorded(self):
+        resp.add(resp.GET, f"{BASE}/api/v0/dial/nope/set", status=404)
+        profiler = Profiler()
+        client = VUDial("localhost", 5340, "k", profiler=profiler)
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.set_dial_value("nope", 1)
+        assert profiler.stats()["dial/set"]["calls"] == 1
+
+    def test_idle_time_after_cache_hit_not_counted_as_build(self, sim):
+        profiler = Profiler()
+        client = VUDial(sim.address, sim.port, sim.api_key, profiler=profiler,
+                        read_cache=ReadCache(ttls={"get_dial_info": 60}))
+        client.get_dial_info("d1")
+        client.get_dial_info("d1")  # cache hit, never reaches the transport
+        time.sleep(0.3)
+        client.list_dials()
+        assert profiler.stats()["dial/list"]["build"]["max"] < 0.1
+
+    @resp.activate
+    def test_idle_time_after_transport_error_not_counted_as_build(self):
+        resp.add(resp.GET, f"{BASE}/api/v0/dial/d1/set", body=requests.exceptions.ConnectionError("down"))
+        resp.add(resp.GET, f"{BASE}/api/v0/dial/list", json={})
+        profiler = Profiler()
+        client = VUDial("localhost", 5340, "k", profiler=profiler)
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client.set_dial_value("d1", 1)
+        time.sleep(0.3)
+        client.list_dials()
+        assert profiler.stats()["dial/list"]["build"]["max"] < 0.1
+
+    def test_build_starts_with_the_call(self, sim):
+        class SlowScope(DialScope):
+            def check(self, uid):
+                time.sleep(0.2)
+                super().check(uid)
+
+        profiler = Profiler()
+        client = VUDial(sim.address, sim.port, sim.api_key, scope=SlowScope(["d1"]), profiler=profiler)
+        client.set_dial_value("d1", 1)
+        assert profiler.stats()["dial/set"]["build"]["max"] >= 0.2
+
+    def test_scope_rejection_clears_mark(self, sim):
+        profiler = Profiler()
+        client = VUDial(sim.address, sim.port, sim.api_key, scope=DialScope(["d1"]), profiler=profiler)
+        with pytest.raises(OutOfScope):
+            client.set_dial_value("d2", 1)
+        client.send_http_request(client.get_uri(client.server_url, client.key, "dial/list", ""), None)
+        assert "build" not in profiler.stats()["dial/list"]
+
+    def test_lock_wait_is_its_own_phase(self, sim):
+        profiler = Profiler()
+        client = VUDial(sim.address, sim.port, sim.api_key, pool_size=2, profiler=profiler)
+        with client._dial_lock("d1"):
+            t = threading.Thread(target=client.set_dial_value, args=("d1", 1))
+            t.start()
+            time.sleep(0.2)
+        t.join()
+        row = profiler.stats()["dial/set"]
+        assert row["lock"]["max"] >= 0.15
+        assert row["build"]["max"] < 0.1
+        client.close()
+
+    def test_summary_and_folded(self, sim):
+        profiler = Profiler()
+        client = VUDial(sim.address, sim.port, sim.api_key, transport=StdlibTransport(), profiler=profiler)
+        client.set_dial_value("d1", 1)
+        client.list_dials()
+        table = profiler.summary()
+        assert table.splitlines()[0].split()[:2] == ["endpoint", "calls"]
+        assert all(p in table.splitlines()[0] for p in PHASES)
+        assert "dial/set" in table and "dial/list" in table
+        folded = profiler.folded().splitlines()
+        assert "vu1;dial/set;wait" in [line.rsplit(" ", 1)[0] for line in folded]
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in folded)
+
+    def test_reset(self, sim):
+        profiler = Profiler()
+        VUDial(sim.address, sim.port, sim.api_key, profiler=profiler).list_dials()
+        profiler.reset()
+        assert profiler.stats() == {}
+
+    def test_disabled_by_default(self, sim):
+        r = VUDial(sim.address, sim.port, sim.api_key, transport=StdlibTransport()).list_dials()
+        assert "json" not in vars(r)
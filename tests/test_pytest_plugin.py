@@ -0,0 +1,103 @@
+"""Tests for the pytest plugin."""
+import json
+
+import pytest
+# Imported up front so in-process pytester runs, which unload modules they
+# import, share one copy with the lazily importing client.
+import requests  # noqa: F401
+
+from vudials_client.pytest_plugin import CallCounter
+
+pytest_plugins = ["pytester"]
+
+PLUGIN = ("-p", "vudials_client.pytest_plugin")
+BASE = "http://localhost:5340/api/v0"
+
+
+class TestCallCounter:
+    def test_counts_and_redundant_writes(self):
+        counter = CallCounter()
+        for uri in (f"{BASE}/dial/a/set?key=k&value=1", f"{BASE}/dial/a/set?key=k&value=1",
+                    f"{BASE}/dial/b/set?key=k&value=1", f"{BASE}/dial/list?key=k",
+                    f"{BASE}/dial/list?key=k"):
+            counter.record(uri)
+        assert counter.count() == 5
+        assert counter.count("set") == 3
+        assert counter.count("set", uid="a") == 2
+        assert [(c.uid, c.params) for c in counter.redundant_writes()] == [("a", "value=1")]
+        with pytest.raises(AssertionError, match="redundant writes: a/set"):
+            counter.assert_no_redundant_writes()
+        with pytest.raises(AssertionError, match="at most 1 'set' requests"):
+            counter.assert_at_most(1, "set")
+        counter.reset()
+        counter.assert_count(0)
+
+    def test_budget(self):
+        counter = CallCounter()
+        with counter.budget(max_requests=1):
+            counter.record(f"{BASE}/dial/a/set?key=k&value=1")
+        with pytest.raises(AssertionError, match="budget is 1"):
+            with counter.budget(max_requests=1):
+                counter.record(f"{BASE}/dial/a/set?key=k&value=2")
+                counter.record(f"{BASE}/dial/a/set?key=k&value=3")
+        with pytest.raises(AssertionError, match="ms, budget is"):
+            with counter.budget(max_seconds=0):
+                pass
+
+
+class TestFixtures:
+    def test_simulator_client_and_marker(self, pytester):
+        pytester.makepyfile("""
+            import pytest
+
+            @pytest.mark.vu1(dials=["x", "y"])
+            def test_frame(vu1_simulator, vu1_client, vu1_calls, vu1_admin):
+                assert sorted(vu1_simulator.dials) == ["x", "y"]
+                with vu1_calls.budget(max_requests=2):
+                    vu1_client.set_dial_value("x", 10)
+                    vu1_client.set_dial_color("x", 1, 2, 3)
+                vu1_calls.assert_count(1, "set", uid="x")
+                vu1_calls.assert_no_redundant_writes()
+                assert vu1_admin.list_api_keys().status_code == 200
+                assert vu1_simulator.dials["x"].value_target == 10
+        """)
+        pytester.runpytest(*PLUGIN).assert_outcomes(passed=1)
+
+    def test_max_requests_marker(self, pytester):
+        pytester.makepyfile("""
+            import pytest
+
+            @pytest.mark.vu1(dials=["x"], max_requests=1)
+            def test_frame(vu1_client):
+                vu1_client.set_dial_value("x", 1)
+                vu1_client.set_dial_value("x", 2)
+        """)
+        result = pytester.runpytest(*PLUGIN)
+        result.assert_outcomes(passed=1, errors=1)
+        result.stdout.fnmatch_lines(["*sent 2 requests, limit is 1*"])
+
+
+class TestCountingMode:
+    TEST = """
+        import os
+
+        def test_frame(vu1_client):
+            for v in range(int(os.environ.get("FRAME_WRITES", "2"))):
+                vu1_client.set_dial_value("SIM0000", v)
+    """
+
+    def test_update_then_compare(self, pytester, monkeypatch):
+        pytester.makepyfile(self.TEST)
+        counts = pytester.path / "counts.json"
+        pytester.runpytest(*PLUGIN, f"--vu1-counts={counts}", "--vu1-update-counts").assert_outcomes(passed=1)
+        assert json.loads(counts.read_text()) == {"test_update_then_compare.py::test_frame": 2}
+
+        result = pytester.runpytest(*PLUGIN, f"--vu1-counts={counts}")
+        result.assert_outcomes(passed=1)
+        result.stdout.fnmatch_lines(["*VU1 request counts*", "*2  test_update_then_compare.py::test_frame"])
+
+        monkeypatch.setenv("FRAME_WRITES", "4")
+        result = pytester.runpytest(*PLUGIN, f"--vu1-counts={counts}")
+        result.assert_outcomes(passed=1, errors=1)
+        result.stdout.fnmatch_lines(["*sent 4 requests, 2 recorded in*"])
+        pytester.runpytest(*PLUGIN, f"--vu1-counts={counts}", "--vu1-tolerance=1.0").assert_outcomes(passed=1)
@@ -0,0 +1,217 @@
+"""Tests for single-flight coalescing and the read response cache."""
+import asyncio
+import threading
+import time
+import pytest
+import responses as resp
+
+from vudials_client.readcache import SingleFlight, AsyncSingleFlight, ReadCache, AsyncReadCache
+from vudials_client.vudialsclient import VUDial
+
+
+BASE = "http://localhost:5340"
+
+
+# ---------------------------------------------------------------------------
+# SingleFlight
+# ---------------------------------------------------------------------------
+
+
+class TestSingleFlight:
+    def test_returns_result(self):
+        sf = SingleFlight()
+        assert sf.do("k", lambda: 42) == 42
+
+    def test_concurrent_callers_share_one_call(self):
+        sf = SingleFlight()
+        calls = []
+        gate = threading.Event()
+
+        def slow():
+            calls.append(1)
+            gate.wait(2)
+            return "shared"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(sf.do("k", slow))) for _ in range(8)]
+        for t in threads:
+            t.start()
+        while sf.coalesced < 7:
+            time.sleep(0.001)
+        gate.set()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1
+        assert results == ["shared"] * 8
+
+    def test_exception_propagates_to_waiters(self):
+        sf = SingleFlight()
+        gate = threading.Event()
+        errors = []
+
+        def failing():
+            gate.wait(2)
+            raise RuntimeError("boom")
+
+        def worker():
+            try:
+                sf.do("k", failing)
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for t in threads:
+            t.start()
+        while sf.coalesced < 2:
+            time.sleep(0.001)
+        gate.set()
+        for t in threads:
+            t.join()
+        assert len(errors) == 3
+
+    def test_sequential_calls_not_coalesced(self):
+        sf = SingleFlight()
+        calls = []
+        sf.do("k", lambda: calls.append(1))
+        sf.do("k", lambda: calls.append(1))
+        assert len(calls) == 2
+        assert sf.coalesced == 0
+
+
+class TestAsyncSingleFlight:
+    def test_concurrent_awaiters_share_one_call(self):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "shared"
+
+        async def main():
+            sf = AsyncSingleFlight()
+            results = await asyncio.gather(*(sf.do("k", fetch) for _ in range(5)))
+            return sf, results
+
+        sf, results = asyncio.run(main())
+        assert results == ["shared"] * 5
+        assert len(calls) == 1
+        assert sf.coalesced == 4
+
+
+# ---------------------------------------------------------------------------
+# ReadCache / AsyncReadCache
+# ---------------------------------------------------------------------------
+
+
+class TestReadCache:
+    def test_zero_ttl_does_not_cache(self):
+        cache = ReadCache()
+        calls = []
+        cache.get("list_dials", "k", lambda: calls.append(1))
+        cache.get("list_dials", "k", lambda: calls.append(1))
+        assert len(calls) == 2
+        assert cache.stats() == {"hits": 0, "misses": 2, "coalesced": 0}
+
+    def test_ttl_caches(self):
+        cache = ReadCache(ttls={"list_dials": 60})
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return len(calls)
+
+        assert cache.get("list_dials", "k", fetch) == 1
+        assert cache.get("list_dials", "k", fetch) == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_per_endpoint_ttl(self):
+        cache = ReadCache(ttls={"list_dials": 60})
+        calls = []
+        cache.get("get_dial_info", "k", lambda: calls.append(1))
+        cache.get("get_dial_info", "k", lambda: calls.append(1))
+        assert len(calls) == 2
+
+    def test_expiry(self):
+        cache = ReadCache(default_ttl=0.01)
+        calls = []
+        cache.get("list_dials", "k", lambda: calls.append(1))
+        time.sleep(0.02)
+        cache.get("list_dials", "k", lambda: calls.append(1))
+        assert len(calls) == 2
+
+    def test_invalidate(self):
+        cache = ReadCache(default_ttl=60)
+        calls = []
+        cache.get("list_dials", "k", lambda: calls.append(1))
+        cache.invalidate("list_dials")
+        cache.get("list_dials", "k", lambda: calls.append(1))
+        assert len(calls) == 2
+
+    def test_errors_not_cached(self):
+        cache = ReadCache(default_ttl=60)
+
+        def failing():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            cache.get("list_dials", "k", failing)
+        assert cache.get("list_dials", "k", lambda: "ok") == "ok"
+
+
+class TestAsyncReadCache:
+    def test_ttl_caches(self):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            return "v"
+
+        async def main():
+            cache = AsyncReadCache(default_ttl=60)
+            a = await cache.get("list_dials", "k", fetch)
+            b = await cache.get("list_dials", "k", fetch)
+            return cache, a, b
+
+        cache, a, b = asyncio.run(main())
+        assert a == b == "v"
+        assert len(calls) == 1
+        assert cache.stats() == {"hits": 1, "misses": 1, "coalesced": 0}
+
+
+# ---------------------------------------------------------------------------
+# VUDial integration
+# ---------------------------------------------------------------------------
+
+
+class TestVUDialReadCache:
+    @resp.activate
+    def test_cached_list_dials(self):
+        resp.add(resp.GET, f"{BASE}/api/v0/dial/list", json=[], status=200)
+        d = VUDial("localhost", 5340, "k", read_cache=ReadCache(default_ttl=60))
+        d.list_dials()
+        d.list_dials()
+        assert len(resp.calls) == 1
+
+    @resp.activate
+    def test_distinct_uids_not_shared(self):
+        resp.add(resp.GET, f"{BASE}/api/v0/dial/a/status", json={}, status=200)
+        resp.add(resp.GET, f"{BASE}/api/v0/dial/b/status", json={}, status=200)
+        d = VUDial("localhost", 5340, "k", read_cache=ReadCache(default_ttl=60))
+        d.get_dial_info("a")
+        d.get_dial_info("b")
+        assert len(resp.calls) == 2
+
+    @resp.activate
+    def test_writes_bypass_cache(self):
+        resp.add(resp.GET, f"{BASE}/api/v0/dial/a/set", json={}, status=200)
+        d = VUDial("localhost", 5340, "k", read_cache=ReadCache(default_ttl=60))
+        d.set_dial_value("a", 1)
+        d.set_dial_value("a", 1)
+        assert len(resp.calls) == 2
+
+    @resp.activate
+    def test_no_cache_by_default(self, vudial):
+        resp.add(resp.GET, f"{BASE}/api/v0/dial/uid1/easing/get", json={}, status=200)
+        vudial.get_easing_config("uid1")
+        vudial.get_easing_config("uid1")
+        assert len(resp.calls) == 2
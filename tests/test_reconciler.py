@@ -0,0 +1,106 @@
+"""Tests for the desired-state reconciler and rate limiter."""
+import time
+import pytest
+
+from vudials_client.ratelimit import RateLimiter
+from vudials_client.reconciler import DialReconciler
+from vudials_client.simulator import SimulatedDial
+from vudials_client.vudialsclient import VUDial
+
+pytestmark = pytest.mark.vu1(dials=["d1", "d2"])
+
+
+@pytest.fixture
+def reconciler(sim):
+    return DialReconciler(VUDial(sim.address, sim.port, sim.api_key), calls_per_second=0)
+
+
+@pytest.fixture
+def background(tmp_path):
+    path = tmp_path / "bg.png"
+    path.write_bytes(b"background")
+    return str(path)
+
+
+class TestRateLimiter:
+    def test_burst_then_limited(self):
+        limiter = RateLimiter(1, burst=2)
+        assert limiter.try_acquire()
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+        assert limiter.delay() > 0
+
+    def test_disabled(self):
+        limiter = RateLimiter(0)
+        assert all(limiter.try_acquire() for _ in range(100))
+
+    def test_acquire_waits(self):
+        limiter = RateLimiter(50)
+        limiter.acquire()
+        start = time.perf_counter()
+        limiter.acquire()
+        assert time.perf_counter() - start >= 0.015
+
+
+class TestDialReconciler:
+    def test_converges_fresh_dial(self, sim, reconciler, background):
+        reconciler.set_desired("d1", value=40, color=(10, 20, 30), dial_easing=(0, 0),
+                               backlight_easing=(0, 0), name="CPU", background=background)
+        report = reconciler.reconcile_once()
+        assert sorted(report["d1"]) == sorted(
+            ["name", "dial_easing", "backlight_easing", "value", "color", "background"])
+        d = sim.dials["d1"]
+        assert (d.value_target, d.backlight_target, d.name, d.image) == (40, [10, 20, 30], "CPU", b"background")
+
+    def test_no_writes_when_in_sync(self, sim, reconciler, background):
+        reconciler.set_desired("d1", value=40, name="CPU", background=background)
+        reconciler.reconcile_once()
+        sim.reset_counts()
+        assert reconciler.reconcile_once() == {}
+        assert set(sim.request_counts) == {"dial/status", "dial/image/crc"}
+
+    def test_only_drifted_fields_corrected(self, sim, reconciler):
+        reconciler.set_desired("d1", value=40, name="CPU")
+        reconciler.reconcile_once()
+        sim.dials["d1"].set_value(0)
+        assert reconciler.reconcile_once() == {"d1": ["value"]}
+
+    def test_restores_after_reboot(self, sim, reconciler, background):
+        reconciler.set_desired("d1", value=70, color=(100, 0, 0), background=background)
+        reconciler.reconcile_once()
+        sim.dials["d1"] = SimulatedDial("d1")
+        report = reconciler.reconcile_once()
+        assert sorted(report["d1"]) == ["background", "color", "value"]
+        assert sim.dials["d1"].image == b"background"
+
+    def test_failure_isolated_per_dial(self, sim, reconciler):
+        reconciler.set_desired("missing", value=10)
+        reconciler.set_desired("d2", value=10)
+        report = reconciler.reconcile_once()
+        assert report["missing"] == ["error"]
+        assert report["d2"] == ["value"]
+
+    def test_missing_background_file_isolated(self, sim, reconciler, tmp_path):
+        reconciler.set_desired("d1", background=str(tmp_path / "missing.png"))
+        reconciler.set_desired("d2", value=10)
+        report = reconciler.reconcile_once()
+        assert report["d1"] == ["error"]
+        assert report["d2"] == ["value"]
+        assert sim.dials["d2"].value_target == 10
+
+    def test_forget(self, sim, reconciler):
+        reconciler.set_desired("d1", value=10)
+        reconciler.forget("d1")
+        assert reconciler.reconcile_once() == {}
+
+    def test_background_thread(self, sim, reconciler):
+        reconciler.interval = 10
+        reconciler.start()
+        try:
+            reconciler.set_desired("d2", value=55)
+            deadline = time.monotonic() + 2
+            while sim.dials["d2"].value_target != 55 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            reconciler.stop()
+        assert sim.dials["d2"].value_target == 55
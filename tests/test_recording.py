@@ -0,0 +1,114 @@
+"""Tests for command recording and replay."""
+import pytest
+import responses as resp
+
+from vudials_client.recording import (CommandRecorder, RecordedCommand, parse_command, read_log,
+                                      replay, MAGIC, _HEADER)
+from vudials_client.simulator import VU1Simulator
+from vudials_client.vudialsclient import VUDial
+
+
+BASE = "http://localhost:5340"
+
+
+class TestParseCommand:
+    def test_dial_command(self):
+        assert parse_command(f"{BASE}/api/v0/dial/uid1/set?key=secret&value=5") == ("uid1", "set", "value=5")
+
+    def test_list(self):
+        assert parse_command(f"{BASE}/api/v0/dial/list?key=secret") == ("", "list", "")
+
+    def test_nested_endpoint_and_encoded_uid(self):
+        uid, endpoint, _ = parse_command(f"{BASE}/api/v0/dial/a%2Fb/easing/dial?key=k&period=1&step=2")
+        assert (uid, endpoint) == ("a/b", "easing/dial")
+
+
+class TestCommandRecorder:
+    @resp.activate
+    def test_records_commands_without_key(self, tmp_path):
+        resp.add(resp.GET, f"{BASE}/api/v0/dial/uid1/backlight", json={}, status=200)
+        log = tmp_path / "cmds.log"
+        with CommandRecorder(str(log)) as rec:
+            VUDial("localhost", 5340, "secret", recorder=rec).set_dial_color("uid1", 1, 2, 3)
+        cmds = list(read_log(str(log)))
+        assert [(c.uid, c.endpoint, c.params) for c in cmds] == [("uid1", "backlight", "red=1&green=2&blue=3")]
+        assert b"secret" not in log.read_bytes()
+
+    def test_append_only(self, tmp_path):
+        log = str(tmp_path / "cmds.log")
+        with CommandRecorder(log) as rec:
+            rec.record(f"{BASE}/api/v0/dial/a/set?key=k&value=1")
+        with CommandRecorder(log) as rec:
+            rec.record(f"{BASE}/api/v0/dial/a/set?key=k&value=2")
+        assert [c.params for c in read_log(log)] == ["value=1", "value=2"]
+        assert open(log, "rb").read().count(MAGIC) == 1
+
+    def test_truncated_tail_ignored(self, tmp_path):
+        log = tmp_path / "cmds.log"
+        with CommandRecorder(str(log)) as rec:
+            rec.record(f"{BASE}/api/v0/dial/a/set?key=k&value=1")
+            rec.record(f"{BASE}/api/v0/dial/a/set?key=k&value=2")
+        log.write_bytes(log.read_bytes()[:-3])
+        assert len(list(read_log(str(log)))) == 1
+
+    def test_rejects_foreign_file(self, tmp_path):
+        log = tmp_path / "other.log"
+        log.write_bytes(b"not a command log at all")
+        with pytest.raises(ValueError):
+            list(read_log(str(log)))
+
+    def test_upload_records_file_name(self, tmp_path):
+        log = str(tmp_path / "cmds.log")
+        with CommandRecorder(log) as rec:
+            with open(log, "rb") as f:
+                rec.record(f"{BASE}/api/v0/dial/a/image/set?key=k", {"imgfile": f})
+        assert list(read_log(log))[0].params.startswith("imgfile=")
+
+    def test_is_write(self):
+        assert RecordedCommand(0, "a", "set", "").is_write
+        assert not RecordedCommand(0, "a", "status", "").is_write
+
+
+class TestReplay:
+    def record(self, tmp_path, sim):
+        log = str(tmp_path / "cmds.log")
+        with CommandRecorder(log) as rec:
+            d = VUDial(sim.address, sim.port, sim.api_key, recorder=rec)
+            d.set_dial_value("d1", 10)
+            d.get_dial_info("d1")
+            d.set_dial_value("d1", 90)
+        return log
+
+    def test_replay_reproduces_state(self, tmp_path):
+        with VU1Simulator(dials=["d1"]) as sim:
+            log = self.record(tmp_path, sim)
+        with VU1Simulator(dials=["d1"]) as target:
+            stats = replay(log, VUDial(target.address, target.port, target.api_key), speed=0)
+            assert target.dials["d1"].value_target == 90
+            assert target.request_counts == {"dial/set": 2}
+        assert (stats["sent"], stats["skipped"], stats["errors"]) == (2, 1, 0)
+
+    def test_replay_including_reads(self, tmp_path):
+        with VU1Simulator(dials=["d1"]) as sim:
+            log = self.record(tmp_path, sim)
+            sim.reset_counts()
+            stats = replay(log, VUDial(sim.address, sim.port, sim.api_key), speed=0, writes_only=False)
+            assert sim.request_counts == {"dial/set": 2, "dial/status": 1}
+        assert stats["sent"] == 3
+
+    def test_time_scaling(self, tmp_path):
+        log = tmp_path / "cmds.log"
+        log.write_bytes(MAGIC + b"".join(
+            _HEADER.pack(ts, 2, 3, 7) + b"d1" + b"set" + b"value=1" for ts in (100.0, 100.5)))
+        with VU1Simulator(dials=["d1"]) as sim:
+            stats = replay(str(log), VUDial(sim.address, sim.port, sim.api_key), speed=10)
+        assert stats["sent"] == 2
+        assert 0.05 <= stats["elapsed"] < 0.5
+
+    def test_errors_counted(self, tmp_path):
+        log = str(tmp_path / "cmds.log")
+        with CommandRecorder(log) as rec:
+            rec.record(f"{BASE}/api/v0/dial/missing/set?key=k&value=1")
+        with VU1Simulator(dials=["d1"]) as sim:
+            stats = replay(log, VUDial(sim.address, sim.port, sim.api_key), speed=0)
+        assert stats["errors"] == 1
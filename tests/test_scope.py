@@ -0,0 +1,101 @@
+"""Tests for client-side API key dial scopes."""
+import pytest
+
+from vudials_client.errors import OutOfScope, ResultClient, Unauthorized
+from vudials_client.scope import DialScope, parse_dials
+from vudials_client.vudialsclient import VUAdmin, VUDial
+
+pytestmark = pytest.mark.vu1(dials=["d1", "d2", "d3"])
+
+
+@pytest.fixture
+def admin(sim):
+    return VUAdmin(sim.address, sim.port, sim.admin_key)
+
+
+@pytest.fixture
+def tenant_key(admin):
+    return admin.create_api_key("tenant", ["d1", "d2"]).json()["data"]
+
+
+class TestParseDials:
+    @pytest.mark.parametrize("value", [None, "", "*", "all", ["d1", "*"], [], ()])
+    def test_unrestricted(self, value):
+        assert parse_dials(value) is None
+
+    def test_string_and_list(self):
+        assert parse_dials("d1;d2") == {"d1", "d2"}
+        assert parse_dials(["d1", "", "d2"]) == {"d1", "d2"}
+
+
+class TestDialScope:
+    def test_check(self):
+        scope = DialScope(["d1"])
+        assert "d1" in scope
+        assert not scope.allows("d2")
+        scope.check("d1")
+        with pytest.raises(OutOfScope) as exc:
+            scope.check("d2")
+        assert exc.value.uid == "d2"
+        assert isinstance(exc.value, Unauthorized)
+
+    def test_unrestricted(self):
+        assert DialScope().allows("anything")
+
+    def test_refresh_needs_loader(self):
+        with pytest.raises(ValueError):
+            DialScope(["d1"]).refresh()
+
+    def test_from_list_dials(self, sim, tenant_key):
+        scope = DialScope.from_list_dials(VUDial(sim.address, sim.port, tenant_key))
+        assert scope.allowed == {"d1", "d2"}
+
+    def test_from_admin(self, sim, admin, tenant_key):
+        assert DialScope.from_admin(admin, tenant_key).allowed == {"d1", "d2"}
+        assert DialScope.from_admin(admin, sim.api_key).allowed is None
+        assert DialScope.from_admin(admin, "unknown").allowed == frozenset()
+
+
+class TestScopedClient:
+    def test_out_of_scope_not_sent(self, sim, admin, tenant_key):
+        client = VUDial(sim.address, sim.port, tenant_key, scope=DialScope.from_admin(admin, tenant_key))
+        client.set_dial_value("d1", 10)
+        sim.reset_counts()
+        for call in (lambda: client.set_dial_value("d3", 10), lambda: client.get_dial_info("d3"),
+                     lambda: client.set_dial_color("d3", 1, 2, 3)):
+            with pytest.raises(OutOfScope):
+                call()
+        assert sim.request_counts == {}
+
+    def test_update_api_key_refreshes(self, sim, admin, tenant_key):
+        scope = DialScope.from_admin(admin, tenant_key)
+        client = VUDial(sim.address, sim.port, tenant_key, scope=scope)
+        admin.update_api_key("tenant", tenant_key, ["d3"])
+        client.set_dial_value("d3", 10)
+        with pytest.raises(OutOfScope):
+            client.set_dial_value("d1", 10)
+        admin.update_api_key("tenant", tenant_key, ["*"])
+        client.set_dial_value("d1", 10)
+        # The server reads an empty list as every dial, and so does the scope.
+        admin.update_api_key("tenant", tenant_key, ["d3"])
+        admin.update_api_key("tenant", tenant_key, [])
+        client.set_dial_value("d1", 10)
+
+    def test_remove_api_key_revokes(self, sim, admin, tenant_key):
+        scope = DialScope.from_admin(admin, tenant_key)
+        admin.remove_api_key(tenant_key)
+        assert not scope.allows("d1")
+
+    def test_unwatched_scope_not_updated(self, sim, admin, tenant_key):
+        scope = DialScope.from_admin(admin, tenant_key, watch=False)
+        admin.update_api_key("tenant", tenant_key, ["d3"])
+        assert scope.allowed == {"d1", "d2"}
+        scope.refresh()
+        assert scope.allowed == {"d3"}
+
+    def test_result_client(self, sim, tenant_key):
+        client = VUDial(sim.address, sim.port, tenant_key, scope=DialScope(["d1", "d2"]))
+        results = ResultClient(client).map("set_dial_value", ["d1", "d3"], 5)
+        assert results["d1"].ok
+        assert isinstance(results["d3"].error, OutOfScope)
+        assert sim.request_counts["dial/set"] == 1
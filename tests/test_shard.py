@@ -0,0 +1,91 @@
+"""Tests for the process-sharded dispatcher."""
+import pytest
+import requests
+
+from vudials_client.shard import ShardedDispatcher, shard_of
+from vudials_client.simulator import VU1Simulator
+
+pytestmark = pytest.mark.vu1(dials=[f"d{i}" for i in range(8)])
+
+
+class TestShardOf:
+    def test_stable_and_in_range(self):
+        assert shard_of("a", "d1", 4) == shard_of("a", "d1", 4)
+        assert {shard_of("a", f"d{i}", 4) for i in range(100)} == {0, 1, 2, 3}
+
+    def test_server_is_part_of_key(self):
+        assert len({shard_of(f"s{i}", "d1", 16) for i in range(20)}) > 1
+
+
+class TestShardedDispatcher:
+    def test_commands_reach_every_dial(self, sim):
+        with ShardedDispatcher.for_server(sim.address, sim.port, sim.api_key, processes=2, threads=2) as d:
+            futures = d.submit_many([("set_dial_value", uid, 10 + i) for i, uid in enumerate(sim.dials)])
+            responses = [f.result(10) for f in futures]
+            assert all(r.status_code == 200 for r in responses)
+            assert d.submit("get_dial_info", "d3").result(10).json()["data"]["value"] == 13
+        assert [d.value_target for d in sim.dials.values()] == list(range(10, 18))
+        assert d.pending() == 0
+
+    def test_per_dial_order_preserved(self, sim):
+        with ShardedDispatcher.for_server(sim.address, sim.port, sim.api_key, processes=2, threads=4) as d:
+            futures = d.submit_many([("set_dial_value", "d0", v) for v in range(50)])
+            for f in futures:
+                f.result(10)
+        assert sim.dials["d0"].value_target == 49
+
+    def test_errors(self, sim):
+        with ShardedDispatcher.for_server(sim.address, sim.port, sim.api_key, processes=1, threads=1) as d:
+            with pytest.raises(requests.exceptions.HTTPError):
+                d.submit("set_dial_value", "missing", 1).result(10)
+            with pytest.raises(TypeError):
+                d.submit("set_dial_value", "d0").result(10)
+            with pytest.raises(ValueError):
+                d.submit("no_such_method", "d0")
+            with pytest.raises(ValueError):
+                d.submit("set_dial_value", "d0", 1, server="other")
+        with pytest.raises(RuntimeError):
+            d.submit("set_dial_value", "d0", 1)
+
+    def test_invalid_call_in_batch_registers_nothing(self, sim):
+        with ShardedDispatcher.for_server(sim.address, sim.port, sim.api_key, processes=1, threads=1) as d:
+            with pytest.raises(ValueError):
+                d.submit_many([("set_dial_value", "d0", 1), ("no_such_method", "d1")])
+            assert d.pending() == 0
+        assert sim.request_counts.get("dial/set", 0) == 0
+
+    def test_dead_worker_fails_pending(self):
+        with VU1Simulator(dials=["d0"], latency=2) as slow:
+            with ShardedDispatcher.for_server(slow.address, slow.port, slow.api_key, processes=1) as d:
+                future = d.submit("set_dial_value", "d0", 1)
+                d._shards[0].process.kill()
+                with pytest.raises(RuntimeError, match="exited"):
+                    future.result(5)
+                assert d.pending() == 0
+                with pytest.raises(RuntimeError):
+                    d.submit("set_dial_value", "d0", 2)
+
+    def test_cancelled_future_does_not_break_reader(self):
+        with VU1Simulator(dials=["d0"], latency=0.3) as slow:
+            with ShardedDispatcher.for_server(slow.address, slow.port, slow.api_key, processes=1) as d:
+                cancelled = d.submit("set_dial_value", "d0", 1)
+                assert cancelled.cancel()
+                assert d.submit("set_dial_value", "d0", 2).result(10).status_code == 200
+
+    def test_several_servers(self, sim):
+        with VU1Simulator(dials=["d0"]) as other:
+            servers = {
+                "a": {"server_address": sim.address, "server_port": sim.port, "api_key": sim.api_key},
+                "b": {"server_address": other.address, "server_port": other.port, "api_key": other.api_key},
+            }
+            with ShardedDispatcher(servers, processes=2) as d:
+                d.submit("set_dial_value", "d0", 11, server="a").result(10)
+                d.submit("set_dial_value", "d0", 22, server="b").result(10)
+            assert other.dials["d0"].value_target == 22
+        assert sim.dials["d0"].value_target == 11
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            ShardedDispatcher({})
+        with pytest.raises(ValueError):
+            ShardedDispatcher({"a": {}}, processes=0)
@@ -0,0 +1,162 @@
+"""Tests for the local VU1 server simulator, driven through the real client."""
+import threading
+import time
+import pytest
+from requests.exceptions import HTTPError
+
+from vudials_client.simulator import VU1Simulator, SimulatedDial
+from vudials_client.vudialsclient import VUDial, VUAdmin
+
+pytestmark = pytest.mark.vu1(dials=["d1", "d2"])
+
+
+@pytest.fixture
+def dial(sim):
+    return VUDial(sim.address, sim.port, sim.api_key)
+
+
+@pytest.fixture
+def admin(sim):
+    return VUAdmin(sim.address, sim.port, sim.admin_key)
+
+
+class TestSimulatedDial:
+    def test_instant_easing(self):
+        d = SimulatedDial("x")
+        d.dial_easing = [0, 0]
+        d.set_value(80)
+        assert d.value == 80
+
+    def test_easing_moves_gradually(self):
+        d = SimulatedDial("x")
+        d.dial_easing = [10000, 5]
+        d.set_value(80)
+        assert d.value == 0
+        assert d.value_target == 80
+
+
+class TestSimulatorDialApi:
+    def test_list_dials(self, dial):
+        data = dial.list_dials().json()["data"]
+        assert [d["uid"] for d in data] == ["d1", "d2"]
+
+    def test_set_value_and_status(self, sim, dial):
+        dial.set_dial_easing("d1", 0, 0)
+        dial.set_dial_value("d1", 42)
+        info = dial.get_dial_info("d1").json()["data"]
+        assert info["value"] == 42
+        assert info["position"] == 42
+
+    def test_status_reports_target_while_easing(self, dial):
+        dial.set_dial_easing("d1", 10000, 1)
+        dial.set_dial_value("d1", 42)
+        info = dial.get_dial_info("d1").json()["data"]
+        assert info["value"] == 42
+        assert info["position"] == 0
+
+    def test_backlight(self, dial):
+        dial.set_backlight_easing("d1", 0, 0)
+        dial.set_dial_color("d1", 10, 20, 30)
+        assert dial.get_dial_info("d1").json()["data"]["backlight"] == {"red": 10, "green": 20, "blue": 30}
+
+    def test_name(self, dial):
+        dial.set_dial_name("d1", "CPU load")
+        assert dial.get_dial_info("d1").json()["data"]["dial_name"] == "CPU load"
+
+    def test_easing_round_trip(self, dial):
+        dial.set_dial_easing("d1", 100, 3)
+        dial.set_backlight_easing("d1", 200, 4)
+        easing = dial.get_easing_config("d1").json()["data"]
+        assert easing == {"dial_period": 100, "dial_step": 3, "backlight_period": 200, "backlight_step": 4}
+
+    def test_image_and_crc(self, sim, dial, tmp_path):
+        path = tmp_path / "bg.png"
+        path.write_bytes(b"image bytes")
+        before = dial.get_dial_image_crc("d1").json()["data"]
+        dial.set_dial_background("d1", str(path))
+        assert sim.dials["d1"].image == b"image bytes"
+        assert dial.get_dial_image_crc("d1").json()["data"] != before
+
+    def test_unknown_dial_404(self, dial):
+        with pytest.raises(HTTPError) as exc:
+            dial.get_dial_info("missing")
+        assert exc.value.response.status_code == 404
+
+    def test_bad_key_401(self, sim):
+        with pytest.raises(HTTPError) as exc:
+            VUDial(sim.address, sim.port, "wrong").list_dials()
+        assert exc.value.response.status_code == 401
+
+    def test_out_of_range_value_400(self, dial):
+        with pytest.raises(HTTPError) as exc:
+            dial.set_dial_value("d1", 101)
+        assert exc.value.response.status_code == 400
+
+    def test_request_counts(self, sim, dial):
+        dial.set_dial_value("d1", 1)
+        dial.set_dial_value("d2", 1)
+        assert sim.request_counts["dial/set"] == 2
+
+
+class TestSimulatorAdminApi:
+    def test_scoped_key(self, sim, admin):
+        key = admin.create_api_key("tenant", ["d1"]).json()["data"]
+        scoped = VUDial(sim.address, sim.port, key)
+        assert [d["uid"] for d in scoped.list_dials().json()["data"]] == ["d1"]
+        with pytest.raises(HTTPError) as exc:
+            scoped.set_dial_value("d2", 5)
+        assert exc.value.response.status_code == 403
+
+    def test_update_and_remove_key(self, sim, admin):
+        key = admin.create_api_key("tenant", ["d1"]).json()["data"]
+        admin.update_api_key("tenant", key, ["d2"])
+        assert sim.api_keys[key]["dials"] == {"d2"}
+        admin.remove_api_key(key)
+        assert key not in sim.api_keys
+
+    def test_list_keys(self, admin):
+        assert len(admin.list_api_keys().json()["data"]) == 1
+
+    def test_provision(self, sim, admin, dial):
+        sim.attach_dial("d3")
+        assert len(dial.list_dials().json()["data"]) == 2
+        assert admin.provision_dials().json()["data"] == ["d3"]
+        assert len(dial.list_dials().json()["data"]) == 3
+
+    def test_bad_admin_key(self, sim):
+        with pytest.raises(HTTPError):
+            VUAdmin(sim.address, sim.port, "wrong").list_api_keys()
+
+
+class TestSimulatorFaults:
+    def test_latency(self):
+        with VU1Simulator(dials=1, latency=0.05) as sim:
+            start = time.perf_counter()
+            VUDial(sim.address, sim.port, sim.api_key).list_dials()
+            assert time.perf_counter() - start >= 0.05
+
+    def test_failure_rate(self):
+        with VU1Simulator(dials=1, failure_rate=1.0) as sim:
+            with pytest.raises(HTTPError) as exc:
+                VUDial(sim.address, sim.port, sim.api_key).list_dials()
+            assert exc.value.response.status_code == 500
+
+    def test_connection_cap(self):
+        with VU1Simulator(dials=1, latency=0.2, max_connections=1) as sim:
+            statuses = []
+
+            def call():
+                try:
+                    VUDial(sim.address, sim.port, sim.api_key).list_dials()
+                    statuses.append(200)
+                except HTTPError as e:
+                    statuses.append(e.response.status_code)
+
+            threads = [threading.Thread(target=call) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            assert sim.peak_in_flight == 1
+            assert 503 in statuses
+            assert 200 in statuses
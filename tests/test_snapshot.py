@@ -0,0 +1,67 @@
+"""Tests for conditional snapshot polling."""
+import pytest
+import requests
+import responses as resp
+
+from vudials_client.simulator import VU1Simulator
+from vudials_client.snapshot import SnapshotPoller
+from vudials_client.transport import StdlibTransport
+from vudials_client.vudialsclient import VUDial
+
+BASE = "http://localhost:5340/api/v0"
+
+
+class TestContentHash:
+    def test_unchanged_body_not_parsed(self):
+        with VU1Simulator(dials=["d1"]) as sim:
+            client = VUDial(sim.address, sim.port, sim.api_key)
+            poller = SnapshotPoller(client)
+            first = poller.list_dials()
+            assert first.changed and first.data[0]["uid"] == "d1"
+            again = poller.list_dials()
+            assert not again.changed and again.data is first.data
+            client.set_dial_name("d1", "Renamed")
+            renamed = poller.list_dials()
+            assert renamed.changed and renamed.data[0]["dial_name"] == "Renamed"
+            assert poller.stats() == {"changed": 2, "not_modified": 0, "unchanged": 1}
+
+    def test_forget(self):
+        with VU1Simulator(dials=["d1"]) as sim:
+            poller = SnapshotPoller(VUDial(sim.address, sim.port, sim.api_key))
+            poller.get_easing_config("d1")
+            poller.forget()
+            assert poller.get_easing_config("d1").changed
+
+
+class TestConditionalRequests:
+    @pytest.mark.parametrize("transport", [None, StdlibTransport()])
+    def test_etag_not_modified(self, transport):
+        with VU1Simulator(dials=["d1"], etags=True) as sim:
+            poller = SnapshotPoller(VUDial(sim.address, sim.port, sim.api_key, transport=transport))
+            first = poller.get_dial_info("d1")
+            assert first.changed and first.data["uid"] == "d1"
+            second = poller.get_dial_info("d1")
+            assert not second.changed and second.data is first.data
+            assert poller.stats()["not_modified"] == 1
+            assert sim.request_counts["dial/status"] == 2
+
+    @resp.activate
+    def test_last_modified(self):
+        stamp = "Mon, 19 Oct 2026 10:00:00 GMT"
+        url = f"{BASE}/dial/list"
+        resp.add(resp.GET, url, json={"status": "ok", "message": "", "data": []},
+                 headers={"Last-Modified": stamp})
+        resp.add(resp.GET, url, status=304)
+        poller = SnapshotPoller(VUDial("localhost", 5340, "k"))
+        assert poller.list_dials() == ([], True)
+        assert poller.list_dials() == ([], False)
+        assert resp.calls[1].request.headers["If-Modified-Since"] == stamp
+        assert "If-Modified-Since" not in resp.calls[0].request.headers
+
+    @resp.activate
+    def test_errors_raise(self):
+        resp.add(resp.GET, f"{BASE}/dial/nope/status", status=404)
+        client = VUDial("localhost", 5340, "k")
+        client.raise_errors = False
+        with pytest.raises(requests.exceptions.HTTPError):
+            SnapshotPoller(client).get_dial_info("nope")
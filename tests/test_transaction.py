@@ -0,0 +1,92 @@
+"""Tests for transactional dial configuration."""
+import pytest
+
+from vudials_client.transaction import DialTransaction
+from vudials_client.vudialsclient import VUDial
+
+pytestmark = pytest.mark.vu1(dials=["d1", "d2", "d3"])
+
+
+@pytest.fixture
+def client(sim):
+    c = VUDial(sim.address, sim.port, sim.api_key, pool_size=4)
+    yield c
+    c.close()
+
+
+def snapshot(dial):
+    return (dial.name, dial.value_target, list(dial.backlight_target), list(dial.dial_easing),
+            list(dial.backlight_easing))
+
+
+class TestDialTransaction:
+    def test_applies_all_dials(self, sim, client):
+        tx = DialTransaction(client)
+        for i, uid in enumerate(sim.dials):
+            tx.configure(uid, name=f"Dial {i}", color=(10, 20, 30), dial_easing=(50, 5),
+                         backlight_easing=(40, 4), value=i)
+        report = tx.commit()
+        assert report.ok
+        assert not report.failed
+        assert len(report.applied) + len(report.skipped) == 15
+        d = sim.dials["d2"]
+        assert snapshot(d) == ("Dial 1", 1, [10, 20, 30], [50, 5], [40, 4])
+        assert report.timings["total"] >= report.timings["apply"]
+
+    def test_skips_unchanged_settings(self, sim, client):
+        d = sim.dials["d1"]
+        d.name = "Same"
+        report = DialTransaction(client).configure("d1", name="Same", color=(1, 2, 3)).commit()
+        assert report.ok
+        assert report.skipped == [("d1", "name")]
+        assert report.applied == [("d1", "color")]
+        assert "dial/name" not in sim.request_counts
+
+    def test_failure_rolls_back_every_dial(self, sim, client):
+        before = {uid: snapshot(d) for uid, d in sim.dials.items()}
+        tx = DialTransaction(client)
+        tx.configure("d1", name="New", dial_easing=(70, 7), color=(5, 5, 5))
+        tx.configure("d2", name="Broken", color=(150, 0, 0))
+        report = tx.commit()
+        assert not report.ok
+        assert [(uid, field) for uid, field, _ in report.failed] == [("d2", "color")]
+        assert set(report.rolled_back) == set(report.applied)
+        assert not report.rollback_failed
+        assert "rollback" in report.timings
+        assert {uid: snapshot(d) for uid, d in sim.dials.items()} == before
+
+    def test_capture_failure_changes_nothing(self, sim, client):
+        report = DialTransaction(client).configure("d1", name="X").configure("missing", name="Y").commit()
+        assert not report.ok
+        assert report.failed[0][:2] == ("missing", "capture")
+        assert report.applied == []
+        assert sim.dials["d1"].name != "X"
+
+    def test_background_not_restorable(self, sim, client, tmp_path):
+        image = tmp_path / "bg.png"
+        image.write_bytes(b"\x89PNG fake")
+        tx = DialTransaction(client)
+        tx.configure("d1", background=str(image))
+        tx.configure("d2", color=(101, 0, 0))
+        report = tx.commit()
+        assert not report.ok
+        assert report.not_restorable == [("d1", "background")]
+
+    def test_staging_cleared_after_commit(self, sim, client):
+        tx = DialTransaction(client).configure("d1", value=10)
+        tx.commit()
+        sim.reset_counts()
+        assert tx.commit().ok
+        assert sim.request_counts == {}
+
+    def test_steps_for_one_dial_run_in_order(self, sim):
+        sim.latency = 0.02
+        client = VUDial(sim.address, sim.port, sim.api_key)
+        tx = DialTransaction(client).configure("d1", name="N", color=(1, 2, 3), value=5)
+        tx.configure("d2", color=(150, 0, 0))
+        report = tx.commit()
+        assert [step for step in report.applied if step[0] == "d1"] == \
+            [("d1", "name"), ("d1", "color"), ("d1", "value")]
+        assert set(report.rolled_back) == set(report.applied)
+        # One request per dial at a time: d1's steps never overlap each other.
+        assert sim.peak_in_flight <= 2
@@ -0,0 +1,156 @@
+"""Tests for the stdlib-only transport and lazy requests import."""
+import os
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from requests.exceptions import ConnectionError, HTTPError
+
+from vudials_client.simulator import VU1Simulator
+from vudials_client.transport import LiteResponse, StdlibTransport
+from vudials_client.vudialsclient import VUDial, VUAdmin
+
+pytestmark = pytest.mark.vu1(dials=["d1"])
+
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+@pytest.fixture
+def lite_dial(sim):
+    d = VUDial(sim.address, sim.port, sim.api_key, transport=StdlibTransport())
+    yield d
+    d.close()
+
+
+class TestLiteResponse:
+    def test_json_and_text(self):
+        r = LiteResponse("http://x", 200, "OK", {}, b'{"a": 1}')
+        assert r.json() == {"a": 1}
+        assert r.text == '{"a": 1}'
+        assert r.ok
+
+    def test_raise_for_status(self):
+        r = LiteResponse("http://x", 404, "Not Found", {}, b"")
+        with pytest.raises(HTTPError) as exc:
+            r.raise_for_status()
+        assert exc.value.response is r
+        assert "404 Client Error" in str(exc.value)
+
+
+class TestStdlibTransport:
+    def test_get(self, sim, lite_dial):
+        r = lite_dial.list_dials()
+        assert isinstance(r, LiteResponse)
+        assert r.json()["data"][0]["uid"] == "d1"
+
+    def test_keep_alive(self, sim, lite_dial):
+        for value in range(5):
+            lite_dial.set_dial_value("d1", value)
+        assert sim.connections_accepted == 1
+
+    def test_http_error(self, lite_dial):
+        with pytest.raises(HTTPError) as exc:
+            lite_dial.get_dial_info("missing")
+        assert exc.value.response.status_code == 404
+
+    def test_upload_delegates_to_requests(self, sim, lite_dial, tmp_path):
+        path = tmp_path / "bg.png"
+        path.write_bytes(b"img")
+        lite_dial.set_dial_background("d1", str(path))
+        assert sim.dials["d1"].image == b"img"
+
+    def test_admin_post(self, sim):
+        admin = VUAdmin(sim.address, sim.port, sim.admin_key, transport=StdlibTransport())
+        key = admin.create_api_key("tenant", ["d1"]).json()["data"]
+        assert key in sim.api_keys
+
+    def test_connection_refused(self):
+        with VU1Simulator(dials=1) as sim:
+            port = sim.port
+        with pytest.raises(ConnectionError):
+            VUDial("127.0.0.1", port, "k", transport=StdlibTransport()).list_dials()
+
+    def test_reconnects_after_server_closes(self):
+        class OneShotHandler(BaseHTTPRequestHandler):
+            # Claims keep-alive but drops the connection after each response.
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"{}")
+                self.close_connection = True
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), OneShotHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            transport = StdlibTransport()
+            url = f"http://127.0.0.1:{server.server_address[1]}/"
+            assert [transport.get(url).status_code for _ in range(3)] == [200, 200, 200]
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_rejects_https(self):
+        with pytest.raises(ValueError):
+            StdlibTransport().get("https://localhost/")
+
+    def test_pool_size_and_transport_exclusive(self):
+        with pytest.raises(ValueError):
+            VUDial("localhost", 5340, "k", pool_size=2, transport=StdlibTransport())
+
+    def test_truncated_response(self):
+        class TruncatingHandler(BaseHTTPRequestHandler):
+            # Promises a longer body than it sends, then hangs up.
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Length", "100")
+                self.end_headers()
+                self.wfile.write(b'{"status"')
+                self.close_connection = True
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), TruncatingHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            transport = StdlibTransport()
+            with pytest.raises(ConnectionError):
+                transport.get(f"http://127.0.0.1:{server.server_address[1]}/")
+            assert transport._local.conns == {}
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestLazyImport:
+    def run(self, code: str) -> str:
+        env = dict(os.environ, PYTHONPATH=SRC)
+        return subprocess.run([sys.executable, "-c", code], env=env, capture_output=True,
+                              text=True, check=True).stdout.strip()
+
+    @pytest.mark.parametrize("module", ["vudialsclient", "reconciler", "transaction"])
+    def test_import_does_not_load_requests(self, module):
+        out = self.run(f"import sys; from vudials_client import {module}; print('requests' in sys.modules)")
+        assert out == "False"
+
+    def test_requests_attribute_still_available(self):
+        out = self.run("from vudials_client import vudialsclient; print(vudialsclient.requests.__name__)")
+        assert out == "requests"
+
+    def test_lite_get_does_not_load_requests(self, sim):
+        out = self.run(
+            "import sys\n"
+            "from vudials_client.vudialsclient import VUDial\n"
+            "from vudials_client.transport import StdlibTransport\n"
+            f"VUDial('{sim.address}', {sim.port}, '{sim.api_key}', transport=StdlibTransport()).set_dial_value('d1', 5)\n"
+            "print('requests' in sys.modules)")
+        assert out == "False"
+        assert sim.dials["d1"].value_target == 5
@@ -6,7 +6,7 @@ import responses as resp
 from requests.exceptions import HTTPError
 from unittest.mock import patch
 
-from vudials_client.vudialsclient import VUUtil, VUAdminUtil, VUDial, VUAdmin
+from vudials_client.vudialsclient import VUUtil, VUAdminUtil, VUDial, VUAdmin, response_data
 
 
 BASE = "http://localhost:5340"
@@ -117,6 +117,18 @@ class TestVUUtilSendHttpRequest:
         assert r.status_code == 200
 
 
+class TestResponseData:
+    @resp.activate
+    def test_unwraps_data_envelope(self):
+        resp.add(resp.GET, f"{BASE}/test", json={"status": "ok", "message": "", "data": [1]}, status=200)
+        assert response_data(VUUtil().send_http_request(f"{BASE}/test", None)) == [1]
+
+    @resp.activate
+    def test_bare_body_unchanged(self):
+        resp.add(resp.GET, f"{BASE}/test", json=[{"uid": "a"}], status=200)
+        assert response_data(VUUtil().send_http_request(f"{BASE}/test", None)) == [{"uid": "a"}]
+
+
 # ---------------------------------------------------------------------------
 # VUAdminUtil
 # ---------------------------------------------------------------------------
@@ -0,0 +1,84 @@
+"""Tests for client warm-up."""
+import logging
+import pytest
+import requests
+
+from vudials_client.readcache import ReadCache
+from vudials_client.transport import StdlibTransport
+from vudials_client.vudialsclient import VUAdmin, VUDial
+
+pytestmark = pytest.mark.vu1(dials=["d1", "d2"])
+
+
+class TestWarmUp:
+    def test_disabled_by_default(self, sim):
+        assert VUDial(sim.address, sim.port, sim.api_key).warmup is None
+        assert sim.request_counts == {}
+
+    def test_blocking(self, sim):
+        client = VUDial(sim.address, sim.port, sim.api_key, warm_up=True)
+        w = client.warmup
+        assert w.ok
+        assert w.dials == ["d1", "d2"]
+        assert set(w.timings) == {"import", "resolve", "check", "total"}
+        assert w.timings["total"] >= w.timings["check"]
+        assert sim.request_counts == {"dial/list": 1}
+
+    def test_connection_reused(self, sim):
+        client = VUDial(sim.address, sim.port, sim.api_key, pool_size=2, warm_up=True)
+        client.set_dial_value("d1", 10)
+        assert sim.connections_accepted == 1
+        client.close()
+
+    def test_default_client_connects_again(self, sim):
+        client = VUDial(sim.address, sim.port, sim.api_key, warm_up=True)
+        client.set_dial_value("d1", 10)
+        assert sim.connections_accepted == 2
+
+    def test_background_pool_connects_on_caller(self, sim):
+        client = VUDial(sim.address, sim.port, sim.api_key, pool_size=2, warm_up="background")
+        assert client.warmup.wait(2)
+        client.set_dial_value("d1", 10)
+        assert sim.connections_accepted == 2
+        client.close()
+
+    def test_stdlib_transport_skips_import(self, sim):
+        client = VUDial(sim.address, sim.port, sim.api_key, transport=StdlibTransport(), warm_up=True)
+        assert "import" not in client.warmup.timings
+        client.set_dial_value("d1", 10)
+        assert sim.connections_accepted == 1
+
+    def test_primes_read_cache(self, sim):
+        cache = ReadCache(ttls={"list_dials": 60})
+        client = VUDial(sim.address, sim.port, sim.api_key, read_cache=cache, warm_up=True)
+        client.list_dials()
+        assert cache.stats()["hits"] == 1
+        assert sim.request_counts == {"dial/list": 1}
+
+    def test_bad_key_raises(self, sim):
+        with pytest.raises(requests.exceptions.HTTPError):
+            VUDial(sim.address, sim.port, "wrong", warm_up=True)
+
+    def test_background(self, sim):
+        client = VUDial(sim.address, sim.port, sim.api_key, warm_up="background")
+        assert client.warmup.wait(2)
+        assert client.warmup.ok
+        assert client.warmup.dials == ["d1", "d2"]
+
+    def test_background_failure_logged(self, sim, caplog):
+        with caplog.at_level(logging.WARNING, logger="vudials_client.warmup"):
+            client = VUDial(sim.address, sim.port, "wrong", warm_up="background")
+            assert client.warmup.wait(2)
+        assert not client.warmup.ok
+        assert isinstance(client.warmup.error, requests.exceptions.HTTPError)
+        assert "warm-up" in caplog.text
+
+    def test_admin(self, sim):
+        admin = VUAdmin(sim.address, sim.port, sim.admin_key, warm_up=True)
+        assert admin.warmup.ok
+        assert admin.warmup.dials is None
+        assert sim.request_counts == {"admin/keys/list": 1}
+
+    def test_explicit_call(self, sim):
+        client = VUDial(sim.address, sim.port, sim.api_key)
+        assert client.warm_up().ok